@@ -0,0 +1 @@
+"""Prompt processing package: markdown conversion, filtering, and LLM extraction."""
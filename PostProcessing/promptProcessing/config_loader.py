@@ -10,7 +10,9 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 # Add project root to path for shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from shared import (
     deep_merge,
     find_config_file as shared_find_config_file,
@@ -4,8 +4,18 @@ Filter Prompt Templates
 Prompts for LLM-based filtering of posts to identify interview-related content.
 """
 
+import sys
+from pathlib import Path
 from typing import List, Dict, Any
 
+# Add project root to path for shared imports (once; repeated position-0
+# inserts slow every later import in the process)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared import get_post_title, get_main_content
+
 
 FILTER_SYSTEM_PROMPT = """你是一个帖子分类助手。你的任务是快速判断帖子是否与面试相关。
 
@@ -94,13 +104,6 @@ def prepare_post_summary(
     Returns:
         Dictionary with 'index', 'title', 'content_preview'
     """
-    # Import here to avoid circular imports
-    import sys
-    from pathlib import Path
-    PROJECT_ROOT = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(PROJECT_ROOT))
-    from shared import get_post_title, get_main_content
-
     title = get_post_title(post) or "(无标题)"
     content = get_main_content(post) or ""
 
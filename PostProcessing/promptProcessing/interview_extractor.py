@@ -4,6 +4,8 @@ Interview Information Extractor
 Uses Claude API to extract structured interview information from forum posts.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import re
@@ -24,8 +26,19 @@ except ImportError:
     openai = None
     print("Warning: openai package not installed. Run: pip install openai")
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # streaming ingestion falls back to a full json.load
+
 from markdown_converter import MarkdownConverter, PostGrouper
-from prompt_templates import SYSTEM_PROMPT, get_extraction_prompt
+from shared.json_compat import loads as json_loads, dumps_indent as json_dumps_indent
+from prompt_templates import (
+    FULL_SYSTEM_PROMPT,
+    get_batched_extraction_prompt,
+    get_extraction_prompt,
+    get_system_blocks,
+)
 from config_loader import get_config, Config
 
 
@@ -35,6 +48,9 @@ class ExtractionConfig:
 
     # Grouping settings
     posts_per_group: int = 3
+    # When set, PostGrouper packs groups by token estimate up to this
+    # budget instead of a fixed post count
+    max_input_tokens: Optional[int] = None
 
     # API settings
     provider: str = "anthropic"  # "anthropic" or "openai"
@@ -51,8 +67,20 @@ class ExtractionConfig:
     output_dir: str = "output"
     save_intermediate: bool = True
 
-    # Rate limiting
-    delay_between_calls: float = 1.0  # seconds
+    # Rate limiting / concurrency
+    delay_between_calls: float = 1.0  # seconds (legacy; async path uses the buckets below)
+    max_concurrency: int = 4
+    requests_per_minute: int = 50
+    tokens_per_minute: int = 40000
+    # Pack this many groups' markdown into a single API request (1 = off).
+    # Same token cost, 1/K the request count — for RPM-bound runs.
+    prompts_per_request: int = 1
+
+    # Response cache: identical (prompts, model, temperature, max_tokens)
+    # reuse the response from disk instead of re-calling the API.
+    # Lives outside output_dir so it survives timestamped-dir churn.
+    use_cache: bool = True
+    cache_dir: str = "~/.cache/interview-extractor"
 
     @classmethod
     def from_config(cls, config: Config) -> "ExtractionConfig":
@@ -81,6 +109,7 @@ class ExtractionResult:
     cross_post_insights: Dict[str, Any]
     raw_response: str = ""
     tokens_used: int = 0
+    cache_read_tokens: int = 0
     processing_time: float = 0.0
 
 
@@ -116,6 +145,48 @@ class BatchExtractionResult:
         }
 
 
+class _AsyncRateLimiter:
+    """
+    Leaky-bucket limiter for requests-per-minute and tokens-per-minute.
+
+    Both buckets refill continuously at rate/60 per second; acquire() blocks
+    until one request slot and the estimated token budget are available.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_request_capacity = float(requests_per_minute)
+        self.available_token_capacity = float(tokens_per_minute)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.available_request_capacity = min(
+            self.available_request_capacity + self.requests_per_minute * elapsed / 60.0,
+            float(self.requests_per_minute),
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + self.tokens_per_minute * elapsed / 60.0,
+            float(self.tokens_per_minute),
+        )
+
+    async def acquire(self, estimated_tokens: int):
+        """Block until one request and estimated_tokens of budget are available."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if (self.available_request_capacity >= 1
+                        and self.available_token_capacity >= estimated_tokens):
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= estimated_tokens
+                    return
+            await asyncio.sleep(0.1)
+
+
 class InterviewExtractor:
     """
     Extracts interview information from forum posts using LLM APIs (Anthropic Claude or OpenAI).
@@ -170,75 +241,139 @@ class InterviewExtractor:
 
         if self.provider == "anthropic":
             self.client = anthropic.Anthropic(**client_kwargs)
+            self.async_client = anthropic.AsyncAnthropic(**client_kwargs)
         else:  # openai
             self.client = openai.OpenAI(**client_kwargs)
+            self.async_client = openai.AsyncOpenAI(**client_kwargs)
 
         # Initialize helpers
         self.converter = MarkdownConverter(min_content_length=self.config.min_content_length)
-        self.grouper = PostGrouper(group_size=self.config.posts_per_group)
+        self.grouper = PostGrouper(
+            group_size=self.config.posts_per_group,
+            max_input_tokens=self.config.max_input_tokens,
+        )
 
         # Ensure output directory exists
         os.makedirs(self.config.output_dir, exist_ok=True)
         if self.config.save_intermediate:
             os.makedirs(os.path.join(self.config.output_dir, "intermediate"), exist_ok=True)
 
-    def _call_llm_api(self, system_prompt: str, user_prompt: str) -> tuple[str, int, int]:
+    def _build_request_kwargs(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """
-        Call LLM API (Anthropic or OpenAI) with unified interface.
+        Build provider-specific kwargs for a single extraction request.
 
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
 
         Returns:
-            Tuple of (response_text, input_tokens, output_tokens)
+            Keyword arguments for the provider's create() call
         """
         if self.provider == "anthropic":
-            response = self.client.messages.create(
-                model=self.config.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                system=system_prompt,
-                messages=[
+            # Send the invariant system text as a cache_control block so the
+            # API reuses the tokenized prefix across groups instead of
+            # re-processing it on every call.
+            return {
+                "model": self.config.model,
+                "max_tokens": self.config.max_tokens,
+                "temperature": self.config.temperature,
+                "system": [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+                "messages": [
                     {"role": "user", "content": user_prompt}
-                ]
+                ],
+            }
+
+        # openai
+        # Check if this is an o1 model (doesn't support system messages or temperature)
+        if self.config.model.startswith("o1"):
+            # o1 models: no system message, no temperature
+            return {
+                "model": self.config.model,
+                "messages": [
+                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
+                ],
+                "max_completion_tokens": self.config.max_tokens,
+            }
+
+        # Regular OpenAI models: support system messages and temperature
+        return {
+            "model": self.config.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+        }
+
+    def _parse_llm_response(self, response) -> tuple[str, int, int, int]:
+        """Unpack a provider response into (text, input, output, cache_read) tokens."""
+        if self.provider == "anthropic":
+            return (
+                response.content[0].text,
+                response.usage.input_tokens,
+                response.usage.output_tokens,
+                getattr(response.usage, "cache_read_input_tokens", 0) or 0,
             )
-            response_text = response.content[0].text
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
+        return (
+            response.choices[0].message.content,
+            response.usage.prompt_tokens,
+            response.usage.completion_tokens,
+            0,
+        )
 
-        else:  # openai
-            # Check if this is an o1 model (doesn't support system messages or temperature)
-            is_o1_model = self.config.model.startswith("o1")
+    def _call_llm_api(self, system_prompt: str, user_prompt: str) -> tuple[str, int, int, int]:
+        """
+        Call LLM API (Anthropic or OpenAI) with unified interface.
 
-            if is_o1_model:
-                # o1 models: no system message, no temperature
-                messages = [
-                    {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                ]
-                response = self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=messages,
-                    max_completion_tokens=self.config.max_tokens
-                )
-            else:
-                # Regular OpenAI models: support system messages and temperature
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
-                response = self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=messages,
-                    max_tokens=self.config.max_tokens,
-                    temperature=self.config.temperature
-                )
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+
+        Returns:
+            Tuple of (response_text, input_tokens, output_tokens, cache_read_tokens)
+        """
+        kwargs = self._build_request_kwargs(system_prompt, user_prompt)
+        if self.provider == "anthropic":
+            response = self.client.messages.create(**kwargs)
+        else:
+            response = self.client.chat.completions.create(**kwargs)
+        return self._parse_llm_response(response)
 
-            response_text = response.choices[0].message.content
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
+    async def _call_llm_api_async(self, system_prompt: str, user_prompt: str) -> tuple[str, int, int, int]:
+        """Async variant of _call_llm_api, using the provider's async client."""
+        kwargs = self._build_request_kwargs(system_prompt, user_prompt)
+        if self.provider == "anthropic":
+            response = await self.async_client.messages.create(**kwargs)
+        else:
+            response = await self.async_client.chat.completions.create(**kwargs)
+        return self._parse_llm_response(response)
 
-        return response_text, input_tokens, output_tokens
+    def warm_cache(self):
+        """
+        Populate the prompt cache with a tiny request before the real run.
+
+        The first request of a run otherwise pays the full uncached
+        system-prompt cost; warming it up front means every extraction
+        request reads the cached prefix. Anthropic-only (the cache_control
+        block is Anthropic API surface); failures are non-fatal.
+        """
+        if self.provider != "anthropic":
+            return
+        try:
+            kwargs = self._build_request_kwargs(FULL_SYSTEM_PROMPT, ".")
+            kwargs["max_tokens"] = 1
+            print("Warming prompt cache...")
+            self.client.messages.create(**kwargs)
+            print("Prompt cache warmed")
+        except Exception as e:
+            print(f"Warning: prompt cache warm-up failed: {e}")
 
     def _extract_json_from_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -259,8 +394,8 @@ class InterviewExtractor:
             json_str = response_text.strip()
 
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            return json_loads(json_str)
+        except ValueError as e:
             print(f"Warning: Failed to parse JSON: {e}")
             print(f"Response preview: {response_text[:500]}...")
             return {
@@ -270,21 +405,15 @@ class InterviewExtractor:
                 "raw_response": response_text
             }
 
-    def extract_from_group(self, posts: List[Dict[str, Any]], group_index: int) -> ExtractionResult:
+    def _prepare_group(self, posts: List[Dict[str, Any]], group_index: int) -> Optional[str]:
         """
-        Extract information from a group of posts.
+        Convert a group to markdown.
 
-        Args:
-            posts: List of post dictionaries
-            group_index: Index of this group
+        Saves the intermediate markdown if configured.
 
         Returns:
-            ExtractionResult object
+            Markdown string, or None if the group has no valid posts
         """
-        start_time = time.time()
-        print(f"  [Group {group_index}] Starting processing...")
-
-        # Convert to markdown
         print(f"  [Group {group_index}] Converting {len(posts)} posts to markdown...")
         convert_start = time.time()
         markdown_content = self.converter.convert_group(posts, group_index)
@@ -293,15 +422,7 @@ class InterviewExtractor:
 
         if not markdown_content:
             print(f"  [Group {group_index}] No valid posts after filtering")
-            return ExtractionResult(
-                group_index=group_index,
-                posts=[],
-                cross_post_insights={},
-                processing_time=time.time() - start_time
-            )
-
-        # Generate prompt
-        user_prompt = get_extraction_prompt(markdown_content)
+            return None
 
         # Save intermediate markdown if configured
         if self.config.save_intermediate:
@@ -314,82 +435,276 @@ class InterviewExtractor:
                 f.write(markdown_content)
             print(f"  [Group {group_index}] Saved input markdown: {md_path}")
 
-        # Call LLM API
+        return markdown_content
+
+    def _finish_group(
+        self,
+        group_index: int,
+        user_prompt: str,
+        response_text: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int,
+        api_time: float,
+        start_time: float,
+    ) -> ExtractionResult:
+        """Parse an API response, save intermediates, and build the result."""
+        tokens_used = input_tokens + output_tokens
+        print(f"  [Group {group_index}] API call completed ({api_time:.2f}s)")
+        print(f"  [Group {group_index}] Tokens used: {input_tokens} in + {output_tokens} out = {tokens_used} total")
+        if cache_read_tokens:
+            print(f"  [Group {group_index}] Prompt cache hit: {cache_read_tokens} tokens read from cache")
+
+        # Parse response
+        print(f"  [Group {group_index}] Parsing response...")
+        parse_start = time.time()
+        extracted = self._extract_json_from_response(response_text)
+        parse_time = time.time() - parse_start
+        print(f"  [Group {group_index}] Parsed {len(extracted.get('posts', []))} posts ({parse_time:.2f}s)")
+
+        # Save intermediate request/response if configured
+        if self.config.save_intermediate:
+            # Save combined request and response
+            combined_path = os.path.join(
+                self.config.output_dir,
+                "intermediate",
+                f"group_{group_index}_request_response.json"
+            )
+            combined_data = {
+                "request": {
+                    "system": get_system_blocks(),
+                    "user_prompt": user_prompt,
+                    "model": self.config.model,
+                    "temperature": self.config.temperature,
+                    "max_tokens": self.config.max_tokens
+                },
+                "response": {
+                    "raw": response_text,
+                    "parsed": extracted,
+                    "tokens": {
+                        "input": input_tokens,
+                        "output": output_tokens,
+                        "cache_read": cache_read_tokens,
+                        "total": tokens_used
+                    }
+                },
+                "timing": {
+                    "api_call_seconds": api_time,
+                    "parse_seconds": parse_time
+                }
+            }
+            with open(combined_path, "wb") as f:
+                f.write(json_dumps_indent(combined_data))
+            print(f"  [Group {group_index}] Saved request/response: {combined_path}")
+
+        total_time = time.time() - start_time
+        result = ExtractionResult(
+            group_index=group_index,
+            posts=extracted.get("posts", []),
+            cross_post_insights=extracted.get("cross_post_insights", {}),
+            raw_response=response_text,
+            tokens_used=tokens_used,
+            cache_read_tokens=cache_read_tokens,
+            processing_time=total_time
+        )
+        print(f"  [Group {group_index}] ✓ Complete: {len(result.posts)} posts extracted, {tokens_used} tokens, {total_time:.2f}s total")
+        print()
+        return result
+
+    def _cache_path(self, user_prompt: str) -> str:
+        """Content-addressed cache path for a request's response."""
+        key_material = "\x00".join([
+            FULL_SYSTEM_PROMPT,
+            user_prompt,
+            self.config.model,
+            str(self.config.temperature),
+            str(self.config.max_tokens),
+        ])
+        cache_key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+        cache_dir = os.path.expanduser(self.config.cache_dir)
+        return os.path.join(cache_dir, cache_key[:2], cache_key[2:] + ".json")
+
+    def _cache_lookup(self, user_prompt: str) -> Optional[tuple[str, int, int, int]]:
+        """Return a cached (response_text, in, out, cache_read) tuple, or None."""
+        if not self.config.use_cache:
+            return None
         try:
-            print(f"  [Group {group_index}] Calling {self.provider.upper()} API (model: {self.config.model})...")
-            api_start = time.time()
-            response_text, input_tokens, output_tokens = self._call_llm_api(SYSTEM_PROMPT, user_prompt)
-            api_time = time.time() - api_start
+            with open(self._cache_path(user_prompt), "rb") as f:
+                cached = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return (
+            cached["response_text"],
+            cached.get("input_tokens", 0),
+            cached.get("output_tokens", 0),
+            cached.get("cache_read_tokens", 0),
+        )
 
-            tokens_used = input_tokens + output_tokens
-            print(f"  [Group {group_index}] API call completed ({api_time:.2f}s)")
-            print(f"  [Group {group_index}] Tokens used: {input_tokens} in + {output_tokens} out = {tokens_used} total")
-
-            # Parse response
-            print(f"  [Group {group_index}] Parsing response...")
-            parse_start = time.time()
-            extracted = self._extract_json_from_response(response_text)
-            parse_time = time.time() - parse_start
-            print(f"  [Group {group_index}] Parsed {len(extracted.get('posts', []))} posts ({parse_time:.2f}s)")
-
-            # Save intermediate request/response if configured
-            if self.config.save_intermediate:
-                # Save combined request and response
-                combined_path = os.path.join(
-                    self.config.output_dir,
-                    "intermediate",
-                    f"group_{group_index}_request_response.json"
-                )
-                combined_data = {
-                    "request": {
-                        "system_prompt": SYSTEM_PROMPT,
-                        "user_prompt": user_prompt,
+    def _cache_store(
+        self,
+        user_prompt: str,
+        response_text: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int,
+    ):
+        """Persist a response to the cache, writing atomically via os.replace."""
+        if not self.config.use_cache:
+            return
+        path = self._cache_path(user_prompt)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "response_text": response_text,
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "cache_read_tokens": cache_read_tokens,
                         "model": self.config.model,
-                        "temperature": self.config.temperature,
-                        "max_tokens": self.config.max_tokens
-                    },
-                    "response": {
-                        "raw": response_text,
-                        "parsed": extracted,
-                        "tokens": {
-                            "input": input_tokens,
-                            "output": output_tokens,
-                            "total": tokens_used
-                        }
+                        "cached_at": datetime.now().isoformat(),
                     },
-                    "timing": {
-                        "api_call_seconds": api_time,
-                        "parse_seconds": parse_time
-                    }
-                }
-                with open(combined_path, "w", encoding="utf-8") as f:
-                    json.dump(combined_data, f, ensure_ascii=False, indent=2)
-                print(f"  [Group {group_index}] Saved request/response: {combined_path}")
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  Warning: failed to write response cache: {e}")
 
-            total_time = time.time() - start_time
-            result = ExtractionResult(
+    def _error_result(self, group_index: int, error: Exception, start_time: float) -> ExtractionResult:
+        """Build an ExtractionResult for a failed group."""
+        total_time = time.time() - start_time
+        print(f"  [Group {group_index}] ✗ Error: {error} ({total_time:.2f}s)")
+        print()
+        return ExtractionResult(
+            group_index=group_index,
+            posts=[],
+            cross_post_insights={"error": str(error)},
+            processing_time=total_time
+        )
+
+    def extract_from_group(self, posts: List[Dict[str, Any]], group_index: int) -> ExtractionResult:
+        """
+        Extract information from a group of posts.
+
+        Args:
+            posts: List of post dictionaries
+            group_index: Index of this group
+
+        Returns:
+            ExtractionResult object
+        """
+        start_time = time.time()
+        print(f"  [Group {group_index}] Starting processing...")
+
+        markdown_content = self._prepare_group(posts, group_index)
+        if markdown_content is None:
+            return ExtractionResult(
                 group_index=group_index,
-                posts=extracted.get("posts", []),
-                cross_post_insights=extracted.get("cross_post_insights", {}),
-                raw_response=response_text,
-                tokens_used=tokens_used,
-                processing_time=total_time
+                posts=[],
+                cross_post_insights={},
+                processing_time=time.time() - start_time
+            )
+        user_prompt = get_extraction_prompt(markdown_content)
+
+        # Response cache short-circuits the API call entirely
+        cached = self._cache_lookup(user_prompt)
+        if cached is not None:
+            print(f"  [Group {group_index}] Response cache hit - skipping API call")
+            response_text, input_tokens, output_tokens, cache_read_tokens = cached
+            return self._finish_group(
+                group_index, user_prompt, response_text,
+                input_tokens, output_tokens, cache_read_tokens,
+                0.0, start_time
             )
-            print(f"  [Group {group_index}] ✓ Complete: {len(result.posts)} posts extracted, {tokens_used} tokens, {total_time:.2f}s total")
-            print()
-            return result
 
+        # Call LLM API
+        try:
+            print(f"  [Group {group_index}] Calling {self.provider.upper()} API (model: {self.config.model})...")
+            api_start = time.time()
+            response_text, input_tokens, output_tokens, cache_read_tokens = self._call_llm_api(
+                FULL_SYSTEM_PROMPT, user_prompt
+            )
+            api_time = time.time() - api_start
+            self._cache_store(
+                user_prompt, response_text, input_tokens, output_tokens, cache_read_tokens
+            )
+            return self._finish_group(
+                group_index, user_prompt, response_text,
+                input_tokens, output_tokens, cache_read_tokens,
+                api_time, start_time
+            )
         except Exception as e:
-            total_time = time.time() - start_time
-            print(f"  [Group {group_index}] ✗ Error: {e} ({total_time:.2f}s)")
-            print()
+            return self._error_result(group_index, e, start_time)
+
+    async def extract_from_group_async(
+        self,
+        posts: List[Dict[str, Any]],
+        group_index: int,
+        rate_limiter: Optional[_AsyncRateLimiter] = None,
+    ) -> ExtractionResult:
+        """
+        Async variant of extract_from_group.
+
+        Args:
+            posts: List of post dictionaries
+            group_index: Index of this group
+            rate_limiter: Optional shared RPM/TPM limiter
+
+        Returns:
+            ExtractionResult object
+        """
+        start_time = time.time()
+        print(f"  [Group {group_index}] Starting processing...")
+
+        markdown_content = self._prepare_group(posts, group_index)
+        if markdown_content is None:
             return ExtractionResult(
                 group_index=group_index,
                 posts=[],
-                cross_post_insights={"error": str(e)},
-                processing_time=total_time
+                cross_post_insights={},
+                processing_time=time.time() - start_time
+            )
+        user_prompt = get_extraction_prompt(markdown_content)
+
+        # Response cache short-circuits the API call entirely
+        cached = self._cache_lookup(user_prompt)
+        if cached is not None:
+            print(f"  [Group {group_index}] Response cache hit - skipping API call")
+            response_text, input_tokens, output_tokens, cache_read_tokens = cached
+            return self._finish_group(
+                group_index, user_prompt, response_text,
+                input_tokens, output_tokens, cache_read_tokens,
+                0.0, start_time
             )
 
+        try:
+            if rate_limiter is not None:
+                # Rough token estimate: ~4 chars per token, plus output budget
+                estimated_tokens = (
+                    (len(FULL_SYSTEM_PROMPT) + len(user_prompt)) // 4
+                    + self.config.max_tokens
+                )
+                await rate_limiter.acquire(estimated_tokens)
+
+            print(f"  [Group {group_index}] Calling {self.provider.upper()} API (model: {self.config.model})...")
+            api_start = time.time()
+            response_text, input_tokens, output_tokens, cache_read_tokens = await self._call_llm_api_async(
+                FULL_SYSTEM_PROMPT, user_prompt
+            )
+            api_time = time.time() - api_start
+            self._cache_store(
+                user_prompt, response_text, input_tokens, output_tokens, cache_read_tokens
+            )
+            return self._finish_group(
+                group_index, user_prompt, response_text,
+                input_tokens, output_tokens, cache_read_tokens,
+                api_time, start_time
+            )
+        except Exception as e:
+            return self._error_result(group_index, e, start_time)
+
     def extract_from_posts(
         self,
         posts: List[Dict[str, Any]],
@@ -398,6 +713,30 @@ class InterviewExtractor:
         """
         Extract information from all posts.
 
+        Groups run concurrently (bounded by max_concurrency and the RPM/TPM
+        limiter) instead of the old serial loop with fixed sleeps.
+
+        Args:
+            posts: List of all post dictionaries
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            BatchExtractionResult object
+        """
+        return asyncio.run(self.extract_from_posts_async(posts, progress_callback))
+
+    async def extract_from_posts_async(
+        self,
+        posts: List[Dict[str, Any]],
+        progress_callback: Optional[callable] = None
+    ) -> BatchExtractionResult:
+        """
+        Async implementation of extract_from_posts.
+
+        Fans groups out with asyncio behind a bounded semaphore plus a shared
+        leaky-bucket limiter, collapsing N*(latency+delay) wall-clock into
+        roughly ceil(N/concurrency)*latency.
+
         Args:
             posts: List of all post dictionaries
             progress_callback: Optional callback for progress updates
@@ -406,7 +745,6 @@ class InterviewExtractor:
             BatchExtractionResult object
         """
         start_time = time.time()
-        results = []
 
         # Group posts
         groups = self.grouper.group_posts(posts)
@@ -416,45 +754,58 @@ class InterviewExtractor:
         print(f"Starting extraction: {len(posts)} posts in {total_groups} groups")
         print(f"Model: {self.config.model}")
         print(f"Posts per group: {self.config.posts_per_group}")
+        print(f"Max concurrency: {self.config.max_concurrency} "
+              f"({self.config.requests_per_minute} rpm / {self.config.tokens_per_minute} tpm)")
         print(f"{'='*70}\n")
 
-        for i, group in enumerate(groups, 1):
-            group_start = time.time()
-            print(f"[{i}/{total_groups}] Processing group {i}...")
-            print(f"{'─'*70}")
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        rate_limiter = _AsyncRateLimiter(
+            self.config.requests_per_minute,
+            self.config.tokens_per_minute,
+        )
 
-            result = self.extract_from_group(group, i)
-            results.append(result)
+        if self.config.prompts_per_request > 1:
+            return await self._extract_packed_async(
+                groups, rate_limiter, semaphore, start_time
+            )
+
+        progress_lock = asyncio.Lock()
+        results: List[Optional[ExtractionResult]] = [None] * total_groups
+        completed = 0
 
-            # Calculate progress stats
-            elapsed = time.time() - start_time
-            avg_time_per_group = elapsed / i
-            remaining_groups = total_groups - i
-            estimated_remaining = avg_time_per_group * remaining_groups
+        async def run_group(index: int, group: List[Dict[str, Any]]):
+            nonlocal completed
+            async with semaphore:
+                result = await self.extract_from_group_async(group, index + 1, rate_limiter)
+            results[index] = result
 
-            cumulative_posts = sum(len(r.posts) for r in results)
-            cumulative_tokens = sum(r.tokens_used for r in results)
+            # Serialize progress reporting across concurrent groups
+            async with progress_lock:
+                completed += 1
+                elapsed = time.time() - start_time
+                avg_time_per_group = elapsed / completed
+                estimated_remaining = avg_time_per_group * (total_groups - completed)
 
-            print(f"[Progress] {i}/{total_groups} groups done ({i/total_groups*100:.1f}%)")
-            print(f"[Progress] Elapsed: {elapsed:.1f}s | Est. remaining: {estimated_remaining:.1f}s")
-            print(f"[Progress] Total extracted: {cumulative_posts} posts, {cumulative_tokens} tokens")
-            print()
+                done = [r for r in results if r is not None]
+                cumulative_posts = sum(len(r.posts) for r in done)
+                cumulative_tokens = sum(r.tokens_used for r in done)
 
-            if progress_callback:
-                progress_callback(i, total_groups, result)
+                print(f"[Progress] {completed}/{total_groups} groups done ({completed/total_groups*100:.1f}%)")
+                print(f"[Progress] Elapsed: {elapsed:.1f}s | Est. remaining: {estimated_remaining:.1f}s")
+                print(f"[Progress] Total extracted: {cumulative_posts} posts, {cumulative_tokens} tokens")
+                print()
 
-            # Rate limiting
-            if i < total_groups:
-                if self.config.delay_between_calls > 0:
-                    print(f"[Rate limit] Waiting {self.config.delay_between_calls}s before next group...\n")
-                time.sleep(self.config.delay_between_calls)
+                if progress_callback:
+                    progress_callback(completed, total_groups, result)
 
-        # Compile final result
+        await asyncio.gather(*(run_group(i, group) for i, group in enumerate(groups)))
+
+        # Compile final result (results list is indexed by group, so order holds)
         total_time = time.time() - start_time
         batch_result = BatchExtractionResult(
-            results=results,
-            total_posts_processed=sum(len(r.posts) for r in results),
-            total_tokens_used=sum(r.tokens_used for r in results),
+            results=[r for r in results if r is not None],
+            total_posts_processed=sum(len(r.posts) for r in results if r is not None),
+            total_tokens_used=sum(r.tokens_used for r in results if r is not None),
             total_processing_time=total_time,
             generated_at=datetime.now().isoformat()
         )
@@ -462,7 +813,207 @@ class InterviewExtractor:
         print(f"{'='*70}")
         print(f"Extraction complete!")
         print(f"Total time: {total_time:.2f}s")
-        print(f"Average time per group: {total_time/total_groups:.2f}s")
+        if total_groups:
+            print(f"Average time per group: {total_time/total_groups:.2f}s")
+        print(f"{'='*70}\n")
+
+        return batch_result
+
+    async def _extract_packed_async(
+        self,
+        groups: List[List[Dict[str, Any]]],
+        rate_limiter: _AsyncRateLimiter,
+        semaphore: asyncio.Semaphore,
+        start_time: float,
+    ) -> BatchExtractionResult:
+        """
+        Pack prompts_per_request groups into each API call.
+
+        Each packed request carries K groups' markdown behind boundary
+        markers and asks for a {"responses": [...]} array, so RPM-bound
+        runs make 1/K the requests at the same token cost.
+        """
+        pack_size = self.config.prompts_per_request
+        total_groups = len(groups)
+        results: List[Optional[ExtractionResult]] = [None] * total_groups
+
+        # Convert all groups first; drop the empty ones from packing
+        packable: List[tuple[int, str]] = []
+        for i, group in enumerate(groups, 1):
+            markdown_content = self._prepare_group(group, i)
+            if markdown_content is None:
+                results[i - 1] = ExtractionResult(
+                    group_index=i, posts=[], cross_post_insights={},
+                )
+            else:
+                packable.append((i, markdown_content))
+
+        packs = [packable[i:i + pack_size] for i in range(0, len(packable), pack_size)]
+        print(f"Packing {len(packable)} groups into {len(packs)} requests "
+              f"({pack_size} prompts per request)")
+
+        async def run_pack(pack: List[tuple[int, str]]):
+            pack_start = time.time()
+            user_prompt = get_batched_extraction_prompt([md for _, md in pack])
+            group_ids = [gi for gi, _ in pack]
+            try:
+                async with semaphore:
+                    estimated_tokens = (
+                        (len(FULL_SYSTEM_PROMPT) + len(user_prompt)) // 4
+                        + self.config.max_tokens
+                    )
+                    await rate_limiter.acquire(estimated_tokens)
+                    print(f"  [Pack {group_ids}] Calling {self.provider.upper()} API...")
+                    response_text, input_tokens, output_tokens, cache_read_tokens = (
+                        await self._call_llm_api_async(FULL_SYSTEM_PROMPT, user_prompt)
+                    )
+            except Exception as e:
+                for gi in group_ids:
+                    results[gi - 1] = self._error_result(gi, e, pack_start)
+                return
+
+            parsed = self._extract_json_from_response(response_text)
+            responses = parsed.get("responses", [])
+            pack_time = time.time() - pack_start
+            # Token telemetry is per-request; split it evenly across the pack
+            tokens_per_group = (input_tokens + output_tokens) // len(pack)
+            cache_per_group = cache_read_tokens // len(pack)
+            for offset, gi in enumerate(group_ids):
+                sub = responses[offset] if offset < len(responses) else {}
+                if not isinstance(sub, dict):
+                    sub = {}
+                results[gi - 1] = ExtractionResult(
+                    group_index=gi,
+                    posts=sub.get("posts", []),
+                    cross_post_insights=sub.get("cross_post_insights", {}),
+                    raw_response=response_text if offset == 0 else "",
+                    tokens_used=tokens_per_group,
+                    cache_read_tokens=cache_per_group,
+                    processing_time=pack_time,
+                )
+            print(f"  [Pack {group_ids}] ✓ Complete ({pack_time:.2f}s)")
+
+        await asyncio.gather(*(run_pack(pack) for pack in packs))
+
+        total_time = time.time() - start_time
+        final_results = [r for r in results if r is not None]
+        return BatchExtractionResult(
+            results=final_results,
+            total_posts_processed=sum(len(r.posts) for r in final_results),
+            total_tokens_used=sum(r.tokens_used for r in final_results),
+            total_processing_time=total_time,
+            generated_at=datetime.now().isoformat()
+        )
+
+    def extract_from_posts_batched(
+        self,
+        posts: List[Dict[str, Any]],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+        timeout: float = 24 * 3600,
+    ) -> BatchExtractionResult:
+        """
+        Extract information from all posts via the Anthropic Message Batches API.
+
+        Non-interactive runs don't need real-time responses, so submitting all
+        group prompts as one batch halves the per-token cost and moves the run
+        into the batch rate-limit pool (no RPM throttling). Only supported for
+        the anthropic provider.
+
+        Args:
+            posts: List of all post dictionaries
+            poll_interval: Initial seconds between status polls
+            max_poll_interval: Cap for the exponential poll backoff
+            timeout: Give up after this many seconds (batches expire at 24h)
+
+        Returns:
+            BatchExtractionResult object
+        """
+        if self.provider != "anthropic":
+            raise ValueError("Batch extraction requires the 'anthropic' provider")
+
+        start_time = time.time()
+        groups = self.grouper.group_posts(posts)
+        total_groups = len(groups)
+
+        print(f"\n{'='*70}")
+        print(f"Starting BATCH extraction: {len(posts)} posts in {total_groups} groups")
+        print(f"Model: {self.config.model}")
+        print(f"{'='*70}\n")
+
+        # Build all requests up front; empty groups get placeholder results
+        results: List[Optional[ExtractionResult]] = [None] * total_groups
+        user_prompts: Dict[str, tuple[int, str]] = {}
+        requests = []
+        for i, group in enumerate(groups, 1):
+            markdown_content = self._prepare_group(group, i)
+            if markdown_content is None:
+                results[i - 1] = ExtractionResult(
+                    group_index=i, posts=[], cross_post_insights={},
+                )
+                continue
+            custom_id = f"group_{i}"
+            user_prompt = get_extraction_prompt(markdown_content)
+            user_prompts[custom_id] = (i, user_prompt)
+            requests.append({
+                "custom_id": custom_id,
+                "params": self._build_request_kwargs(FULL_SYSTEM_PROMPT, user_prompt),
+            })
+
+        if not requests:
+            return BatchExtractionResult(
+                results=[r for r in results if r is not None],
+                generated_at=datetime.now().isoformat(),
+            )
+
+        batch = self.client.messages.batches.create(requests=requests)
+        print(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+        # Poll with exponential backoff until the batch ends
+        interval = poll_interval
+        while batch.processing_status != "ended":
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"Batch {batch.id} did not finish within {timeout}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            print(f"  Batch {batch.id}: {batch.processing_status} "
+                  f"({counts.succeeded} succeeded / {counts.errored} errored / "
+                  f"{counts.processing} processing)")
+
+        # Stream results and map custom_id back to group order
+        for entry in self.client.messages.batches.results(batch.id):
+            group_index, user_prompt = user_prompts[entry.custom_id]
+            group_start = time.time()
+            if entry.result.type == "succeeded":
+                response_text, input_tokens, output_tokens, cache_read_tokens = (
+                    self._parse_llm_response(entry.result.message)
+                )
+                results[group_index - 1] = self._finish_group(
+                    group_index, user_prompt, response_text,
+                    input_tokens, output_tokens, cache_read_tokens,
+                    api_time=0.0, start_time=group_start,
+                )
+            else:
+                results[group_index - 1] = self._error_result(
+                    group_index,
+                    RuntimeError(f"batch request {entry.result.type}"),
+                    group_start,
+                )
+
+        total_time = time.time() - start_time
+        final_results = [r for r in results if r is not None]
+        batch_result = BatchExtractionResult(
+            results=final_results,
+            total_posts_processed=sum(len(r.posts) for r in final_results),
+            total_tokens_used=sum(r.tokens_used for r in final_results),
+            total_processing_time=total_time,
+            generated_at=datetime.now().isoformat()
+        )
+
+        print(f"{'='*70}")
+        print(f"Batch extraction complete! Total time: {total_time:.2f}s")
         print(f"{'='*70}\n")
 
         return batch_result
@@ -484,8 +1035,8 @@ class InterviewExtractor:
 
         filepath = os.path.join(self.config.output_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps_indent(result.to_dict()))
 
         print(f"Results saved to: {filepath}")
         return filepath
@@ -501,12 +1052,43 @@ def load_posts_from_json(filepath: str) -> List[Dict[str, Any]]:
     Returns:
         List of post dictionaries
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(filepath, "rb") as f:
+        data = json_loads(f.read())
 
     return data.get("posts", [])
 
 
+def stream_posts_from_json(filepath: str):
+    """
+    Lazily yield posts from a JSON file.
+
+    Uses ijson when available so multi-GB scraper outputs are parsed
+    incrementally instead of loaded whole; callers that only want the
+    first N posts (--max-posts) never pay for the tail. Handles both a
+    top-level posts array and the {"posts": [...]} workflow format.
+
+    Args:
+        filepath: Path to JSON file
+
+    Yields:
+        Post dictionaries in file order
+    """
+    if ijson is None:
+        # Whole-file parse; unlike load_posts_from_json this must accept
+        # the top-level-array format too
+        with open(filepath, "rb") as f:
+            data = json_loads(f.read())
+        yield from (data if isinstance(data, list) else data.get("posts", []))
+        return
+
+    with open(filepath, "rb") as f:
+        # Peek at the first non-whitespace byte to pick the item prefix
+        first = f.read(64).lstrip()[:1]
+        f.seek(0)
+        prefix = "item" if first == b"[" else "posts.item"
+        yield from ijson.items(f, prefix)
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
@@ -23,10 +23,23 @@ try:
 except ImportError:
     openai = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
 import sys
 from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared import get_post_title, get_main_content
 
 from filter_prompt_templates import (
     FILTER_SYSTEM_PROMPT,
@@ -34,6 +47,15 @@ from filter_prompt_templates import (
     prepare_post_summary,
 )
 
+# Default anchor phrases describing interview-related content. Post embeddings
+# are scored by cosine similarity against these.
+DEFAULT_EMBEDDING_ANCHORS = [
+    "面试经验分享 面经 一面 二面 三面 电话面试",
+    "算法题 coding 技术面试 面试题目 system design",
+    "offer 薪资 包裹 录取 谈判",
+    "behavioral question 行为面试 HR面 自我介绍",
+]
+
 
 @dataclass
 class FilterConfig:
@@ -52,6 +74,15 @@ class FilterConfig:
     confidence_threshold: float = 0.7
     delay_between_calls: float = 0.5
 
+    # Embedding pre-filter settings
+    # Posts scoring >= tau_high against the anchors are kept without an LLM
+    # call, < tau_low are dropped, and the band in between goes to the LLM.
+    embedding_enabled: bool = True
+    embedding_model: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    embedding_tau_low: float = 0.2
+    embedding_tau_high: float = 0.5
+    embedding_anchors: List[str] = field(default_factory=lambda: list(DEFAULT_EMBEDDING_ANCHORS))
+
     # Output settings
     output_dir: str = "output"
     save_results: bool = True
@@ -68,6 +99,7 @@ class FilterConfig:
         filter_api = llm_filter.get("api", {})
         filter_processing = llm_filter.get("processing", {})
         filter_output = llm_filter.get("output", {})
+        filter_embedding = llm_filter.get("embedding", {})
 
         # API settings with fallback to extraction settings
         provider = filter_api.get("provider") or config.api_provider
@@ -87,6 +119,13 @@ class FilterConfig:
             posts_per_batch=filter_processing.get("posts_per_batch", 20),
             confidence_threshold=filter_processing.get("confidence_threshold", 0.7),
             delay_between_calls=filter_processing.get("delay_between_calls", 0.5),
+            embedding_enabled=filter_embedding.get("enabled", True),
+            embedding_model=filter_embedding.get(
+                "model", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+            ),
+            embedding_tau_low=filter_embedding.get("tau_low", 0.2),
+            embedding_tau_high=filter_embedding.get("tau_high", 0.5),
+            embedding_anchors=filter_embedding.get("anchors") or list(DEFAULT_EMBEDDING_ANCHORS),
             output_dir=config.extraction_output_dir,
             save_results=filter_output.get("save_results", True),
             results_filename=filter_output.get("results_filename", "filter_results.json"),
@@ -215,6 +254,62 @@ class InterviewFilter:
         else:
             self.client = openai.OpenAI(**client_kwargs)
 
+        # Embedding model and anchor matrix are loaded lazily on first use
+        self._embedder = None
+        self._anchor_matrix = None
+
+    def _embedding_prefilter(
+        self, posts: List[Dict[str, Any]]
+    ) -> Optional[Tuple[List[int], List[int], List[int]]]:
+        """
+        Score posts against anchor embeddings to avoid LLM calls where possible.
+
+        Posts scoring >= tau_high are kept outright, < tau_low are dropped,
+        and the uncertain band in between is routed to the LLM filter.
+
+        Args:
+            posts: List of all posts to score
+
+        Returns:
+            Tuple of (keep_indices, drop_indices, uncertain_indices), or None
+            when the embedding pre-filter is disabled or dependencies are missing
+        """
+        if not self.config.embedding_enabled:
+            return None
+        if SentenceTransformer is None or np is None:
+            print("  sentence-transformers/numpy not installed - skipping embedding pre-filter")
+            return None
+
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(self.config.embedding_model)
+            self._anchor_matrix = self._embedder.encode(
+                self.config.embedding_anchors,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+
+        texts = []
+        for post in posts:
+            title = get_post_title(post) or ""
+            content = get_main_content(post) or ""
+            texts.append(title + " " + content[:512])
+
+        embeddings = self._embedder.encode(
+            texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+        )
+
+        # Normalized embeddings, so this single matmul gives cosine similarity
+        scores = embeddings @ self._anchor_matrix.T
+        best = scores.max(axis=1)
+
+        tau_low = self.config.embedding_tau_low
+        tau_high = self.config.embedding_tau_high
+        keep = np.flatnonzero(best >= tau_high).tolist()
+        drop = np.flatnonzero(best < tau_low).tolist()
+        uncertain = np.flatnonzero((best >= tau_low) & (best < tau_high)).tolist()
+
+        return keep, drop, uncertain
+
     def _call_llm_api(self, system_prompt: str, user_prompt: str) -> Tuple[str, int, int]:
         """
         Call LLM API with unified interface.
@@ -323,7 +418,11 @@ class InterviewFilter:
             ]
 
     def filter_batch(
-        self, posts: List[Dict[str, Any]], batch_index: int, start_index: int = 0
+        self,
+        posts: List[Dict[str, Any]],
+        batch_index: int,
+        start_index: int = 0,
+        original_indices: Optional[List[int]] = None,
     ) -> BatchFilterResult:
         """
         Filter a single batch of posts.
@@ -332,6 +431,7 @@ class InterviewFilter:
             posts: List of posts in this batch
             batch_index: Index of this batch
             start_index: Starting index for post numbering
+            original_indices: Explicit original indices for non-contiguous batches
 
         Returns:
             BatchFilterResult
@@ -343,7 +443,10 @@ class InterviewFilter:
         summaries = []
         for i, post in enumerate(posts):
             summary = prepare_post_summary(post, i)
-            summary["original_index"] = start_index + i
+            if original_indices is not None:
+                summary["original_index"] = original_indices[i]
+            else:
+                summary["original_index"] = start_index + i
             summaries.append(summary)
 
         # Generate prompt
@@ -422,22 +525,35 @@ class InterviewFilter:
             print(f"Confidence threshold: {self.config.confidence_threshold}")
             print(f"{'='*70}\n")
 
-        # Split into batches
+        # Embedding pre-filter: only the uncertain band goes to the LLM
+        prefilter = self._embedding_prefilter(posts)
+        if prefilter is not None:
+            emb_keep, emb_drop, llm_indices = prefilter
+            if verbose:
+                print(
+                    f"Embedding pre-filter: {len(emb_keep)} kept, {len(emb_drop)} dropped, "
+                    f"{len(llm_indices)} uncertain -> LLM"
+                )
+        else:
+            emb_keep, emb_drop = [], []
+            llm_indices = list(range(total_posts))
+
+        # Split the LLM-bound posts into batches
         batches = []
-        for i in range(0, total_posts, self.config.posts_per_batch):
-            batch = posts[i : i + self.config.posts_per_batch]
-            batches.append((batch, i))
+        for i in range(0, len(llm_indices), self.config.posts_per_batch):
+            idx_slice = llm_indices[i : i + self.config.posts_per_batch]
+            batches.append(([posts[j] for j in idx_slice], idx_slice))
 
         total_batches = len(batches)
         batch_results = []
         all_post_results: Dict[int, PostFilterResult] = {}
 
         # Process each batch
-        for batch_idx, (batch, start_idx) in enumerate(batches, 1):
+        for batch_idx, (batch, idx_slice) in enumerate(batches, 1):
             if verbose:
                 print(f"[{batch_idx}/{total_batches}] Filtering batch...")
 
-            result = self.filter_batch(batch, batch_idx, start_idx)
+            result = self.filter_batch(batch, batch_idx, original_indices=idx_slice)
             batch_results.append(result)
 
             # Collect results
@@ -453,7 +569,18 @@ class InterviewFilter:
         filtered_indices = []
         kept_posts = []
 
+        emb_keep_set = set(emb_keep)
+        emb_drop_set = set(emb_drop)
+
         for i, post in enumerate(posts):
+            if i in emb_keep_set:
+                kept_indices.append(i)
+                kept_posts.append(post)
+                continue
+            if i in emb_drop_set:
+                filtered_indices.append(i)
+                continue
+
             pr = all_post_results.get(i)
             if pr is None:
                 # Post not in results - keep it
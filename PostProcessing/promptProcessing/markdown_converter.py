@@ -5,13 +5,18 @@ Converts JSON post data to structured Markdown format for LLM processing.
 Uses hierarchical reply structure with proper parent/child relationships.
 """
 
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 
 # Add project root to path for shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from shared import (
     SKIP_KEYWORDS,
     LOW_VALUE_PATTERNS,
@@ -22,6 +27,9 @@ from shared import (
     get_post_url,
 )
 
+# Precompiled whitespace normalizer for titles
+_WS_RE = re.compile(r'\s+')
+
 
 def remove_quote_prefix(content: str) -> str:
     """
@@ -82,13 +90,17 @@ def clean_content_from_quote(content: str, quote: str) -> str:
                 actual_reply = after_username[len(quoted_text):].strip()
                 return actual_reply
             elif quoted_text:
-                for i in range(len(quoted_text), 10, -1):
-                    if after_username.startswith(quoted_text[:i]):
-                        rest = after_username[i:]
-                        newline_pos = rest.find('\n')
-                        if newline_pos >= 0:
-                            return rest[newline_pos:].strip()
-                        return rest.strip()
+                # Longest common prefix in a single linear scan (no per-length slicing)
+                limit = min(len(quoted_text), len(after_username))
+                i = 0
+                while i < limit and after_username[i] == quoted_text[i]:
+                    i += 1
+                if i > 10:
+                    rest = after_username[i:]
+                    newline_pos = rest.find('\n')
+                    if newline_pos >= 0:
+                        return rest[newline_pos:].strip()
+                    return rest.strip()
 
         lines = after_username.split('\n')
         if len(lines) > 1:
@@ -213,6 +225,17 @@ def build_reply_hierarchy(replies: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# Minimum group size before convert_group fans out to a process pool;
+# conversion is pure-Python CPU work, so small groups stay serial.
+_PARALLEL_GROUP_THRESHOLD = 4
+
+
+def _convert_post_worker(args) -> Optional[str]:
+    """Module-level worker so ProcessPoolExecutor can pickle it."""
+    min_content_length, post_index, post = args
+    return MarkdownConverter(min_content_length).convert_post(post, post_index)
+
+
 class MarkdownConverter:
     """Converts forum post data to Markdown format."""
 
@@ -224,6 +247,10 @@ class MarkdownConverter:
             min_content_length: Minimum character length for main content
         """
         self.min_content_length = min_content_length
+        # Lowercase the patterns once here instead of on every reply check
+        self._low_value_prefixes = tuple(
+            (pattern.lower(), len(pattern)) for pattern in LOW_VALUE_PATTERNS
+        )
 
     def should_skip_post(self, post: Dict[str, Any]) -> bool:
         """
@@ -251,7 +278,20 @@ class MarkdownConverter:
 
     def _is_low_value_reply(self, content: str) -> bool:
         """Check if a reply is low-value (just thanks, etc.)."""
-        return is_low_value_content(content, LOW_VALUE_PATTERNS, min_length=10)
+        # Same semantics as is_low_value_content(content, LOW_VALUE_PATTERNS,
+        # min_length=10), but uses the prefixes pre-lowered in __init__
+        if not content:
+            return True
+
+        content_lower = content.lower().strip()
+        if len(content_lower) < 10:
+            return True
+
+        for prefix, pattern_len in self._low_value_prefixes:
+            if content_lower.startswith(prefix):
+                # But if it has more content after, might still be valuable
+                return len(content_lower) <= pattern_len + 20
+        return False
 
     def _format_nested_reply(self, reply_node: Dict[str, Any], depth: int = 0) -> List[str]:
         """
@@ -274,8 +314,12 @@ class MarkdownConverter:
             return lines
 
         # Clean up content - preserve newlines but trim each line
-        content_lines = content.split('\n')
-        content_lines = [line.strip() for line in content_lines if line.strip()]
+        # (single pass: strip once, drop blanks)
+        content_lines = []
+        for line in content.split('\n'):
+            line = line.strip()
+            if line:
+                content_lines.append(line)
 
         if content_lines:
             # First line with bullet
@@ -322,7 +366,7 @@ class MarkdownConverter:
         title = get_post_title(post) or "未知标题"
         # Clean up the title
         title = title.replace("[找工就业]", "").replace("[面试经验]", "").replace("[工作信息]", "").replace("[其他]", "").strip()
-        title = " ".join(title.split())  # Normalize whitespace
+        title = _WS_RE.sub(' ', title).strip()  # Normalize whitespace
 
         lines.append(f"## 帖子 {post_index}: {title}")
         lines.append("")
@@ -386,6 +430,25 @@ class MarkdownConverter:
         Returns:
             Markdown formatted string
         """
+        markdown, _ = self.convert_group_with_count(posts, group_index)
+        return markdown
+
+    def convert_group_with_count(
+        self, posts: List[Dict[str, Any]], group_index: int = 1, parallel: bool = True
+    ) -> Tuple[str, int]:
+        """
+        Convert a group of posts to Markdown, also reporting the valid count.
+
+        Args:
+            posts: List of post dictionaries
+            group_index: Index of this group
+            parallel: Allow fanning large groups out to a process pool.
+                Pass False when already running inside a pool worker so
+                each worker doesn't spawn its own nested pool.
+
+        Returns:
+            Tuple of (markdown string, number of valid posts included)
+        """
         lines = []
         lines.append(f"# 面经帖子组 {group_index}")
         lines.append("")
@@ -394,9 +457,19 @@ class MarkdownConverter:
         lines.append("---")
         lines.append("")
 
+        # Posts are independent, so large groups convert in parallel;
+        # executor.map preserves output order.
+        if parallel and len(posts) >= _PARALLEL_GROUP_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                converted_posts = list(executor.map(
+                    _convert_post_worker,
+                    [(self.min_content_length, i, post) for i, post in enumerate(posts, 1)],
+                ))
+        else:
+            converted_posts = [self.convert_post(post, i) for i, post in enumerate(posts, 1)]
+
         valid_post_count = 0
-        for i, post in enumerate(posts, 1):
-            converted = self.convert_post(post, i)
+        for converted in converted_posts:
             if converted:
                 valid_post_count += 1
                 lines.append(converted)
@@ -405,37 +478,127 @@ class MarkdownConverter:
                 lines.append("")
 
         if valid_post_count == 0:
-            return ""
+            return "", 0
 
-        return "\n".join(lines)
+        return "\n".join(lines), valid_post_count
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate: ~4 chars/token for ASCII, ~1 token per CJK char.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate token count
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def estimate_post_tokens(post: Dict[str, Any]) -> int:
+    """
+    Estimate the token footprint of a post's converted markdown.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Approximate token count for title, content, and replies
+    """
+    tokens = estimate_tokens(get_post_title(post) or "")
+    tokens += estimate_tokens(get_main_content(post) or "")
+    for reply in get_replies(post):
+        content = reply.get("content") if isinstance(reply, dict) else None
+        if content:
+            tokens += estimate_tokens(content)
+    return tokens
 
 
 class PostGrouper:
     """Groups posts for batch processing."""
 
-    def __init__(self, group_size: int = 3):
+    def __init__(
+        self,
+        group_size: int = 3,
+        max_input_tokens: Optional[int] = None,
+        safety: float = 0.9,
+        reserved_tokens: int = 0,
+    ):
         """
         Initialize the grouper.
 
         Args:
             group_size: Number of posts per group (2-3 recommended)
+            max_input_tokens: When set, group by rolling token estimate
+                instead of fixed count, packing each group up to this budget
+            safety: Fraction of max_input_tokens actually used, leaving
+                headroom for the estimate being approximate
+            reserved_tokens: Tokens already spent per request (e.g. an
+                uncached system prompt), subtracted from the budget
         """
         self.group_size = group_size
+        self.max_input_tokens = max_input_tokens
+        self.safety = safety
+        self.reserved_tokens = reserved_tokens
 
-    def group_posts(self, posts: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    def group_posts(self, posts: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
         """
         Group posts into batches.
 
+        Accepts any iterable (including generators from streaming
+        ingestion), not just lists.
+
         Args:
-            posts: List of all posts
+            posts: Iterable of all posts
 
         Returns:
             List of post groups
         """
-        return [
-            posts[i:i + self.group_size]
-            for i in range(0, len(posts), self.group_size)
-        ]
+        if self.max_input_tokens is not None:
+            return self._group_by_tokens(posts)
+
+        iterator = iter(posts)
+        groups = []
+        while True:
+            group = list(islice(iterator, self.group_size))
+            if not group:
+                break
+            groups.append(group)
+        return groups
+
+    def _group_by_tokens(self, posts: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Pack posts into groups by rolling token estimate.
+
+        Each group is filled until adding the next post would exceed the
+        budget, so uniform-count groups no longer alternate between wasting
+        context and risking truncation.
+
+        Args:
+            posts: Iterable of all posts
+
+        Returns:
+            List of post groups
+        """
+        budget = int(self.max_input_tokens * self.safety) - self.reserved_tokens
+        groups: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+
+        for post in posts:
+            post_tokens = estimate_post_tokens(post)
+            if current and current_tokens + post_tokens > budget:
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            current.append(post)
+            current_tokens += post_tokens
+
+        if current:
+            groups.append(current)
+        return groups
 
 
 if __name__ == "__main__":
@@ -35,44 +35,41 @@ SYSTEM_PROMPT = """你是一位专业的面试信息分析师，专门从技术
 请保持客观、准确，只提取帖子中明确提到的信息，不要添加推测性内容。"""
 
 
-USER_PROMPT_TEMPLATE = """请仔细阅读以下来自技术论坛的面经帖子，提取关键的面试信息。
-
----
-{markdown_content}
----
-
-请按以下JSON结构提取信息：
+# Invariant extraction instructions. Kept separate from USER_PROMPT_TEMPLATE so
+# they can live in the (cacheable) system prefix instead of being re-sent and
+# re-tokenized with every group's user prompt.
+EXTRACTION_GUIDELINES = """请按以下JSON结构提取信息：
 
 ```json
-{{
+{
   "posts": [
-    {{
+    {
       "post_id": "帖子序号（与输入中的帖子序号对应）",
       "source_url": "原始链接",
       "title": "帖子标题（简洁版）",
       "position_type": "职位类型（如：SWE/Backend/Fullstack/ML Engineer/Research等，无法识别则填'未知'）",
       "interview_stage": "面试阶段（如：电话面试/店面/VO/Onsite/终面等，无法识别则填'未知'）",
-      "interview_info": {{
+      "interview_info": {
         "题目类型": "Coding/System Design/ML Coding/Behavioral/其他",
         "时长": "如有提及（如60min/75min），否则填'N/A'",
         "题目描述": "题目的核心内容描述，尽可能详细",
         "具体要求": ["要求1", "要求2"],
         "考察重点": ["技术点1", "技术点2"],
         "prompt提示": "如有提及面试前收到的prompt,列出prompt，否则填'N/A'"
-      }},
-      "from_replies": {{
+      },
+      "from_replies": {
         "补充细节": ["从回复中提取的有价值补充信息"],
         "常见疑问": ["其他面试者在回复中提出的相关问题"],
         "澄清信息": ["对题目的澄清或额外说明"]
-      }},
-      "metadata": {{
+      },
+      "metadata": {
         "面试结果": "如有提及（通过/挂了/等待中），否则填'N/A'",
         "难度评价": "如有提及，否则填'N/A'",
         "其他备注": "任何其他有价值的信息"
-      }}
-    }}
+      }
+    }
   ]
-}}
+}
 ```
 
 **提取指南**：
@@ -107,18 +104,86 @@ USER_PROMPT_TEMPLATE = """请仔细阅读以下来自技术论坛的面经帖子
 
 最终针对提出的所有post的结果我们再次提取
 ```
-  "cross_post_insights": {{
+  "cross_post_insights": {
     "相关题目汇总": ["跨帖子分析：如果本组中多个帖子提到相同或相关的面试题目，在这里汇总关联"],
     "综合观察": "跨帖子分析：综合本组所有帖子发现的有价值信息、规律或趋势（如：某题目出现频率高、某轮面试难度趋势等）"
-  }}
-```
+  }
+```"""
+
+
+# Full system text: role description plus the invariant guidelines.
+# Everything here is identical across groups, so providers that support
+# prompt caching only pay for it once per cache window.
+FULL_SYSTEM_PROMPT = SYSTEM_PROMPT + "\n\n" + EXTRACTION_GUIDELINES
+
+
+USER_PROMPT_TEMPLATE = """请仔细阅读以下来自技术论坛的面经帖子，按照系统提示中的JSON结构提取关键的面试信息。
+
+---
+{markdown_content}
+---
+
 请开始提取："""
 
 
+def get_system_blocks() -> list:
+    """
+    Get the system prompt as Anthropic content blocks with cache_control.
+
+    Marking the invariant system text as ephemeral lets the API reuse the
+    tokenized prefix across all group calls instead of reprocessing it.
+
+    Returns:
+        List of system content blocks for client.messages.create(system=...)
+    """
+    return [
+        {
+            "type": "text",
+            "text": FULL_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+BATCHED_USER_PROMPT_HEADER = """以下包含多组面经帖子，组与组之间以 ---REQUEST_BOUNDARY j--- 边界分隔。
+
+请对每一组分别按照系统提示中的JSON结构提取信息，并按以下结构输出：
+
+```json
+{"responses": [第1组的提取结果, 第2组的提取结果, ...]}
+```
+
+responses 数组的顺序必须与边界序号一一对应，只输出JSON。"""
+
+
+def get_batched_extraction_prompt(markdown_contents: list) -> str:
+    """
+    Pack several groups' markdown into one delimited user prompt.
+
+    Converts K requests into one request at the same token cost, which
+    matters when runs are bound by requests-per-minute rather than tokens.
+
+    Args:
+        markdown_contents: Markdown strings, one per group, in order
+
+    Returns:
+        Combined user prompt string
+    """
+    sections = [BATCHED_USER_PROMPT_HEADER]
+    for j, markdown_content in enumerate(markdown_contents, 1):
+        sections.append(f"---REQUEST_BOUNDARY {j}---")
+        sections.append(markdown_content)
+    sections.append("请开始提取：")
+    return "\n\n".join(sections)
+
+
 def get_extraction_prompt(markdown_content: str) -> str:
     """
     Generate the complete user prompt with markdown content inserted.
 
+    Only the per-group markdown varies here; the invariant instructions
+    live in FULL_SYSTEM_PROMPT so the cached prefix stays stable.
+
     Args:
         markdown_content: Markdown formatted post content
 
@@ -18,23 +18,37 @@ Examples:
 import argparse
 import json
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-# Add project root to path for shared imports
+# Add project root to path for shared imports (deduplicated: repeated
+# position-0 inserts slow every later import in the process)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 from shared import create_timestamped_dir, UnifiedConfig
-
-from interview_extractor import InterviewExtractor, ExtractionConfig, load_posts_from_json
+from shared.json_compat import dumps_indent as _json_dumps_bytes
+
+from interview_extractor import (
+    InterviewExtractor,
+    ExtractionConfig,
+    load_posts_from_json,
+    stream_posts_from_json,
+)
 from interview_filter import InterviewFilter, FilterConfig
 from config_loader import get_config
 from markdown_converter import MarkdownConverter, PostGrouper
-from prompt_templates import SYSTEM_PROMPT, get_extraction_prompt
+from prompt_templates import FULL_SYSTEM_PROMPT, get_extraction_prompt, get_system_blocks
 
 # Import process_json for preprocessing
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_POSTPROCESSING_DIR = str(Path(__file__).parent.parent)
+if _POSTPROCESSING_DIR not in sys.path:
+    sys.path.insert(0, _POSTPROCESSING_DIR)
 from process_json import process_json_file, process_post
 
 
@@ -71,6 +85,14 @@ Examples:
         help="Number of posts per LLM call (overrides config)"
     )
 
+    parser.add_argument(
+        "--max-input-tokens",
+        type=int,
+        default=None,
+        help="Pack groups by estimated token count up to this budget "
+             "instead of a fixed --group-size"
+    )
+
     parser.add_argument(
         "--max-posts",
         type=int,
@@ -134,6 +156,33 @@ Examples:
         help="Anthropic API key (default: from ANTHROPIC_API_KEY env var)"
     )
 
+    parser.add_argument(
+        "--prompts-per-request",
+        type=int,
+        default=1,
+        help="Pack this many groups into each API request to amortize "
+             "requests-per-minute limits (default: 1 = off)"
+    )
+
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit all groups via the Anthropic Message Batches API "
+             "(50%% cheaper, separate rate-limit pool; anthropic provider only)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk response cache (re-call the API for every group)"
+    )
+
+    parser.add_argument(
+        "--no-warm-cache",
+        action="store_true",
+        help="Skip the prompt-cache warm-up request before extraction"
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -163,6 +212,104 @@ Examples:
 
 
 
+# Static portion of the human-readable prompt dump, encoded once at import
+# time instead of being rebuilt and re-encoded for every group
+_README_HEADER_BYTES = (
+    "=" * 80 + "\n"
+    + "SYSTEM PROMPT (cached):\n"
+    + "=" * 80 + "\n"
+    + FULL_SYSTEM_PROMPT + "\n\n"
+    + "=" * 80 + "\n"
+    + "USER PROMPT:\n"
+    + "=" * 80 + "\n"
+).encode("utf-8")
+
+
+def _file_writer(write_queue: "queue.Queue"):
+    """Drain (path, bytes) items from the queue until a None sentinel."""
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        path, data = item
+        Path(path).write_bytes(data)
+
+
+# Below this many groups the process-pool startup cost outweighs the win
+_PARALLEL_DUMP_THRESHOLD = 4
+
+
+def _preprocess_posts(posts: list) -> list:
+    """
+    Run process_post over posts, deduplicated and parallelized.
+
+    Posts sharing a URL/id (overlapping scrape runs) are processed once and
+    the result reused; large batches fan out over a process pool since
+    process_post is pure CPU work.
+
+    Args:
+        posts: List of raw post dictionaries
+
+    Returns:
+        List of processed posts (falsy results dropped), original order kept
+    """
+    seen = {}
+    to_process = []
+    indices = []
+    for post in posts:
+        key = post.get("url") or post.get("id")
+        if key is not None and key in seen:
+            indices.append(seen[key])
+            continue
+        idx = len(to_process)
+        if key is not None:
+            seen[key] = idx
+        to_process.append(post)
+        indices.append(idx)
+
+    if len(to_process) > 64:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            processed = list(executor.map(process_post, to_process, chunksize=64))
+    else:
+        processed = [process_post(post) for post in to_process]
+
+    return [processed[i] for i in indices if processed[i]]
+
+
+def _process_one_group(args) -> tuple:
+    """Convert one group and write its prompt/markdown files (pool worker).
+
+    Args:
+        args: Tuple of (group_index, group, config, prompts_dir, md_dir)
+
+    Returns:
+        Tuple of (group_index, valid_post_count)
+    """
+    i, group, config, prompts_dir, md_dir = args
+    converter = MarkdownConverter(min_content_length=config.min_content_length)
+    # Already inside a pool worker: disable the per-group fan-out so each
+    # worker doesn't spawn a nested ProcessPoolExecutor of its own
+    markdown, valid_count = converter.convert_group_with_count(group, i, parallel=False)
+    if not markdown:
+        return i, 0
+
+    user_prompt = get_extraction_prompt(markdown)
+    prompt_data = {
+        "group_index": i,
+        "system": get_system_blocks(),
+        "user_prompt": user_prompt,
+        "model": config.model,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+    }
+    Path(prompts_dir, f"group_{i}_prompt.json").write_bytes(_json_dumps_bytes(prompt_data))
+    Path(prompts_dir, f"group_{i}_prompt.md").write_bytes(
+        _README_HEADER_BYTES + user_prompt.encode("utf-8") + b"\n"
+    )
+    Path(md_dir, f"group_{i}.md").write_bytes(markdown.encode("utf-8"))
+    return i, valid_count
+
+
 def _dump_prompt(input_file: str, config: ExtractionConfig, max_posts: int = None, preprocess: bool = False):
     """
     Generate and save prompts without making API calls.
@@ -173,87 +320,103 @@ def _dump_prompt(input_file: str, config: ExtractionConfig, max_posts: int = Non
         max_posts: Maximum number of posts to process (None = all)
         preprocess: Whether to preprocess using process_json.py
     """
-    # Load posts
-    posts = load_posts_from_json(input_file)
-    total_posts = len(posts)
-
-    # Apply max-posts limit if specified
-    if max_posts is not None and max_posts < total_posts:
-        posts = posts[:max_posts]
-        print(f"Loaded {total_posts} posts from {input_file}, using first {len(posts)}")
+    # Load posts (streamed, so --max-posts never parses the tail)
+    posts = list(islice(stream_posts_from_json(input_file), max_posts))
+    if max_posts is not None:
+        print(f"Loaded first {len(posts)} posts from {input_file} (limit {max_posts})")
     else:
         print(f"Loaded {len(posts)} posts from {input_file}")
 
     # Optionally preprocess posts using process_json.py
     if preprocess:
         print("Preprocessing posts using process_json.py...")
-        preprocessed_posts = []
-        for i, post in enumerate(posts):
-            processed = process_post(post)
-            if processed:
-                preprocessed_posts.append(processed)
-        posts = preprocessed_posts
+        posts = _preprocess_posts(posts)
         print(f"Preprocessed {len(posts)} posts")
 
     # Initialize helpers
     converter = MarkdownConverter(min_content_length=config.min_content_length)
-    grouper = PostGrouper(group_size=config.posts_per_group)
+    grouper = PostGrouper(
+        group_size=config.posts_per_group,
+        max_input_tokens=config.max_input_tokens,
+    )
 
     # Group and convert
     groups = grouper.group_posts(posts)
     print(f"Created {len(groups)} groups (group size: {config.posts_per_group})")
 
-    # Ensure output directory exists
-    os.makedirs(config.output_dir, exist_ok=True)
-    os.makedirs(os.path.join(config.output_dir, "prompts"), exist_ok=True)
-
-    for i, group in enumerate(groups, 1):
-        markdown = converter.convert_group(group, i)
-        if markdown:
-            # Generate the user prompt
-            user_prompt = get_extraction_prompt(markdown)
-
-            # Create the full prompt structure
-            prompt_data = {
-                "group_index": i,
-                "system_prompt": SYSTEM_PROMPT,
-                "user_prompt": user_prompt,
-                "model": config.model,
-                "temperature": config.temperature,
-                "max_tokens": config.max_tokens,
-            }
-
-            # Save prompt to file
-            prompt_path = os.path.join(config.output_dir, "prompts", f"group_{i}_prompt.json")
-            with open(prompt_path, "w", encoding="utf-8") as f:
-                json.dump(prompt_data, f, ensure_ascii=False, indent=2)
-
-            # Also save a human-readable version
-            readable_path = os.path.join(config.output_dir, "prompts", f"group_{i}_prompt.md")
-            with open(readable_path, "w", encoding="utf-8") as f:
-                f.write("=" * 80 + "\n")
-                f.write("SYSTEM PROMPT:\n")
-                f.write("=" * 80 + "\n")
-                f.write(SYSTEM_PROMPT + "\n\n")
-                f.write("=" * 80 + "\n")
-                f.write("USER PROMPT:\n")
-                f.write("=" * 80 + "\n")
-                f.write(user_prompt + "\n")
-                
-            # Also save markdown for review
-            md_path = os.path.join(config.output_dir, "markdown", f"group_{i}.md")
-            os.makedirs(os.path.dirname(md_path), exist_ok=True)
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(markdown)
-
-            valid_in_group = markdown.count("## 帖子")
-            print(f"  Group {i}: {valid_in_group} valid posts -> {prompt_path}")
-        else:
-            print(f"  Group {i}: No valid posts (all filtered)")
+    # Ensure output directories exist (once, outside the group loop)
+    prompts_dir = Path(config.output_dir) / "prompts"
+    md_dir = Path(config.output_dir) / "markdown"
+    prompts_dir.mkdir(parents=True, exist_ok=True)
+    md_dir.mkdir(parents=True, exist_ok=True)
+
+    if len(groups) >= _PARALLEL_DUMP_THRESHOLD:
+        # Groups are independent pure CPU/disk work, so fan them out across
+        # processes; each worker converts and writes its own files
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(
+                    _process_one_group, (i, group, config, str(prompts_dir), str(md_dir))
+                )
+                for i, group in enumerate(groups, 1)
+            ]
+            for future in as_completed(futures):
+                i, valid_in_group = future.result()
+                if valid_in_group:
+                    print(f"  Group {i}: {valid_in_group} valid posts")
+                else:
+                    print(f"  Group {i}: No valid posts (all filtered)")
+    else:
+        # File writes go through a single writer thread so the generation loop
+        # keeps converting the next group while the disk drains
+        write_queue: "queue.Queue" = queue.Queue()
+        writer = threading.Thread(target=_file_writer, args=(write_queue,), daemon=True)
+        writer.start()
+
+        # Identical for every group; build once so all dumps share the objects
+        system_blocks = get_system_blocks()
+
+        for i, group in enumerate(groups, 1):
+            markdown, valid_in_group = converter.convert_group_with_count(group, i)
+            if markdown:
+                # Generate the user prompt
+                user_prompt = get_extraction_prompt(markdown)
+
+                # Create the full prompt structure
+                prompt_data = {
+                    "group_index": i,
+                    "system": system_blocks,
+                    "user_prompt": user_prompt,
+                    "model": config.model,
+                    "temperature": config.temperature,
+                    "max_tokens": config.max_tokens,
+                }
+
+                # Save prompt to file
+                prompt_path = prompts_dir / f"group_{i}_prompt.json"
+                write_queue.put((prompt_path, _json_dumps_bytes(prompt_data)))
+
+                # Also save a human-readable version
+                readable_path = prompts_dir / f"group_{i}_prompt.md"
+                write_queue.put(
+                    (readable_path, _README_HEADER_BYTES + user_prompt.encode("utf-8") + b"\n")
+                )
+
+                # Also save markdown for review
+                md_path = md_dir / f"group_{i}.md"
+                write_queue.put((md_path, markdown.encode("utf-8")))
+
+                print(f"  Group {i}: {valid_in_group} valid posts -> {prompt_path}")
+            else:
+                print(f"  Group {i}: No valid posts (all filtered)")
+
+        # Flush the writer before reporting completion
+        write_queue.put(None)
+        writer.join()
 
     print(f"\nPrompt generation complete!")
-    print(f"  Prompt files saved to: {os.path.join(config.output_dir, 'prompts')}")
-    print(f"  Markdown files saved to: {os.path.join(config.output_dir, 'markdown')}")
+    print(f"  Prompt files saved to: {prompts_dir}")
+    print(f"  Markdown files saved to: {md_dir}")
 
 
 def progress_callback(current: int, total: int, result):
@@ -262,6 +425,26 @@ def progress_callback(current: int, total: int, result):
     print(f"    -> Extracted {posts_extracted} posts, {result.tokens_used} tokens, {result.processing_time:.2f}s")
 
 
+def _extract_title_content(posts: list) -> tuple:
+    """
+    Extract (titles, contents) as two parallel lists, one pass over posts.
+
+    Pulling the nested-dict walks out of the filter loop leaves the loop
+    itself iterating plain strings.
+
+    Args:
+        posts: List of post dictionaries
+
+    Returns:
+        Tuple of (titles, contents) lists aligned with posts
+    """
+    from shared import get_post_title, get_main_content
+
+    titles = [get_post_title(post) or "" for post in posts]
+    contents = [get_main_content(post) or "" for post in posts]
+    return titles, contents
+
+
 def apply_keyword_filter(posts: list, config: UnifiedConfig, verbose: bool = True) -> list:
     """
     Apply keyword-based filtering to posts.
@@ -274,22 +457,31 @@ def apply_keyword_filter(posts: list, config: UnifiedConfig, verbose: bool = Tru
     Returns:
         Filtered list of posts
     """
-    from shared import should_skip_by_keywords, get_post_title, get_main_content
+    from shared import should_skip_by_keywords
 
     skip_keywords = config.skip_keywords
+    # One automaton pass per text instead of a substring scan per keyword
+    # (cached on the config, so it is built once across stages/runs)
+    automaton = config.skip_keyword_automaton
     filtered = []
     skipped_count = 0
 
-    for post in posts:
-        title = get_post_title(post) or ""
-        content = get_main_content(post) or ""
+    # SoA: resolve the nested dict lookups once, then iterate plain strings
+    titles, contents = _extract_title_content(posts)
 
-        if should_skip_by_keywords(title, skip_keywords):
-            skipped_count += 1
-            continue
-        if should_skip_by_keywords(content, skip_keywords):
-            skipped_count += 1
-            continue
+    for post, title, content in zip(posts, titles, contents):
+        if automaton is not None:
+            if (next(automaton.iter(title), None) is not None
+                    or next(automaton.iter(content), None) is not None):
+                skipped_count += 1
+                continue
+        else:
+            if should_skip_by_keywords(title, skip_keywords):
+                skipped_count += 1
+                continue
+            if should_skip_by_keywords(content, skip_keywords):
+                skipped_count += 1
+                continue
 
         filtered.append(post)
 
@@ -305,6 +497,8 @@ def run_extraction(
     dry_run: bool = False,
     dump_prompt: bool = False,
     max_posts: Optional[int] = None,
+    batch_api: bool = False,
+    warm_cache: bool = True,
     verbose: bool = True,
 ) -> Optional[str]:
     """
@@ -318,6 +512,9 @@ def run_extraction(
         dry_run: Only convert to markdown, don't call API
         dump_prompt: Dump prompts without calling API
         max_posts: Maximum number of posts to process
+        batch_api: Submit groups via the Message Batches API (anthropic only)
+        warm_cache: Issue a tiny warm-up request so every real request
+            hits the prompt cache (anthropic only, skipped for batch_api)
         verbose: Print progress messages
 
     Returns:
@@ -372,17 +569,12 @@ def run_extraction(
         print("=== Interview Information Extraction Pipeline ===")
         print()
 
-    # Load posts
-    posts = load_posts_from_json(input_file)
-    total_posts = len(posts)
-
-    # Apply max-posts limit if specified
-    if max_posts is not None and max_posts < total_posts:
-        posts = posts[:max_posts]
-        if verbose:
-            print(f"Loaded {total_posts} posts from {input_file}, using first {len(posts)}")
-    else:
-        if verbose:
+    # Load posts (streamed, so --max-posts never parses the tail)
+    posts = list(islice(stream_posts_from_json(input_file), max_posts))
+    if verbose:
+        if max_posts is not None:
+            print(f"Loaded first {len(posts)} posts from {input_file} (limit {max_posts})")
+        else:
             print(f"Loaded {len(posts)} posts from {input_file}")
 
     initial_post_count = len(posts)
@@ -448,10 +640,15 @@ def run_extraction(
     )
 
     # Run extraction
-    results = extractor.extract_from_posts(
-        posts,
-        progress_callback=progress_callback if verbose else None
-    )
+    if batch_api:
+        results = extractor.extract_from_posts_batched(posts)
+    else:
+        if warm_cache:
+            extractor.warm_cache()
+        results = extractor.extract_from_posts(
+            posts,
+            progress_callback=progress_callback if verbose else None
+        )
 
     # Save results
     output_path = extractor.save_results(results)
@@ -506,6 +703,9 @@ def main():
         save_intermediate=not args.no_intermediate if args.no_intermediate else file_config.save_intermediate,
         delay_between_calls=args.delay if args.delay != 1.0 else file_config.delay_between_calls,
         min_content_length=file_config.min_content_length,
+        prompts_per_request=args.prompts_per_request,
+        use_cache=not args.no_cache,
+        max_input_tokens=args.max_input_tokens,
     )
 
     # Check API key (unless dry run or dump-prompt)
@@ -552,23 +752,24 @@ def main():
             config=config
         )
 
-        # Load posts
-        posts = load_posts_from_json(args.input_file)
-        total_posts = len(posts)
-
-        # Apply max-posts limit if specified
-        if args.max_posts is not None and args.max_posts < total_posts:
-            posts = posts[:args.max_posts]
-            print(f"Loaded {total_posts} posts from {args.input_file}, using first {len(posts)}")
+        # Load posts (streamed, so --max-posts never parses the tail)
+        posts = list(islice(stream_posts_from_json(args.input_file), args.max_posts))
+        if args.max_posts is not None:
+            print(f"Loaded first {len(posts)} posts from {args.input_file} (limit {args.max_posts})")
         else:
             print(f"Loaded {len(posts)} posts from {args.input_file}")
         print()
 
         # Run extraction
-        results = extractor.extract_from_posts(
-            posts,
-            progress_callback=progress_callback if args.verbose else None
-        )
+        if args.batch_api:
+            results = extractor.extract_from_posts_batched(posts)
+        else:
+            if not args.no_warm_cache:
+                extractor.warm_cache()
+            results = extractor.extract_from_posts(
+                posts,
+                progress_callback=progress_callback if args.verbose else None
+            )
 
         # Save results
         output_path = extractor.save_results(results, args.output)
@@ -4,6 +4,11 @@ from pathlib import Path
 
 import pytest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
@@ -13,8 +18,10 @@ from process_json import process_post
 
 def load_test_json(filename: str):
     path = Path(__file__).with_name(filename)
-    with path.open(encoding="utf-8") as f:
-        return json.load(f)
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def test_process_post_builds_expected_hierarchy(capsys: pytest.CaptureFixture[str]):
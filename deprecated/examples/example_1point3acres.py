@@ -12,6 +12,9 @@ Prerequisites:
 - Chrome MCP server available
 """
 
+import asyncio
+import atexit
+import functools
 import sys
 from pathlib import Path
 
@@ -22,10 +25,25 @@ sys.path.insert(0, str(WORKFLOWS_DIR))
 from onepoint3acres_workflow import (
     OnePoint3AcresWorkflow,
     OnePoint3AcresConfig,
+    BrowserIntegration,
     scrape_1point3acres
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_browser(client_type: str = "chrome") -> BrowserIntegration:
+    """
+    Lazy module-level browser singleton.
+
+    Launching/attaching to Chrome costs seconds; running the examples
+    back-to-back (--example all) should pay that once, not once per
+    example. Closed automatically at interpreter exit.
+    """
+    browser = BrowserIntegration(client_type=client_type)
+    atexit.register(browser.close)
+    return browser
+
+
 def example_simple_usage():
     """
     Simple usage with the convenience function.
@@ -41,7 +59,8 @@ def example_simple_usage():
         num_pages=1,           # Scrape 1 page
         posts_per_page=3,      # Parse first 3 posts
         output_dir="./output/simple_example",
-        verbose=True
+        verbose=True,
+        browser=_get_browser()
     )
 
     print("\n--- Results ---")
@@ -91,7 +110,8 @@ def example_advanced_usage():
         config=config,
         client_type="chrome",          # Use Chrome MCP client
         output_dir="./output/advanced_example",
-        verbose=True
+        verbose=True,
+        browser=_get_browser()
     )
 
     # Run the workflow
@@ -119,9 +139,50 @@ def example_advanced_usage():
     return result
 
 
+async def scrape_many(tags, max_concurrency: int = 4):
+    """
+    Scrape several tags concurrently.
+
+    Each scrape is network-bound (page loads, MCP round trips), so running
+    them in worker threads overlaps the waiting; the semaphore caps how
+    many tabs are in flight at once.
+
+    Args:
+        tags: List of (tag_name, tag_url) tuples
+        max_concurrency: Maximum scrapes running at the same time
+
+    Returns:
+        List of per-tag summary dicts, in tag order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # One resolved root Path, created up front; per-tag dirs are cheap joins
+    output_root = Path("./output/multi_tag").resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+
+    async def scrape_one(tag_name, tag_url):
+        async with semaphore:
+            print(f"\n>>> Scraping tag: {tag_name}")
+            result = await asyncio.to_thread(
+                scrape_1point3acres,
+                url=tag_url,
+                num_pages=1,
+                posts_per_page=2,
+                output_dir=output_root / tag_name,
+                verbose=True,
+            )
+            return {
+                "tag": tag_name,
+                "success": result.success,
+                "posts_parsed": result.summary.get("posts_successfully_parsed", 0)
+            }
+
+    return await asyncio.gather(*(scrape_one(name, url) for name, url in tags))
+
+
 def example_multi_tag_scraping():
     """
-    Example of scraping multiple tags/topics.
+    Example of scraping multiple tags/topics concurrently.
     """
     print("\n" + "=" * 60)
     print("Example 3: Multi-Tag Scraping")
@@ -134,24 +195,7 @@ def example_multi_tag_scraping():
         # Add more tags as needed
     ]
 
-    all_results = []
-
-    for tag_name, tag_url in tags[:1]:  # Only run first one for demo
-        print(f"\n>>> Scraping tag: {tag_name}")
-
-        result = scrape_1point3acres(
-            url=tag_url,
-            num_pages=1,
-            posts_per_page=2,
-            output_dir=f"./output/multi_tag/{tag_name}",
-            verbose=True
-        )
-
-        all_results.append({
-            "tag": tag_name,
-            "success": result.success,
-            "posts_parsed": result.summary.get("posts_successfully_parsed", 0)
-        })
+    all_results = asyncio.run(scrape_many(tags))
 
     print("\n--- Multi-Tag Summary ---")
     for r in all_results:
@@ -178,7 +222,8 @@ def example_resume_from_failure():
     workflow = OnePoint3AcresWorkflow(
         config=config,
         output_dir="./output/resume_example",
-        verbose=True
+        verbose=True,
+        browser=_get_browser()
     )
 
     # Resume from page 1, post 2 (skipping first 2 posts)
@@ -16,11 +16,14 @@ Success Criteria:
 - Downloaded file exists and contains post content
 """
 
+import atexit
+import functools
 import os
 import sys
 import json
 import time
 from pathlib import Path
+from urllib.parse import urljoin
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,14 +33,40 @@ from query_engine import QueryEngine
 from html_sanitizer import HTMLSanitizer
 
 
+@functools.lru_cache(maxsize=1)
+def _get_shared_browser() -> BrowserIntegration:
+    """
+    Lazy process-wide browser shared by all eval runs.
+
+    Chromium launch/attach costs seconds; a suite of evals should pay it
+    once, not per run. Closed automatically at interpreter exit.
+    """
+    browser = BrowserIntegration()
+    atexit.register(browser.close)
+    return browser
+
+
 class ForumNavigationEval:
     """Evaluation task for forum navigation workflow"""
 
+    # One constant snippet; only the locator literal varies per click, so
+    # the body isn't rebuilt (and the engine can reuse its parse). The
+    # locator is injected via json.dumps, which escapes quotes safely.
+    CLICK_JS = (
+        "() => {"
+        " const el = document.querySelector(%s);"
+        " if (!el) { return {success: false, error: 'Element not found'}; }"
+        " el.click();"
+        " return {success: true};"
+        " }"
+    )
+
     def __init__(self):
         self.browser = None
         self.query_engine = QueryEngine()
         self.sanitizer = HTMLSanitizer(max_tokens=8000)
         self.current_elements = []
+        self._last_url = None  # last URL seen; spares an IPC per click
         self.downloads_dir = Path("./downloads")
         self.downloads_dir.mkdir(exist_ok=True)
 
@@ -49,15 +78,15 @@ class ForumNavigationEval:
     def setup(self):
         """Initialize browser"""
         print("Setting up browser integration...")
-        self.browser = BrowserIntegration()
+        self.browser = _get_shared_browser()
         print("✅ Browser integration ready")
 
     def cleanup(self):
-        """Clean up resources"""
+        """Release resources (the shared browser stays up for later runs)"""
         if self.browser:
             print("\nCleaning up...")
-            self.browser.close()
-            print("✅ Browser closed")
+            self.browser = None
+            print("✅ Browser released")
 
     def navigate(self, url: str):
         """Navigate to URL"""
@@ -66,12 +95,54 @@ class ForumNavigationEval:
         if result.get("status") != "success":
             raise Exception(f"Navigation failed: {result}")
 
-        time.sleep(2)  # Wait for page load
-
-        current_url = self.browser.get_current_url()
+        # Guard on the cached pre-navigation URL: without it the probe
+        # can see readyState "complete" on the old document and return
+        # the stale URL
+        current_url = self._wait_until_navigated(prev_url=self._last_url)
+        self._last_url = current_url
         print(f"✅ Navigated to: {current_url}")
         return current_url
 
+    def _wait_until_navigated(self, prev_url: str = None, timeout: float = 10.0):
+        """
+        Wait for a navigation to settle instead of sleeping a fixed 2s.
+
+        Polls cheap signals — URL change (when prev_url is known) and
+        document.readyState — with exponential backoff, returning as soon
+        as the page is ready. Fast pages finish in ~100-300ms; timeout
+        stays the cap for slow ones.
+
+        Args:
+            prev_url: URL before the navigation, if known
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The current URL after the wait
+        """
+        start = time.time()
+        interval = 0.1
+        current_url = prev_url
+
+        while time.time() - start < timeout:
+            try:
+                current_url = self.browser.get_current_url()
+                if prev_url is None or current_url != prev_url:
+                    state = self.browser.playwright_client.browser_evaluate(
+                        function="() => document.readyState"
+                    )
+                    if "complete" in str(self.browser.handle_mcp_response(state)):
+                        break
+            except Exception:
+                pass  # probes can fail mid-navigation; retry after backoff
+
+            time.sleep(interval)
+            interval = min(interval * 2, 0.5)
+
+        if current_url is None:
+            current_url = self.browser.get_current_url()
+        self._last_url = current_url
+        return current_url
+
     def get_page_content(self):
         """Extract page content and interactable elements"""
         print("\n📄 Extracting page content...")
@@ -117,6 +188,45 @@ class ForumNavigationEval:
         print(f"✅ Found {len(matches)} matches")
         return matches
 
+    def find_target_post(self):
+        """
+        Find the target post in a single pass over the extracted elements.
+
+        Applies all fallback predicates (title text, thread ID in href,
+        partial 'OAI'/'面试' match) while walking the element list once,
+        instead of one linear scan per fallback.
+
+        Returns:
+            The best-matching element, or None
+        """
+        title_match = None       # target title appears in element text
+        thread_id_match = None   # link href carries the expected thread ID
+        partial_match = None     # thread link whose text hints at the post
+        thread_link_count = 0
+
+        for el in self.current_elements:
+            text = el.get('text', '')
+            if title_match is None and self.target_post_title in text:
+                title_match = el
+                break  # highest-priority bucket; nothing can beat it
+
+            if el.get('tag') != 'a':
+                continue
+            href = el.get('attributes', {}).get('href', '')
+            if 'thread-' not in href:
+                continue
+
+            thread_link_count += 1
+            if thread_id_match is None and 'thread-1155609' in href:
+                thread_id_match = el
+            elif partial_match is None and ('OAI' in text or '面试' in text):
+                partial_match = el
+
+        print(f"   Scanned {len(self.current_elements)} elements "
+              f"({thread_link_count} forum post links)")
+
+        return title_match or thread_id_match or partial_match
+
     def click_element(self, element: dict):
         """Click an element"""
         web_agent_id = element['web_agent_id']
@@ -129,19 +239,12 @@ class ForumNavigationEval:
 
         # For links, navigate directly to the href for more reliable behavior
         if element.get('tag') == 'a' and href:
-            # Build full URL if href is relative
-            current_url = self.browser.get_current_url()
-            if href.startswith('http'):
-                full_url = href
-            elif href.startswith('/'):
-                # Absolute path
-                from urllib.parse import urlparse
-                parsed = urlparse(current_url)
-                full_url = f"{parsed.scheme}://{parsed.netloc}{href}"
-            else:
-                # Relative path
-                base_url = current_url.rsplit('/', 1)[0]
-                full_url = f"{base_url}/{href}"
+            # urljoin covers absolute URLs, absolute/relative paths and the
+            # edge cases (./foo, ?page=2, fragments) the old branching
+            # mishandled, which used to force re-navigation retries. The
+            # cached URL avoids a browser round trip per click.
+            current_url = self._last_url or self.browser.get_current_url()
+            full_url = urljoin(current_url, href)
 
             print(f"   Navigating to: {full_url}")
             result = self.browser.playwright_client.browser_navigate(full_url)
@@ -149,31 +252,23 @@ class ForumNavigationEval:
             if result.get("status") != "success":
                 raise Exception(f"Navigation failed: {result}")
 
-            time.sleep(2)
-            new_url = self.browser.get_current_url()
+            new_url = self._wait_until_navigated(prev_url=current_url)
         else:
             # For non-links (buttons, etc.), use JavaScript click
             locator = element['locators']['data_id']
 
-            click_js = f"""
-            () => {{
-                const element = document.querySelector('{locator}');
-                if (element) {{
-                    element.click();
-                    return {{success: true}};
-                }} else {{
-                    return {{success: false, error: 'Element not found'}};
-                }}
-            }}
-            """
-
-            result = self.browser.playwright_client.browser_evaluate(function=click_js)
+            result = self.browser.playwright_client.browser_evaluate(
+                function=self.CLICK_JS % json.dumps(locator)
+            )
 
             if isinstance(result, dict) and result.get("status") != "success":
                 raise Exception(f"Click failed: {result}")
 
-            time.sleep(2)  # Wait for navigation
-            new_url = self.browser.get_current_url()
+            # The old document still reports readyState "complete" right
+            # after the click, so wait for the URL to move off the cached
+            # one before trusting the probe; otherwise the pre-click URL
+            # leaks into _last_url and becomes the next urljoin base
+            new_url = self._wait_until_navigated(prev_url=self._last_url)
 
         print(f"✅ Clicked successfully")
         print(f"   New URL: {new_url}")
@@ -202,8 +297,7 @@ Title: {title}
 -->
 
 """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(metadata + html)
+        filepath.write_text(metadata + html, encoding='utf-8')
 
         print(f"✅ Downloaded to: {filepath.absolute()}")
         print(f"   URL: {url}")
@@ -251,58 +345,11 @@ Title: {title}
             print("=" * 70)
             print(f"   Looking for post containing: '{self.target_post_title}'")
 
-            # Try to find the post by text
-            post_matches = self.find_by_text(self.target_post_title, exact=False)
-
-            if not post_matches:
-                # Try alternative approach: query for forum post links
-                print("   Trying alternative approach: querying forum post links...")
-                all_links = self.query_elements(filters={"tag": "a"})
-
-                # Filter for links that look like forum posts (have thread- pattern)
-                forum_post_links = [
-                    link for link in all_links
-                    if link.get('attributes', {}).get('href', '').find('thread-') >= 0
-                ]
-
-                print(f"   Found {len(forum_post_links)} forum post links")
-
-                # Show first 10 post titles for debugging
-                print("   Sample post titles:")
-                for i, link in enumerate(forum_post_links[:10]):
-                    print(f"      [{i}] {link.get('text', '')[:60]}")
-
-                # Filter manually for the target title
-                post_matches = [
-                    link for link in all_links
-                    if self.target_post_title in link.get('text', '')
-                ]
-
-                # If still not found, try searching by thread ID (most reliable)
-                if not post_matches:
-                    print(f"   Trying to find post by thread ID 1155609...")
-                    post_matches = [
-                        link for link in forum_post_links
-                        if 'thread-1155609' in link.get('attributes', {}).get('href', '')
-                    ]
-
-                # If still not found, try partial match on key terms
-                if not post_matches:
-                    print(f"   Trying partial match on 'OAI' or '面试'...")
-                    post_matches = [
-                        link for link in forum_post_links
-                        if 'OAI' in link.get('text', '') or '面试' in link.get('text', '')
-                    ]
-                    if post_matches:
-                        print(f"   Found {len(post_matches)} posts with partial match:")
-                        for i, link in enumerate(post_matches[:5]):
-                            print(f"      [{i}] {link.get('text', '')[:80]}")
-                            print(f"          href: {link.get('attributes', {}).get('href', '')}")
-
-            if not post_matches:
-                raise Exception(f"Could not find post with title containing '{self.target_post_title}'")
+            # One pass over the elements evaluates every fallback predicate
+            target_post = self.find_target_post()
 
-            target_post = post_matches[0]
+            if not target_post:
+                raise Exception(f"Could not find post with title containing '{self.target_post_title}'")
             print(f"✅ Found target post!")
             print(f"   Element ID: {target_post['web_agent_id']}")
             print(f"   Text: {target_post.get('text', '')[:100]}")
@@ -4,24 +4,45 @@ Extract job posting content from OpenAI career page HTML files.
 """
 
 import json
+import re
 from pathlib import Path
 from bs4 import BeautifulSoup
 
-
-def extract_job_content(html_file_path):
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = 'lxml'  # C-backed parser, much faster on large job pages
+except ImportError:
+    BS_PARSER = 'html.parser'
+
+# Section headers mapped to job_data keys
+_HEADER_MAP = {
+    'about the team': 'about_the_team',
+    'about the role': 'about_the_role',
+    'you might thrive in this role if you': 'you_might_thrive',
+    'about openai': 'about_openai',
+    'compensation and benefits': 'compensation_and_benefits',
+}
+
+# One C-implemented split produces [prelude, header, body, header, body,
+# ...] for the whole document, replacing the per-line state machine
+_SECTION_SPLIT = re.compile(
+    r'(?mi)^\s*(about the team|about the role|'
+    r'you might thrive in this role if you|about openai|'
+    r'compensation and benefits)\s*:?\s*$'
+)
+
+
+def extract_job_content(html_content):
     """
-    Extract structured job information from an OpenAI career page HTML file.
+    Extract structured job information from OpenAI career page HTML.
 
     Args:
-        html_file_path: Path to the HTML file
+        html_content: Raw HTML of the job page
 
     Returns:
         Dictionary containing extracted job information
     """
-    with open(html_file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, BS_PARSER)
 
     # Extract job information
     job_data = {
@@ -51,53 +72,22 @@ def extract_job_content(html_file_path):
         text_content = main_content.get_text(separator='\n', strip=True)
         job_data['raw_text'] = text_content
 
-        # Try to extract sections by looking for common headings
-        sections = {
-            'About the team': 'about_the_team',
-            'About the role': 'about_the_role',
-            'You might thrive in this role if you': 'you_might_thrive',
-            'About OpenAI': 'about_openai',
-            'Compensation and Benefits': 'compensation_and_benefits'
-        }
-
-        # Find all headings and their content
-        all_text = text_content.split('\n')
-        current_section = None
-        section_content = []
-
-        for line in all_text:
-            line = line.strip()
-            if not line:
+        # One split yields [prelude, header, body, header, body, ...];
+        # walk the (header, body) pairs instead of scanning line by line
+        parts = _SECTION_SPLIT.split(text_content)
+        for i in range(1, len(parts) - 1, 2):
+            key = _HEADER_MAP[parts[i].lower()]
+            section_content = [
+                stripped
+                for stripped in (raw.strip() for raw in parts[i + 1].split('\n'))
+                if stripped
+            ]
+            if not section_content:
                 continue
-
-            # Check if this line is a section header
-            is_header = False
-            for header, key in sections.items():
-                if header.lower() in line.lower() and len(line) < 100:
-                    # Save previous section
-                    if current_section and section_content:
-                        content_text = '\n'.join(section_content)
-                        if current_section in ['about_the_team', 'about_the_role', 'compensation_and_benefits', 'about_openai']:
-                            job_data[current_section] = content_text
-                        elif current_section == 'you_might_thrive':
-                            job_data['you_might_thrive'] = section_content
-
-                    # Start new section
-                    current_section = key
-                    section_content = []
-                    is_header = True
-                    break
-
-            if not is_header and current_section:
-                section_content.append(line)
-
-        # Save last section
-        if current_section and section_content:
-            content_text = '\n'.join(section_content)
-            if current_section in ['about_the_team', 'about_the_role', 'compensation_and_benefits', 'about_openai']:
-                job_data[current_section] = content_text
-            elif current_section == 'you_might_thrive':
+            if key == 'you_might_thrive':
                 job_data['you_might_thrive'] = section_content
+            else:
+                job_data[key] = '\n'.join(section_content)
 
     return job_data
 
@@ -113,8 +103,8 @@ def main():
 
     print(f"Extracting content from: {html_file}")
 
-    # Extract job data
-    job_data = extract_job_content(html_file)
+    # Extract job data (string-in API; callers own the file read)
+    job_data = extract_job_content(html_file.read_text(encoding='utf-8'))
 
     # Save to JSON
     output_file = html_file.with_suffix('.json')
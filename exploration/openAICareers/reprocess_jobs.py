@@ -10,40 +10,119 @@ This script:
 
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json remains the fallback encoder
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from utils import extract_job_content_cached, open_extraction_cache
+
+# Per-process cache connection, opened lazily by the first job a pool
+# worker handles (sqlite connections don't survive pickling)
+_cache_conn = None
 
-from utils import extract_job_content
 
+def _get_cache_conn(cache_path: str):
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = open_extraction_cache(cache_path)
+    return _cache_conn
 
-def get_original_info_from_json(json_path: Path, html_filename: str) -> Optional[Dict]:
+
+def load_original_info_index(json_path: Optional[Path]) -> Dict[str, Dict]:
     """
-    Try to find the original job info from existing JSON file.
+    Build a filename -> original_info index from an existing JSON file.
+
+    One parse and one pass over the jobs list replaces a linear scan per
+    HTML file, so lookups during reprocessing are O(1).
 
     Args:
-        json_path: Path to all_jobs_extracted.json
-        html_filename: HTML filename to match
+        json_path: Path to all_jobs_extracted.json, or None
 
     Returns:
-        Original info dict if found, None otherwise
+        Dict keyed by HTML filename (empty when missing or unreadable)
     """
-    if not json_path.exists():
-        return None
+    if not json_path or not json_path.exists():
+        return {}
 
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(json_path.read_bytes())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        jobs = data.get('jobs', [])
+        schema = data.get('schema')
+        if schema and jobs and isinstance(jobs[0], list):
+            # SoA layout written by scrape_all_jobs: schema + rows
+            html_idx = schema.index('html_file')
+            info_idx = schema.index('original_info')
+            return {
+                Path(row[html_idx] or '').name: row[info_idx] or {}
+                for row in jobs
+            }
+        return {
+            Path(job.get('html_file', '')).name: job.get('original_info', {})
+            for job in jobs
+        }
+    except Exception:
+        return {}
 
-        for job in data.get('jobs', []):
-            html_file = job.get('html_file', '')
-            if html_file.endswith(html_filename):
-                return job.get('original_info', {})
 
-    except Exception:
-        pass
+def _process_one(args: Tuple[str, Optional[Dict], str]) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Read and extract one HTML file (top-level so it pickles for the pool).
 
-    return None
+    Args:
+        args: (html_path, original_info, cache_path) triple;
+            original_info may be None
+
+    Returns:
+        (job_data, None) on success, (None, failure) on error
+    """
+    html_path_str, original_info, cache_path = args
+    html_path = Path(html_path_str)
+
+    try:
+        html_content = html_path.read_text(encoding='utf-8')
+
+        # Unchanged pages hit the content-hash cache instead of reparsing
+        extracted_data = extract_job_content_cached(
+            html_content, _get_cache_conn(cache_path)
+        )
+
+        # Keep the aggregated JSON lean: raw_text is the full page text
+        # (tens of KB per job) and some extractor variants include it.
+        # Anyone needing it can re-read the HTML alongside.
+        extracted_data.pop('raw_text', None)
+
+        # Build original_info from extracted data if not found
+        if not original_info:
+            original_info = {
+                'title': extracted_data.get('title'),
+                'url': extracted_data.get('application_link', '').replace('/application', '') if extracted_data.get('application_link') else '',
+                'team': extracted_data.get('team'),
+            }
+
+        job_data = {
+            'original_info': original_info,
+            'extracted': extracted_data,
+            'html_file': f"jobs/{html_path.name}",
+            'scraped_at': datetime.now().isoformat()
+        }
+        return job_data, None
+
+    except Exception as e:
+        return None, {
+            'file': html_path.name,
+            'error': str(e)
+        }
 
 
 def reprocess_html_files(jobs_dir: Path, output_file: Path, existing_json: Optional[Path] = None) -> Dict:
@@ -61,43 +140,38 @@ def reprocess_html_files(jobs_dir: Path, output_file: Path, existing_json: Optio
     html_files = sorted(jobs_dir.glob('*.html'))
     print(f"Found {len(html_files)} HTML files to process")
 
+    # Index the existing JSON once; each file then costs one dict lookup
+    # instead of a scan over the whole jobs list
+    original_by_name = load_original_info_index(existing_json)
+
+    # Resolve original_info in the parent so workers receive plain tuples
+    cache_path = str(jobs_dir.parent / 'extractions.sqlite')
+    work_items = [
+        (str(html_path), original_by_name.get(html_path.name), cache_path)
+        for html_path in html_files
+    ]
+
     results = []
     failed = []
 
-    for i, html_path in enumerate(html_files):
-        print(f"[{i + 1}/{len(html_files)}] Processing: {html_path.name}")
-
-        try:
-            # Read HTML content
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            # Extract job content
-            extracted_data = extract_job_content(html_content)
-
-            # Try to get original info from existing JSON
-            original_info = None
-            if existing_json:
-                original_info = get_original_info_from_json(existing_json, html_path.name)
-
-            # Build original_info from extracted data if not found
-            if not original_info:
-                original_info = {
-                    'title': extracted_data.get('title'),
-                    'url': extracted_data.get('application_link', '').replace('/application', '') if extracted_data.get('application_link') else '',
-                    'team': extracted_data.get('team'),
-                }
-
-            job_data = {
-                'original_info': original_info,
-                'extracted': extracted_data,
-                'html_file': f"jobs/{html_path.name}",
-                'scraped_at': datetime.now().isoformat()
-            }
+    # Each file is independent CPU-bound parse work, so fan out across
+    # cores; results stream back in submission order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for i, (job_data, failure) in enumerate(
+            executor.map(_process_one, work_items, chunksize=4)
+        ):
+            html_path = html_files[i]
+            print(f"[{i + 1}/{len(html_files)}] Processing: {html_path.name}")
+
+            if failure:
+                print(f"    [ERROR] {failure['error']}")
+                failed.append(failure)
+                continue
 
             results.append(job_data)
 
             # Print summary
+            extracted_data = job_data['extracted']
             title = extracted_data.get('title', 'Unknown')
             locations = extracted_data.get('location', [])
             compensation = extracted_data.get('compensation', 'N/A')
@@ -110,13 +184,6 @@ def reprocess_html_files(jobs_dir: Path, output_file: Path, existing_json: Optio
             print(f"    Responsibilities: {responsibilities_count} items")
             print(f"    Qualifications: {qualifications_count} items")
 
-        except Exception as e:
-            print(f"    [ERROR] {e}")
-            failed.append({
-                'file': html_path.name,
-                'error': str(e)
-            })
-
     # Build final output
     final_output = {
         'source': 'reprocessed_html_files',
@@ -128,10 +195,14 @@ def reprocess_html_files(jobs_dir: Path, output_file: Path, existing_json: Optio
         'failed_jobs': failed
     }
 
-    # Save to file
+    # Save to file; orjson encodes the aggregated result (hundreds of
+    # long raw_text strings) in C and emits UTF-8 bytes directly
     print(f"\nSaving results to: {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(final_output, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(final_output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(final_output, f, indent=2, ensure_ascii=False)
 
     print(f"\n{'='*60}")
     print("REPROCESSING COMPLETE!")
@@ -9,11 +9,13 @@ This script:
 4. Saves all extractions to a single combined JSON file
 """
 
+import asyncio
 import os
 import sys
 import json
+import threading
 import time
-import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -28,34 +30,232 @@ from bs4 import BeautifulSoup
 from browser_integration import BrowserIntegration
 from utils import extract_job_content
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # browser-only scraping remains the fallback
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json remains the fallback encoder
+
+
+# Row layout for the combined JSON: per-job fields first, then the
+# extracted fields in the order utils.extract_job_content emits them.
+# Storing rows against this one schema instead of a dict per job keeps
+# the ~20 key strings out of every record, roughly halving the file.
+_EXTRACTED_FIELDS = (
+    'title', 'location', 'team', 'application_link', 'about_the_team',
+    'about_the_role', 'responsibilities', 'qualifications',
+    'you_might_thrive', 'about_openai', 'compensation'
+)
+_JOB_SCHEMA = ('original_info', 'html_file', 'scraped_at') + _EXTRACTED_FIELDS
+
+# Single C-level translate replaces the two per-job re.sub passes in
+# save_html: whitespace and filesystem-unsafe characters become '-',
+# other punctuation is dropped
+_FILENAME_TABLE = {ord(c): '-' for c in ' \t/\\:*?"<>|'}
+_FILENAME_TABLE.update({ord(c): None for c in "!#$%&'()+,.;=@[]^`{}~"})
+
+
+def load_scraped_urls(jsonl_path: Path) -> set:
+    """
+    Read the URLs already persisted to the incremental JSONL file.
+
+    Args:
+        jsonl_path: Path to all_jobs_extracted.jsonl
+
+    Returns:
+        Set of job URLs with a completed record on disk
+    """
+    done = set()
+    if not jsonl_path.exists():
+        return done
+
+    with open(jsonl_path, 'rb') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = orjson.loads(line) if orjson is not None else json.loads(line)
+            except Exception:
+                continue  # torn tail line from a killed run
+            url = (job.get('original_info') or {}).get('url')
+            if url:
+                done.add(url)
+    return done
+
+
+def _append_jsonl(fh, lock: threading.Lock, job_data: Dict) -> None:
+    """Append one job record to the shared JSONL file."""
+    if orjson is not None:
+        line = orjson.dumps(job_data) + b'\n'
+    else:
+        line = (json.dumps(job_data, ensure_ascii=False) + '\n').encode('utf-8')
+    with lock:
+        fh.write(line)
+        fh.flush()
+
+
+def jobs_to_rows(jobs: List[Dict]) -> List[List]:
+    """
+    Flatten job dicts into schema-ordered rows (SoA layout).
+
+    Args:
+        jobs: Job dicts as produced by scrape_job
+
+    Returns:
+        One list per job, ordered per _JOB_SCHEMA
+    """
+    rows = []
+    for job in jobs:
+        extracted = job.get('extracted', {})
+        rows.append(
+            [job.get('original_info'), job.get('html_file'), job.get('scraped_at')]
+            + [extracted.get(field) for field in _EXTRACTED_FIELDS]
+        )
+    return rows
+
+
+def rows_to_jobs(schema: List[str], rows: List[List]) -> List[Dict]:
+    """
+    Rebuild per-job dicts from schema-ordered rows.
+
+    Args:
+        schema: Field order the rows were written with
+        rows: Row lists as stored in the combined JSON
+
+    Returns:
+        Job dicts in the shape scrape_job produced them
+    """
+    jobs = []
+    for row in rows:
+        flat = dict(zip(schema, row))
+        jobs.append({
+            'original_info': flat.pop('original_info', None),
+            'html_file': flat.pop('html_file', None),
+            'scraped_at': flat.pop('scraped_at', None),
+            'extracted': flat
+        })
+    return jobs
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket limiting the global request rate.
+
+    Replaces the fixed 1s sleep between jobs: a worker only waits when
+    the pool as a whole would exceed the allowed rate, instead of every
+    worker idling after every job regardless of how fast the others are
+    going.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = 5.0):
+        """
+        Args:
+            rate: Tokens replenished per second (requests/second)
+            capacity: Maximum burst size
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last) * self._rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
 
 class OpenAIJobScraper:
     """Scrapes OpenAI job postings using BrowserIntegration."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, extract_pool: Optional[ProcessPoolExecutor] = None):
         """
         Initialize the scraper.
 
         Args:
             output_dir: Directory to save output files
+            extract_pool: Optional process pool for HTML extraction;
+                when set, parsing runs outside this worker's GIL
         """
         self.output_dir = output_dir
+        self.extract_pool = extract_pool
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.jobs_html_dir = output_dir / "jobs"
         self.jobs_html_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize browser integration (Chrome MCP)
-        print("[INFO] Initializing Chrome MCP browser integration...")
-        self.browser = BrowserIntegration(client_type="chrome")
-        print("[INFO] Browser integration initialized.")
-
-    def navigate_to_url(self, url: str, wait_seconds: float = 2.0) -> bool:
+        # Browser is launched lazily: job pages are server-rendered, so
+        # if every page takes the static path Chrome never starts at all
+        self._browser = None
+        self.static_hits = 0
+        self.browser_fallbacks = 0
+
+        # HTML files are written off the critical path so disk I/O
+        # overlaps the next navigation instead of serializing with it
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Plain-HTTP fast path: OpenAI job pages are server-rendered, so
+        # most can be fetched without navigate + render + fixed wait.
+        # Keep-alive pooling amortizes TCP+TLS handshakes across jobs.
+        self.http = None
+        if httpx is not None:
+            client_kwargs = dict(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=32
+                ),
+                timeout=30,
+                follow_redirects=True,
+                headers={
+                    'User-Agent': (
+                        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                    )
+                }
+            )
+            try:
+                # Nearly all fetches hit the one careers host; HTTP/2
+                # multiplexes them over a single TCP+TLS connection, so
+                # only the first request pays a handshake. Needs the
+                # optional h2 package.
+                self.http = httpx.Client(http2=True, **client_kwargs)
+            except ImportError:
+                self.http = httpx.Client(**client_kwargs)
+
+    @property
+    def browser(self) -> BrowserIntegration:
+        """Chrome MCP session, launched on the first browser-path fetch."""
+        if self._browser is None:
+            print("[INFO] Initializing Chrome MCP browser integration...")
+            self._browser = BrowserIntegration(client_type="chrome")
+            print("[INFO] Browser integration initialized.")
+        return self._browser
+
+    def navigate_to_url(self, url: str, timeout: float = 10.0) -> bool:
         """
-        Navigate to a URL.
+        Navigate to a URL and wait for the document to be ready.
+
+        The browser tab stays warm across jobs, so most pages reach
+        readiness in well under the old fixed 2s wait.
 
         Args:
             url: URL to navigate to
-            wait_seconds: Seconds to wait after navigation
+            timeout: Maximum seconds to wait for readiness
 
         Returns:
             True if navigation was successful
@@ -65,10 +265,53 @@ class OpenAIJobScraper:
             print(f"[ERROR] Navigation failed: {result.get('message', 'Unknown error')}")
             return False
 
-        # Wait for page load
-        time.sleep(wait_seconds)
+        # Poll document.readyState with backoff instead of sleeping a
+        # fixed interval; fall through on timeout and let extraction
+        # decide whether the page was usable
+        deadline = time.time() + timeout
+        delay = 0.1
+        while time.time() < deadline:
+            try:
+                probe = self.browser.playwright_client.browser_evaluate(
+                    function="() => document.readyState"
+                )
+                state = str(self.browser.handle_mcp_response(probe)).strip().strip('"').lower()
+                if state in ("interactive", "complete"):
+                    return True
+            except Exception:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
         return True
 
+    def fetch_job_html(self, url: str) -> Optional[str]:
+        """
+        Try fetching a job page over plain HTTP, skipping the browser.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content when the response carries the markers of a fully
+            rendered job page, None when the browser should be used instead
+        """
+        if self.http is None:
+            return None
+
+        try:
+            r = self.http.get(url)
+        except Exception as e:
+            print(f"    [HTTP] Fetch failed ({e}), falling back to browser")
+            return None
+
+        # Only trust the response if it looks like a rendered job page;
+        # anything else (bot challenge, client-rendered shell) goes
+        # through the browser path
+        if r.status_code == 200 and '<title>' in r.text and 'text-primary-100' in r.text:
+            return r.text
+        return None
+
     def get_page_html(self) -> Optional[str]:
         """
         Get the current page HTML.
@@ -85,27 +328,36 @@ class OpenAIJobScraper:
 
     def save_html(self, html_content: str, job_title: str) -> Path:
         """
-        Save HTML content to a file.
+        Save HTML content to a file, writing in the background.
+
+        The write is handed to the I/O pool and flushed no later than
+        close(); the caller only needs the path for bookkeeping.
 
         Args:
             html_content: HTML content to save
             job_title: Job title for filename
 
         Returns:
-            Path to saved file
+            Path the file is being written to
         """
         # Clean job title for filename
-        clean_title = re.sub(r'[^\w\s-]', '', job_title).strip()
-        clean_title = re.sub(r'[-\s]+', '-', clean_title).lower()[:80]
+        clean_title = job_title.translate(_FILENAME_TABLE).strip('-').lower()[:80]
 
-        filename = f"{clean_title}.html"
+        filename = f"{clean_title or 'untitled'}.html"
         filepath = self.jobs_html_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Encode here and write bytes, skipping the text-mode codec path
+        self._io_pool.submit(self._write_file, filepath, html_content.encode('utf-8'))
 
         return filepath
 
+    @staticmethod
+    def _write_file(filepath: Path, data: bytes) -> None:
+        try:
+            filepath.write_bytes(data)
+        except Exception as e:
+            print(f"[ERROR] Failed to write {filepath.name}: {e}")
+
     def scrape_job(self, job_info: Dict, index: int, total: int) -> Optional[Dict]:
         """
         Scrape a single job posting.
@@ -126,23 +378,37 @@ class OpenAIJobScraper:
         print(f"    Team: {team}")
         print(f"    URL: {url}")
 
-        # Navigate to job page
-        if not self.navigate_to_url(url, wait_seconds=2.0):
-            print(f"    [FAILED] Could not navigate to page")
-            return None
-
-        # Get page HTML
-        html_content = self.get_page_html()
-        if not html_content:
-            print(f"    [FAILED] Could not get page HTML")
-            return None
+        # Fast path: plain HTTP fetch, no navigation or render wait
+        html_content = self.fetch_job_html(url)
+        if html_content:
+            self.static_hits += 1
+            print(f"    [HTTP] Fetched without browser")
+        else:
+            self.browser_fallbacks += 1
+            # Navigate to job page
+            if not self.navigate_to_url(url):
+                print(f"    [FAILED] Could not navigate to page")
+                return None
+
+            # Get page HTML
+            html_content = self.get_page_html()
+            if not html_content:
+                print(f"    [FAILED] Could not get page HTML")
+                return None
 
         # Save HTML file
         html_path = self.save_html(html_content, title)
         print(f"    [SAVED] HTML: {html_path.name}")
 
-        # Extract job content using utility function
-        extracted_data = extract_job_content(html_content)
+        # Extract job content using utility function; with a pool the
+        # CPU-bound parse runs on another core while this worker's next
+        # navigation proceeds under the GIL
+        if self.extract_pool is not None:
+            extracted_data = self.extract_pool.submit(
+                extract_job_content, html_content
+            ).result()
+        else:
+            extracted_data = extract_job_content(html_content)
 
         # Merge with original job info
         job_data = {
@@ -181,10 +447,14 @@ class OpenAIJobScraper:
 
         results = []
         failed_jobs = []
+        limiter = _TokenBucket()
 
         for i, job_info in enumerate(jobs):
             actual_index = start_index + i
 
+            # Rate-limit instead of a fixed delay between requests
+            limiter.acquire()
+
             try:
                 job_data = self.scrape_job(job_info, actual_index, total)
                 if job_data:
@@ -203,10 +473,6 @@ class OpenAIJobScraper:
                     'error': str(e)
                 })
 
-            # Small delay between requests to be nice to the server
-            if i < len(jobs) - 1:
-                time.sleep(1.0)
-
         print(f"\n{'='*60}")
         print(f"Scraping complete: {len(results)}/{len(jobs)} successful")
         if failed_jobs:
@@ -216,9 +482,117 @@ class OpenAIJobScraper:
         return results, failed_jobs
 
     def close(self):
-        """Close the browser integration."""
-        if self.browser:
-            self.browser.close()
+        """Flush pending writes, then close the HTTP client and browser."""
+        self._io_pool.shutdown(wait=True)
+        if self.http:
+            self.http.close()
+        if self._browser:
+            self._browser.close()
+        if self.static_hits or self.browser_fallbacks:
+            print(
+                f"[INFO] Static fetches: {self.static_hits}, "
+                f"browser fallbacks: {self.browser_fallbacks}"
+            )
+
+
+async def scrape_jobs_async(
+    jobs: List[Dict],
+    output_dir: Path,
+    concurrency: int = 4,
+    requests_per_second: float = 5.0
+):
+    """
+    Scrape jobs concurrently with a small pool of browser sessions.
+
+    The workload is I/O-bound (navigation RTTs plus politeness waits), so
+    a 500-job run serialized behind one browser spends most of its time
+    idle. Each worker here owns its own scraper — a single MCP session
+    can't interleave navigations — and works through a round-robin shard
+    of the job list in a thread, overlapping the waits across workers.
+
+    Args:
+        jobs: List of job info dicts
+        output_dir: Directory to save output files
+        concurrency: Number of parallel browser sessions
+        requests_per_second: Global rate cap shared by all workers
+
+    Returns:
+        (results, failed_jobs) in original job order
+    """
+    total = len(jobs)
+
+    # Each finished job is appended to the JSONL immediately, so a
+    # killed run loses at most the jobs in flight; on restart the URLs
+    # already on disk are skipped
+    jsonl_path = output_dir / 'all_jobs_extracted.jsonl'
+    done_urls = load_scraped_urls(jsonl_path)
+    indexed = [
+        (i, job) for i, job in enumerate(jobs)
+        if job.get('url') not in done_urls
+    ]
+    if len(indexed) < total:
+        print(f"Resuming: {total - len(indexed)} jobs already in {jsonl_path.name}")
+    shards = [indexed[w::concurrency] for w in range(concurrency)]
+
+    # One bucket across the pool: politeness is a property of the target
+    # server, not of each worker
+    limiter = _TokenBucket(rate=requests_per_second, capacity=requests_per_second)
+
+    jsonl_file = open(jsonl_path, 'ab')
+    jsonl_lock = threading.Lock()
+
+    def run_shard(shard, extract_pool):
+        scraper = OpenAIJobScraper(output_dir, extract_pool=extract_pool)
+        out = []
+        try:
+            for idx, job_info in shard:
+                limiter.acquire()
+                try:
+                    job_data = scraper.scrape_job(job_info, idx, total)
+                    if job_data:
+                        _append_jsonl(jsonl_file, jsonl_lock, job_data)
+                    out.append((idx, job_data, None))
+                except Exception as e:
+                    out.append((idx, None, str(e)))
+        finally:
+            scraper.close()
+        return out
+
+    # Extraction is CPU-bound and would serialize the thread workers
+    # behind the GIL; one process pool shared by the pool of scrapers
+    # spreads the parses across cores
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as extract_pool:
+            shard_results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(run_shard, shard, extract_pool)
+                    for shard in shards if shard
+                )
+            )
+    finally:
+        jsonl_file.close()
+
+    results = []
+    failed_jobs = []
+    for idx, job_data, error in sorted(
+        item for shard in shard_results for item in shard
+    ):
+        if job_data:
+            results.append(job_data)
+        else:
+            failed_jobs.append({
+                'index': idx,
+                'job': jobs[idx],
+                'error': error or 'Scrape returned None'
+            })
+
+    print(f"\n{'='*60}")
+    print(f"Scraping complete: {len(results)}/{total} successful")
+    if failed_jobs:
+        print(f"Failed jobs: {len(failed_jobs)}")
+    print(f"{'='*60}")
+
+    return results, failed_jobs
 
 
 def main():
@@ -231,50 +605,51 @@ def main():
 
     # Read input JSON
     print(f"Reading jobs from: {input_file}")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(input_file.read_bytes())
+    else:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     jobs = data.get('jobs', [])
     print(f"Found {len(jobs)} jobs to process")
 
-    # Initialize scraper
-    scraper = OpenAIJobScraper(output_dir)
-
-    try:
-        # Scrape all jobs (you can adjust start_index and limit for testing)
-        # For testing, start with first 5 jobs:
-        # results, failed = scraper.scrape_all_jobs(jobs, start_index=0, limit=5)
-
-        # For full scrape:
-        results, failed = scraper.scrape_all_jobs(jobs, start_index=0, limit=None)
-
-        # Build final output
-        final_output = {
-            'source_file': str(input_file),
-            'scraped_at': datetime.now().isoformat(),
-            'total_jobs_in_source': len(jobs),
-            'total_jobs_scraped': len(results),
-            'total_jobs_failed': len(failed),
-            'jobs': results,
-            'failed_jobs': failed
-        }
-
-        # Save combined results
-        print(f"\nSaving combined results to: {output_file}")
+    # Scrape all jobs concurrently; each worker closes its own browser.
+    # Drop concurrency to 1 (or use OpenAIJobScraper.scrape_all_jobs
+    # directly) to debug sequentially
+    results, failed = asyncio.run(
+        scrape_jobs_async(jobs, output_dir, concurrency=4)
+    )
+
+    # Build final output; jobs go out as schema + rows (see _JOB_SCHEMA),
+    # readers rebuild dicts with rows_to_jobs
+    final_output = {
+        'source_file': str(input_file),
+        'scraped_at': datetime.now().isoformat(),
+        'total_jobs_in_source': len(jobs),
+        'total_jobs_scraped': len(results),
+        'total_jobs_failed': len(failed),
+        'schema': list(_JOB_SCHEMA),
+        'jobs': jobs_to_rows(results),
+        'failed_jobs': failed
+    }
+
+    # Save combined results; orjson encodes the aggregated result in C
+    # and emits UTF-8 bytes in one write
+    print(f"\nSaving combined results to: {output_file}")
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(final_output, option=orjson.OPT_INDENT_2))
+    else:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(final_output, f, indent=2, ensure_ascii=False)
 
-        print(f"\n{'='*60}")
-        print("SCRAPING COMPLETE!")
-        print(f"{'='*60}")
-        print(f"Total jobs scraped: {len(results)}")
-        print(f"Total jobs failed: {len(failed)}")
-        print(f"Results saved to: {output_file}")
-        print(f"HTML files saved to: {output_dir / 'jobs'}")
-
-    finally:
-        # Always close the browser
-        scraper.close()
+    print(f"\n{'='*60}")
+    print("SCRAPING COMPLETE!")
+    print(f"{'='*60}")
+    print(f"Total jobs scraped: {len(results)}")
+    print(f"Total jobs failed: {len(failed)}")
+    print(f"Results saved to: {output_file}")
+    print(f"HTML files saved to: {output_dir / 'jobs'}")
 
 
 if __name__ == '__main__':
@@ -3,9 +3,72 @@
 Utility functions for OpenAI job scraping and processing.
 """
 
+import hashlib
+import json
 import re
+import sqlite3
 from typing import Dict, List, Optional, Set
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json remains the fallback encoder
+
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = 'lxml'  # C-backed parser, much faster on large job pages
+except ImportError:
+    BS_PARSER = 'html.parser'
+
+try:
+    # Modest C engine; parses and queries without building BS4 tree
+    # objects at all, so it beats even the lxml-backed soup
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # the fused regex scan remains the fallback
+
+# Only build tree nodes for the tags the extractor actually reads; the
+# bulk of a career page is script/svg/nav chrome that never gets queried
+_JOB_PAGE_STRAINER = SoupStrainer(['main', 'title', 'p', 'a'])
+
+# One compiled alternation replaces five case-folded substring tests
+# (each allocating a lowered temporary) per line of page text. The
+# multiline form anchors to lines of < 100 chars containing a header,
+# mirroring the old per-line check, so one finditer pass over the whole
+# text yields every section boundary with the scan done in C.
+_SECTION_HEADER_RE = re.compile(
+    r'(?im)^(?=[^\n]{1,99}$)[^\n]*?'
+    r'(about the team|about the role|overview:|responsibilities:?|'
+    r'qualifications:?|you might thrive in this role if you|about openai)'
+    r'[^\n]*$'
+)
+
+# Salary ranges like "$220K – $320K", optionally with an equity suffix
+_SALARY_RE = re.compile(
+    r'\$[\d,]+K?\s*[–-]\s*\$[\d,]+K?(?:\s*\+?\s*(?:Offers\s+)?Equity)?'
+)
+
+# Header/link selectors, hoisted so find_all doesn't recompile per call
+_PRIMARY_CLASS_RE = re.compile(r'text-primary-100')
+_APP_LINK_RE = re.compile(r'jobs\.ashbyhq\.com.*application')
+
+_SECTION_KEYS = {
+    'about the team': 'about_the_team',
+    'about the role': 'about_the_role',
+    'overview:': 'about_the_role',  # Some pages use Overview instead
+    'responsibilities': 'responsibilities',
+    'responsibilities:': 'responsibilities',
+    'qualifications': 'qualifications',
+    'qualifications:': 'qualifications',
+    'you might thrive in this role if you': 'you_might_thrive',
+    'about openai': 'about_openai',
+}
 
 
 def extract_job_content(html_content: str) -> Dict:
@@ -18,8 +81,6 @@ def extract_job_content(html_content: str) -> Dict:
     Returns:
         Dictionary containing extracted job information
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-
     job_data = {
         'title': None,
         'location': [],  # Changed to list for multiple locations
@@ -34,6 +95,114 @@ def extract_job_content(html_content: str) -> Dict:
         'compensation': None,
     }
 
+    # Prefer the selectolax C engine; BS4 stays as the fallback for
+    # pages its parser chokes on (and for installs without selectolax)
+    text_content = None
+    if _SelectolaxParser is not None:
+        try:
+            text_content = _read_header_fields_selectolax(html_content, job_data)
+        except Exception:
+            text_content = None
+    if text_content is None:
+        text_content = _read_header_fields_bs4(html_content, job_data)
+
+    if text_content:
+        # One finditer pass locates every section header; the sections
+        # are then the slices between consecutive header lines, so the
+        # interpreter loops over ~5 sections instead of every line
+        header_matches = list(_SECTION_HEADER_RE.finditer(text_content))
+        for i, header_match in enumerate(header_matches):
+            end = (
+                header_matches[i + 1].start()
+                if i + 1 < len(header_matches)
+                else len(text_content)
+            )
+            section_key = _SECTION_KEYS[header_match.group(1).lower()]
+            section_content = [
+                line for line in text_content[header_match.end():end].split('\n')
+                if line
+            ]
+            if section_content:
+                _save_section(job_data, section_key, section_content)
+
+        # Extract compensation; the last salary-looking range wins, as it
+        # did when the old loop overwrote per matching line
+        salary_matches = _SALARY_RE.findall(text_content)
+        if salary_matches:
+            job_data['compensation'] = salary_matches[-1]
+
+    return job_data
+
+
+def _read_team_location(job_data: Dict, text: str) -> bool:
+    """
+    Parse a "Team - Location1 and Location2" header line into job_data.
+
+    Args:
+        job_data: Dictionary to update
+        text: Candidate header text
+
+    Returns:
+        True when the line carried team/location data
+    """
+    # Skip "Careers" text
+    if text == 'Careers' or ' - ' not in text:
+        return False
+
+    parts = text.split(' - ', 1)
+    job_data['team'] = parts[0].strip()
+    # Parse locations (can be "Location1 and Location2" or "Location1, Location2")
+    job_data['location'] = _parse_locations(parts[1].strip())
+    return True
+
+
+def _read_header_fields_selectolax(html_content: str, job_data: Dict) -> str:
+    """
+    Fill title/team/location/application_link using selectolax.
+
+    Args:
+        html_content: Raw HTML of job page
+        job_data: Dictionary to update
+
+    Returns:
+        Text of the main content area ('' when the page has none)
+    """
+    tree = _SelectolaxParser(html_content)
+
+    title_node = tree.css_first('title')
+    if title_node is not None:
+        job_data['title'] = title_node.text().replace(' | OpenAI', '').strip()
+
+    # Pattern: "Team - Location1 and Location2" in p.text-primary-100
+    for p in tree.css('p.text-primary-100'):
+        if _read_team_location(job_data, p.text(strip=True).strip()):
+            break
+
+    for a in tree.css('a[href*="jobs.ashbyhq.com"]'):
+        href = a.attributes.get('href') or ''
+        if 'application' in href:
+            job_data['application_link'] = href
+            break
+
+    main_node = tree.css_first('main') or tree.css_first('body')
+    if main_node is None:
+        return ''
+    return main_node.text(separator='\n', strip=True)
+
+
+def _read_header_fields_bs4(html_content: str, job_data: Dict) -> str:
+    """
+    Fill title/team/location/application_link using BeautifulSoup.
+
+    Args:
+        html_content: Raw HTML of job page
+        job_data: Dictionary to update
+
+    Returns:
+        Text of the main content area ('' when the page has none)
+    """
+    soup = BeautifulSoup(html_content, BS_PARSER, parse_only=_JOB_PAGE_STRAINER)
+
     # Extract title from page title
     title_tag = soup.find('title')
     if title_tag:
@@ -41,93 +210,72 @@ def extract_job_content(html_content: str) -> Dict:
 
     # Extract team and location from the header area
     # Pattern: "Team - Location1 and Location2" in p.text-primary-100
-    for p in soup.find_all('p', class_=re.compile(r'text-primary-100')):
-        text = p.get_text().strip()
-        # Skip "Careers" text
-        if text == 'Careers':
-            continue
-        # Parse "Team - Location" format
-        if ' - ' in text:
-            parts = text.split(' - ', 1)
-            job_data['team'] = parts[0].strip()
-            location_str = parts[1].strip()
-            # Parse locations (can be "Location1 and Location2" or "Location1, Location2")
-            locations = _parse_locations(location_str)
-            job_data['location'] = locations
+    for p in soup.find_all('p', class_=_PRIMARY_CLASS_RE):
+        if _read_team_location(job_data, p.get_text().strip()):
             break
 
     # Extract application link
-    for a in soup.find_all('a', href=re.compile(r'jobs\.ashbyhq\.com.*application')):
+    for a in soup.find_all('a', href=_APP_LINK_RE):
         job_data['application_link'] = a.get('href')
         break
 
-    # Get main content and extract text
-    main_content = soup.find('main') or soup.find('body')
-
-    if main_content:
-        text_content = main_content.get_text(separator='\n', strip=True)
-
-        # Extract location and team from header area
-        lines = text_content.split('\n')
-
-        # Define sections to extract - now includes Responsibilities and Qualifications
-        sections = {
-            'About the team': 'about_the_team',
-            'About the role': 'about_the_role',
-            'Overview:': 'about_the_role',  # Some pages use Overview instead
-            'Responsibilities:': 'responsibilities',
-            'Responsibilities': 'responsibilities',
-            'Qualifications:': 'qualifications',
-            'Qualifications': 'qualifications',
-            'You might thrive in this role if you': 'you_might_thrive',
-            'About OpenAI': 'about_openai',
-        }
-
-        current_section = None
-        section_content = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    # Get main content and extract text. The strained parse only kept the
+    # queried tags, so pages without <main> need one full reparse to
+    # reach <body>
+    main_content = soup.find('main')
+    if main_content is None:
+        main_content = BeautifulSoup(html_content, BS_PARSER).find('body')
 
-            # Check if this line is a section header
-            is_header = False
-            for header, key in sections.items():
-                if header.lower() in line.lower() and len(line) < 100:
-                    # Save previous section
-                    if current_section and section_content:
-                        _save_section(job_data, current_section, section_content)
-
-                    # Start new section
-                    current_section = key
-                    section_content = []
-                    is_header = True
-                    break
-
-            if not is_header and current_section:
-                section_content.append(line)
-
-            # Extract compensation (appears near the end)
-            if 'Compensation' in line or '$' in line:
-                # Look for salary pattern like "$220K – $320K"
-                salary_match = re.search(r'\$[\d,]+K?\s*[–-]\s*\$[\d,]+K?', line)
-                if salary_match:
-                    job_data['compensation'] = salary_match.group(0)
-
-        # Save last section
-        if current_section and section_content:
-            _save_section(job_data, current_section, section_content)
-
-        # Try to extract compensation from raw text if not found
-        if not job_data['compensation']:
-            comp_match = re.search(
-                r'\$[\d,]+K?\s*[–-]\s*\$[\d,]+K?(?:\s*\+?\s*(?:Offers\s+)?Equity)?',
-                text_content
-            )
-            if comp_match:
-                job_data['compensation'] = comp_match.group(0)
+    if main_content is None:
+        return ''
+    return main_content.get_text(separator='\n', strip=True)
+
+
+def open_extraction_cache(cache_path: str = 'extractions.sqlite') -> sqlite3.Connection:
+    """
+    Open (creating if needed) the on-disk extraction cache.
+
+    WAL mode lets several worker processes read and append concurrently;
+    the generous timeout covers writer contention during pool runs.
 
+    Args:
+        cache_path: Path to the SQLite cache file
+
+    Returns:
+        An open connection with the cache table present
+    """
+    conn = sqlite3.connect(cache_path, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS cache (h BLOB PRIMARY KEY, json BLOB)')
+    return conn
+
+
+def extract_job_content_cached(html_content: str, conn: sqlite3.Connection) -> Dict:
+    """
+    Extract job information, memoized by HTML content hash.
+
+    Re-runs and retries over unchanged pages cost a single SELECT
+    instead of a full parse.
+
+    Args:
+        html_content: Raw HTML of job page
+        conn: Cache connection from open_extraction_cache
+
+    Returns:
+        Dictionary containing extracted job information
+    """
+    h = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+    row = conn.execute('SELECT json FROM cache WHERE h = ?', (h,)).fetchone()
+    if row:
+        return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+
+    job_data = extract_job_content(html_content)
+    if orjson is not None:
+        payload = orjson.dumps(job_data)
+    else:
+        payload = json.dumps(job_data).encode('utf-8')
+    conn.execute('INSERT OR REPLACE INTO cache (h, json) VALUES (?, ?)', (h, payload))
+    conn.commit()
     return job_data
 
 
@@ -178,24 +326,9 @@ def _save_section(job_data: Dict, section_key: str, content: List[str]) -> None:
         job_data[section_key] = content
 
 
-def extract_skills(text: str) -> Set[str]:
-    """
-    Extract skills and technologies mentioned in text.
-
-    Args:
-        text: Job description text to analyze
-
-    Returns:
-        Set of skill names (lowercase)
-    """
-    if not text:
-        return set()
-
-    text_lower = text.lower()
-    skills_found = set()
-
-    # Define skill patterns with their canonical names
-    skill_patterns = {
+# Skill patterns with their canonical names, fused below into a single
+# alternation so each text is scanned once instead of ~60 times
+_SKILLS = tuple({
         # Programming Languages
         'python': r'\bpython\b',
         'go/golang': r'\b(?:go|golang)\b',
@@ -269,10 +402,95 @@ def extract_skills(text: str) -> Set[str]:
         'data analysis': r'\bdata\s+analysis\b',
         'security': r'\bsecurity\b',
         'networking': r'\bnetworking\b',
-    }
+    }.items())
+
+# Skills whose patterns can both match starting at the same position
+# (e.g. "ads systems" satisfies 'ads' and 'ads system'). An alternation
+# reports at most one alternative per position, so these stay out of the
+# union and get a plain re.search each — the same treatment the
+# automaton path gives its non-literal patterns.
+_OVERLAPPING_SKILLS = frozenset({'ads', 'ads system'})
+
+# One pass over the text with a named-group alternation replaces a
+# re.search per skill; the winning alternative's group name indexes back
+# into _SKILL_NAMES. The individual patterns only use non-capturing
+# groups, so m.lastgroup is always the skill-level group. Each
+# alternative is wrapped in a zero-width lookahead so a match consumes
+# no text and skills whose matches overlap at different positions (e.g.
+# "distributed system design" holding both 'distributed systems' and
+# 'system design') are all reported.
+_SKILL_NAMES = [name for name, _ in _SKILLS]
+_SKILL_UNION = re.compile(
+    '|'.join(
+        f'(?=(?P<s{i}>{pattern}))'
+        for i, (name, pattern) in enumerate(_SKILLS)
+        if name not in _OVERLAPPING_SKILLS
+    )
+)
+_UNION_EXCLUDED = tuple(
+    (name, re.compile(pattern))
+    for name, pattern in _SKILLS
+    if name in _OVERLAPPING_SKILLS
+)
+
+# Most skill patterns are plain \b-delimited words; with pyahocorasick
+# installed those go through one C automaton pass, and only the few
+# patterns with real regex features (alternations, lookarounds) still
+# hit the regex engine
+_LITERAL_SKILL_RE = re.compile(r'^\\b([a-z0-9]+)\\b$')
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_')
+_SKILL_AUTOMATON = None
+_REGEX_SKILLS = ()
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    _regex_skills = []
+    for _name, _pattern in _SKILLS:
+        _literal = _LITERAL_SKILL_RE.match(_pattern)
+        if _literal:
+            _SKILL_AUTOMATON.add_word(_literal.group(1), (_name, len(_literal.group(1))))
+        else:
+            _regex_skills.append((_name, re.compile(_pattern)))
+    _SKILL_AUTOMATON.make_automaton()
+    _REGEX_SKILLS = tuple(_regex_skills)
+
+
+def extract_skills(text: str) -> Set[str]:
+    """
+    Extract skills and technologies mentioned in text.
+
+    Args:
+        text: Job description text to analyze
+
+    Returns:
+        Set of skill names (lowercase)
+    """
+    if not text:
+        return set()
 
-    for skill_name, pattern in skill_patterns.items():
-        if re.search(pattern, text_lower):
-            skills_found.add(skill_name)
+    text_lower = text.lower()
 
+    if _SKILL_AUTOMATON is not None:
+        skills_found = set()
+        # One automaton pass over the text finds every literal skill;
+        # the manual boundary check reproduces the \b anchors so e.g.
+        # "javascript" doesn't light up "java"
+        for end, (name, word_len) in _SKILL_AUTOMATON.iter(text_lower):
+            start = end - word_len + 1
+            if start > 0 and text_lower[start - 1] in _WORD_CHARS:
+                continue
+            if end + 1 < len(text_lower) and text_lower[end + 1] in _WORD_CHARS:
+                continue
+            skills_found.add(name)
+        for name, pattern in _REGEX_SKILLS:
+            if pattern.search(text_lower):
+                skills_found.add(name)
+        return skills_found
+
+    skills_found = {
+        _SKILL_NAMES[int(m.lastgroup[1:])]
+        for m in _SKILL_UNION.finditer(text_lower)
+    }
+    for name, pattern in _UNION_EXCLUDED:
+        if pattern.search(text_lower):
+            skills_found.add(name)
     return skills_found
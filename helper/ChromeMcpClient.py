@@ -1,18 +1,329 @@
+import copy
+import functools
+import io
+import itertools
+import mmap
 import time
 import subprocess
+import sys
 import os
 import json
+import queue
+import selectors
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson  # C encoder/decoder; big win on screenshot/HTML payloads
+except ImportError:
+    orjson = None
+
+
+# Pick the codec once at import instead of branching per call. The
+# stdlib fallback reuses one JSONEncoder with compact separators, which
+# skips json.dumps's per-call setup and drops the whitespace bytes from
+# every line on the pipe.
+if orjson is not None:
+    def _rpc_dumps(obj: Dict[str, Any]) -> bytes:
+        """Encode one JSON-RPC message as a newline-terminated bytes line."""
+        return orjson.dumps(obj) + b"\n"
+
+    _rpc_loads = orjson.loads
+else:
+    _STDLIB_ENCODE = json.JSONEncoder(
+        separators=(",", ":"), ensure_ascii=False
+    ).encode
+
+    def _rpc_dumps(obj: Dict[str, Any]) -> bytes:
+        """Encode one JSON-RPC message as a newline-terminated bytes line."""
+        return _STDLIB_ENCODE(obj).encode("utf-8") + b"\n"
+
+    _rpc_loads = json.loads
+
+# Argument-dict encoder for the pre-serialized tool-call envelope
+if orjson is not None:
+    _args_dumps = orjson.dumps
+else:
+    def _args_dumps(obj: Dict[str, Any]) -> bytes:
+        return _STDLIB_ENCODE(obj).encode("utf-8")
+
+# Constant fragments of the tools/call envelope: only the id and the
+# arguments dict vary per request, so everything around them is
+# serialized once and spliced via writev. The per-tool middle fragment
+# (carrying the tool name) is cached on first use.
+_ENV_PREFIX = b'{"jsonrpc":"2.0","id":'
+_ENV_SUFFIX = b'}}\n'
+_ENV_MID_CACHE: Dict[str, bytes] = {}
+
+
+def _env_mid(tool_name: str) -> bytes:
+    mid = _ENV_MID_CACHE.get(tool_name)
+    if mid is None:
+        mid = _ENV_MID_CACHE.setdefault(
+            tool_name,
+            (',"method":"tools/call","params":{"name":'
+             f'{json.dumps(tool_name)},"arguments":').encode("utf-8")
+        )
+    return mid
+
+
+def _writev_all(fd: int, parts: List[bytes]):
+    """
+    Write several buffers to fd with one writev syscall, handling the
+    (rare, large-batch) partial-write case by flushing the remainder.
+    """
+    total = sum(len(p) for p in parts)
+    written = os.writev(fd, parts)
+    if written == total:
+        return
+    rest = b"".join(parts)[written:] if len(parts) > 1 else parts[0][written:]
+    while rest:
+        rest = rest[os.write(fd, rest):]
+
+
+def _pack(defaults, values) -> Dict[str, Any]:
+    """
+    Build a tool params dict from positional values, skipping defaults.
+
+    One comprehension over a precomputed (wire_name, default) table
+    replaces the per-method ladder of if statements; only arguments that
+    differ from the server-side default go on the wire.
+    """
+    return {
+        k: v for (k, d), v in zip(defaults, values)
+        if v != d and v is not None
+    }
+
+
+# (wire_name, default) table for _pack; chrome_click_element keeps a
+# hand-written body because of its scroll-into-view pre-step
+_CLICK_DEFAULTS = (
+    ("selector", None), ("coordinates", None),
+    ("waitForNavigation", False), ("timeout", 5000),
+)
+
+# Tools that read browser state without changing it. Any call to a tool
+# NOT in this set clears the SWR cache: after a navigation, click, fill,
+# keypress or tab change, every cached page/tab read is suspect.
+_READ_ONLY_TOOLS = frozenset((
+    "get_windows_and_tabs",
+    "chrome_get_web_content",
+    "chrome_get_interactive_elements",
+    "chrome_history",
+    "chrome_bookmark_search",
+    "chrome_screenshot",
+    "chrome_console",
+))
+
+
+def _swr(fresh: float = 2.0, stale: float = 30.0):
+    """
+    Stale-while-revalidate cache for idempotent read tools.
+
+    Crawler code tends to re-query the same state (tabs, page content,
+    history) several times while reasoning about a page. Results younger
+    than `fresh` seconds are returned straight from the per-client
+    cache; results younger than `stale` are returned immediately while a
+    background thread refreshes the entry; older entries fall through to
+    a normal synchronous call.
+
+    Every mutating tool call clears the whole cache (see
+    _invalidate_swr), so entries can only outlive the page they
+    describe within one uninterrupted run of reads. Callers get a deep
+    copy of the cached response, never the cached dict itself, so
+    mutating a returned response cannot corrupt later hits. Calls made
+    inside a batch() block skip the cache altogether: they return the
+    live placeholder dict that the flush completes in place.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if self._batch_queue is not None:
+                # Inside batch(): fn returns a pending placeholder that
+                # the flush updates in place. Caching it would freeze a
+                # never-completed response, and copying it would hand
+                # the caller a dict the flush can't update — so bypass
+                # the cache entirely and return the placeholder as-is.
+                return fn(self, *args, **kwargs)
+            key = (fn.__name__, repr(args), repr(sorted(kwargs.items())))
+            entry = self._swr_cache.get(key)
+            if entry is not None:
+                ts, value = entry
+                age = time.monotonic() - ts
+                if age < fresh:
+                    return copy.deepcopy(value)
+                if age < stale:
+                    if key not in self._swr_refreshing:
+                        self._swr_refreshing.add(key)
+
+                        def refresh():
+                            try:
+                                self._swr_cache[key] = (
+                                    time.monotonic(), fn(self, *args, **kwargs)
+                                )
+                            finally:
+                                self._swr_refreshing.discard(key)
+
+                        self._swr_executor.submit(refresh)
+                    return copy.deepcopy(value)
+
+            result = fn(self, *args, **kwargs)
+            self._swr_cache[key] = (time.monotonic(), result)
+            return copy.deepcopy(result)
+        return wrapper
+    return decorator
+
+
+# Generated wrappers from _TOOLS that get the _swr treatment, with their
+# (fresh, stale) windows; write/navigation tools must never be cached
+_SWR_TOOLS = {
+    "chrome_get_web_content": (2.0, 30.0),
+    "chrome_get_interactive_elements": (2.0, 30.0),
+}
+
+# Marks a generated-wrapper argument with no default (caller must pass it)
+_REQUIRED = "__required__"
+
+# Schema for the generated plain tool wrappers: per tool, the argument
+# table as (python_name, signature_default, server_default, wire_name)
+# plus the docstring. server_default is what the server assumes when the
+# key is absent, which is not always the signature default (textContent
+# defaults to True in Python but is still sent, because the server
+# default is off). Wrappers with extra client-side logic stay
+# hand-written in the class body.
+_TOOLS = {
+    "chrome_navigate": (
+        (
+            ("url", None, None, "url"),
+            ("refresh", False, False, "refresh"),
+            ("new_window", False, False, "newWindow"),
+            ("width", 1280, 1280, "width"),
+            ("height", 720, 720, "height"),
+        ),
+        """
+        Navigate to a URL or refresh the current tab.
+
+        Args:
+            url: URL to navigate to
+            refresh: Refresh the current active tab instead of navigating to a URL
+            new_window: Create a new window to navigate to the URL
+            width: Viewport width in pixels (default: 1280)
+            height: Viewport height in pixels (default: 720)
+        """,
+    ),
+    "chrome_close_tabs": (
+        (
+            ("tab_ids", None, None, "tabIds"),
+            ("url", None, None, "url"),
+        ),
+        """
+        Close one or more browser tabs.
+
+        Args:
+            tab_ids: Array of tab IDs to close. If not provided, will close the active tab.
+            url: Close tabs matching this URL. Can be used instead of tabIds.
+        """,
+    ),
+    "chrome_get_web_content": (
+        (
+            ("url", None, None, "url"),
+            ("text_content", True, False, "textContent"),
+            ("html_content", False, False, "htmlContent"),
+            ("selector", None, None, "selector"),
+        ),
+        """
+        Fetch content from a web page.
+
+        Args:
+            url: URL to fetch content from. If not provided, uses the current active tab
+            text_content: Get the visible text content of the page with metadata
+            html_content: Get the visible HTML content of the page
+            selector: CSS selector to get content from a specific element
+        """,
+    ),
+    "chrome_screenshot": (
+        (
+            ("name", None, None, "name"),
+            ("full_page", True, True, "fullPage"),
+            ("save_png", True, True, "savePng"),
+            ("store_base64", False, False, "storeBase64"),
+            ("selector", None, None, "selector"),
+            ("width", 800, 800, "width"),
+            ("height", 600, 600, "height"),
+        ),
+        """
+        Take a screenshot of the current page or a specific element.
+
+        Args:
+            name: Name for the screenshot, if saving as PNG
+            full_page: Store screenshot of the entire page (default: true)
+            save_png: Save screenshot as PNG file (default: true)
+            store_base64: Return screenshot in base64 format (default: false)
+            selector: CSS selector for element to screenshot
+            width: Width in pixels (default: 800)
+            height: Height in pixels (default: 600)
+        """,
+    ),
+    "chrome_get_interactive_elements": (
+        (
+            ("selector", None, None, "selector"),
+            ("text_query", None, None, "textQuery"),
+            ("include_coordinates", True, True, "includeCoordinates"),
+        ),
+        """
+        Get interactive elements from the current page.
+
+        Args:
+            selector: CSS selector to filter interactive elements
+            text_query: Text to search for within interactive elements (fuzzy search)
+            include_coordinates: Include element coordinates in the response (default: true)
+        """,
+    ),
+    "chrome_keyboard": (
+        (
+            ("keys", _REQUIRED, None, "keys"),
+            ("selector", None, None, "selector"),
+            ("delay", 0, 0, "delay"),
+        ),
+        """
+        Simulate keyboard events in the browser.
+
+        NOTE: This uses JavaScript dispatchEvent which creates untrusted events
+        (isTrusted: false). Modern React apps may ignore these for form submissions.
+        For form submissions, use type_into_element_and_submit() instead.
+
+        Args:
+            keys: Keys to simulate (e.g., "Enter", "Ctrl+C", "A,B,C" for sequence)
+            selector: CSS selector for the element to send keyboard events to (optional)
+            delay: Delay between key sequences in milliseconds (default: 0)
+        """,
+    ),
+}
+
 
 class MCPChromeClient:
     """Client for interacting with MCP Chrome Server via STDIO"""
 
+    # Pooled crawls create and touch many clients in hot loops; slots
+    # drop the per-instance __dict__ and speed up attribute access in
+    # the submission/dispatch path
+    __slots__ = (
+        "mcp_server_path", "mcp_command", "env", "process", "_next_id",
+        "_batch_queue", "_pending", "_lock", "_reader", "_stdout",
+        "_external_reader", "_rxbuf", "_stdin_fd",
+        "_swr_cache", "_swr_refreshing", "_swr_executor",
+        "debug", "_stderr_drainer",
+    )
+
     def __init__(
         self,
         mcp_server_path: str,
         mcp_command: Optional[List[str]] = None,
         env: Optional[Dict[str, str]] = None,
+        external_reader: bool = False,
+        debug: bool = False,
     ):
         """
         Initialize the Chrome MCP client.
@@ -22,14 +333,37 @@ class MCPChromeClient:
             mcp_command: Full command to start the MCP server. If None, defaults
                          to ["npx", "node", mcp_server_path].
             env: Environment variables to pass to the MCP server process.
+            external_reader: Skip the per-client reader thread; the owner
+                             (e.g. MCPChromePool) multiplexes this client's
+                             stdout and calls _on_readable() when it is ready.
+            debug: Forward the server's stderr output to this process's
+                   stderr instead of discarding it.
         """
         self.mcp_server_path = mcp_server_path
         self.mcp_command = mcp_command
-        self.env = os.environ.copy()
-        if env:
-            self.env.update(env)
+        # Only materialize an environment copy when there is an override;
+        # Popen treats None as "inherit", which skips the (surprisingly
+        # slow) os.environ iteration on every pool warm-up
+        self.env = None if env is None else {**os.environ, **env}
         self.process = None
-        self.request_id = 0
+        # itertools.count.__next__ is C-implemented and atomic under the
+        # GIL, so id allocation needs no lock
+        self._next_id = itertools.count(1).__next__
+        self._batch_queue = None
+        # In-flight requests: id -> Future, completed by the reader
+        # thread; one lock serializes id allocation and stdin writes
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._reader = None
+        self._stdout = None
+        self._external_reader = external_reader
+        self._rxbuf = bytearray()  # partial-line carry for _on_readable
+        self.debug = debug
+        self._stderr_drainer = None
+        # Stale-while-revalidate state for read-only tools (see _swr)
+        self._swr_cache: Dict[tuple, tuple] = {}
+        self._swr_refreshing = set()
+        self._swr_executor = ThreadPoolExecutor(max_workers=4)
         self._start_server()
 
     def _start_server(self):
@@ -45,120 +379,415 @@ class MCPChromeClient:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 env=self.env,
             )
+            # Raw fd for request framing: one write()/writev() syscall
+            # per submission, no buffering layer in between
+            self._stdin_fd = self.process.stdin.fileno()
+            if not self._external_reader:
+                # Wrap the raw pipe in a 1MB buffered reader: screenshot
+                # and full-page HTML replies arrive in few large read()
+                # syscalls with line splitting done in C, instead of the
+                # default 8KB buffer forcing many kernel crossings per
+                # response. Pool-owned clients skip this: the pool's
+                # selector loop reads the raw pipe via _on_readable().
+                self._stdout = io.BufferedReader(self.process.stdout, buffer_size=1 << 20)
+                self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+                self._reader.start()
+            # Always drain stderr: an unread PIPE deadlocks the server
+            # once the kernel buffer (~64KB) fills on a long crawl
+            self._stderr_drainer = threading.Thread(
+                target=self._drain_stderr, daemon=True
+            )
+            self._stderr_drainer.start()
             print("Chrome MCP server started successfully")
         except Exception as e:
             print(f"Failed to start Chrome MCP server: {e}")
             raise
 
-    def _send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a JSON-RPC request to the MCP server"""
-        if not self.process:
-            return {"status": "error", "message": "MCP server not started"}
+    @staticmethod
+    def _normalize_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a raw JSON-RPC response onto the client's status dicts."""
+        if "error" in response:
+            return {"status": "error", "message": response["error"]}
+        if "result" in response:
+            return {"status": "success", "result": response["result"]}
+        return {"status": "success", "result": response}
+
+    def _reader_loop(self):
+        """
+        Continuously read server replies and complete their futures.
 
-        self.request_id += 1
-        request = {
+        Submission is decoupled from completion: callers register a
+        Future under their request id, write, and wait on the Future.
+        Any number of requests can be in flight at once, from any
+        thread, and replies may arrive in any order. The old design
+        blocked on readline() inside each call, so throughput was
+        capped at one request per round trip.
+        """
+        try:
+            for line in iter(self._stdout.readline, b""):
+                self._dispatch_line(line)
+        except Exception:
+            pass
+        self._fail_pending()
+
+    def _dispatch_line(self, line: bytes):
+        """Complete the Future matching one reply line (by id)"""
+        try:
+            response = _rpc_loads(line)
+        except Exception:
+            return  # partial/garbage line; keep reading
+        with self._lock:
+            fut = self._pending.pop(response.get("id"), None)
+        if fut is not None and not fut.done():
+            fut.set_result(self._normalize_response(response))
+
+    def _fail_pending(self):
+        """EOF or broken pipe: fail whatever is still waiting"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_result({"status": "error", "message": "No response from server"})
+
+    def _on_readable(self) -> bool:
+        """
+        Drain available stdout bytes and dispatch complete lines.
+
+        Called by an external multiplexer (MCPChromePool's selector
+        loop) when this client's pipe is ready; partial lines carry over
+        in _rxbuf until the rest arrives.
+
+        Returns:
+            False on EOF (pending futures are failed), True otherwise
+        """
+        try:
+            data = os.read(self.process.stdout.fileno(), 1 << 16)
+        except OSError:
+            data = b""
+        if not data:
+            self._fail_pending()
+            return False
+        self._rxbuf += data
+        while True:
+            nl = self._rxbuf.find(b"\n")
+            if nl < 0:
+                break
+            line = bytes(self._rxbuf[:nl + 1])
+            del self._rxbuf[:nl + 1]
+            self._dispatch_line(line)
+        return True
+
+    def _drain_stderr(self):
+        """
+        Keep the server's stderr pipe empty so it can never block.
+
+        Output is discarded unless debug is set, in which case it is
+        forwarded to this process's stderr.
+        """
+        try:
+            for chunk in iter(lambda: self.process.stderr.read(1 << 12), b""):
+                if self.debug:
+                    sys.stderr.buffer.write(chunk)
+                    sys.stderr.buffer.flush()
+        except Exception:
+            pass  # pipe closed during shutdown
+
+    def _submit(self, method: str, params: Dict[str, Any]) -> Future:
+        """Register a Future for a new request id and write the request."""
+        request_id = self._next_id()
+        fut = Future()
+        self._pending[request_id] = fut
+        payload = _rpc_dumps({
             "jsonrpc": "2.0",
-            "id": self.request_id,
+            "id": request_id,
             "method": method,
             "params": params or {}
-        }
-
+        })
         try:
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json)
-            self.process.stdin.flush()
-
-            # Read response
-            response_line = self.process.stdout.readline()
-            if not response_line:
-                return {"status": "error", "message": "No response from server"}
-
-            response = json.loads(response_line.strip())
-
-            if "error" in response:
-                return {"status": "error", "message": response["error"]}
-            elif "result" in response:
-                return {"status": "success", "result": response["result"]}
-            else:
-                return {"status": "success", "result": response}
+            # Only the write itself needs serializing; id allocation and
+            # encoding happen outside the lock
+            with self._lock:
+                _writev_all(self._stdin_fd, [payload])
+        except Exception:
+            self._pending.pop(request_id, None)
+            raise
+        return fut
+
+    def _submit_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Future:
+        """
+        Register a Future and write one tools/call request.
+
+        The envelope is spliced from constant pre-serialized fragments —
+        only the id and the arguments dict are encoded per call, which
+        halves the JSON work on small-args tools, and the fragments go
+        out as one writev with no concatenation.
+        """
+        request_id = self._next_id()
+        fut = Future()
+        self._pending[request_id] = fut
+        parts = [
+            _ENV_PREFIX,
+            str(request_id).encode(),
+            _env_mid(tool_name),
+            _args_dumps(arguments or {}),
+            _ENV_SUFFIX,
+        ]
+        try:
+            with self._lock:
+                _writev_all(self._stdin_fd, parts)
+        except Exception:
+            self._pending.pop(request_id, None)
+            raise
+        return fut
+
+    def _invalidate_swr(self, tool_name: str):
+        """Drop all SWR-cached reads when a tool mutates browser state"""
+        if tool_name not in _READ_ONLY_TOOLS and self._swr_cache:
+            self._swr_cache.clear()
+
+    def submit_async(self, method: str, params: Dict[str, Any] = None) -> Future:
+        """
+        Issue a tool call without waiting for its reply.
+
+        Args:
+            method: Tool name (as for _make_request)
+            params: Tool arguments
+
+        Returns:
+            Future resolving to the usual status/result dict
+        """
+        self._invalidate_swr(method)
+        return self._submit_tool(method, params or {})
 
+    def _send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request to the MCP server and wait for the reply"""
+        if not self.process:
+            return {"status": "error", "message": "MCP server not started"}
+
+        try:
+            fut = self._submit(method, params or {})
         except Exception as e:
             print(f"Error communicating with MCP server: {e}")
             return {"status": "error", "message": str(e)}
 
+        return fut.result()
+
+    def _send_requests_pipelined(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC requests back-to-back, then collect replies.
+
+        The stdio connection is persistent, so instead of paying a full
+        write→read round trip per request, all requests go out in one
+        write/flush and the replies are matched back by id (they may
+        arrive out of order). Latency drops from K·RTT to roughly
+        1·RTT + K·send_time.
+
+        Args:
+            requests: List of {"method": ..., "params": ...} dicts
+
+        Returns:
+            List of response dicts in the same order as requests
+        """
+        if not self.process:
+            return [{"status": "error", "message": "MCP server not started"}] * len(requests)
+
+        futures: List[Future] = []
+        try:
+            # Register every future and encode every line first; only the
+            # writev itself holds the lock. The reader matches replies by id.
+            payload_parts = []
+            for req in requests:
+                request_id = self._next_id()
+                fut = Future()
+                self._pending[request_id] = fut
+                futures.append(fut)
+                payload_parts.append(_rpc_dumps({
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": req["method"],
+                    "params": req.get("params") or {}
+                }))
+            with self._lock:
+                # One writev submits the whole batch without concatenating
+                _writev_all(self._stdin_fd, payload_parts)
+        except Exception as e:
+            print(f"Error communicating with MCP server: {e}")
+            return [{"status": "error", "message": str(e)}] * len(requests)
+
+        return [fut.result() for fut in futures]
+
     def _make_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Make a tool call request to the MCP server"""
-        return self._send_request("tools/call", {
-            "name": method,
-            "arguments": params or {}
-        })
+        self._invalidate_swr(method)
+        if self._batch_queue is not None:
+            # Inside a batch() block: queue the call and hand back a
+            # placeholder that is filled in place when the batch flushes
+            placeholder = {
+                "status": "pending",
+                "message": "queued in batch; completed when the batch block exits"
+            }
+            self._batch_queue.append((
+                {"method": "tools/call", "params": {
+                    "name": method,
+                    "arguments": params or {}
+                }},
+                placeholder
+            ))
+            return placeholder
+
+        if not self.process:
+            return {"status": "error", "message": "MCP server not started"}
+        try:
+            fut = self._submit_tool(method, params or {})
+        except Exception as e:
+            print(f"Error communicating with MCP server: {e}")
+            return {"status": "error", "message": str(e)}
+        return fut.result()
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect tool calls made inside the block and flush them as one
+        pipelined submission on exit.
+
+        Calls issued inside the block return placeholder dicts
+        ({"status": "pending", ...}); after the block exits each
+        placeholder has been updated in place with the real response, so
+        N dependent-looking round trips collapse into one write plus one
+        read loop:
+
+            with client.batch():
+                shot = client.chrome_screenshot(name="a")
+                content = client.chrome_get_web_content()
+            # shot / content now hold the actual responses
+        """
+        if self._batch_queue is not None:
+            # Nested batch: let the outermost block own the flush
+            yield self
+            return
+
+        self._batch_queue = []
+        try:
+            yield self
+        finally:
+            queued, self._batch_queue = self._batch_queue, None
+            if queued:
+                responses = self._send_requests_pipelined(
+                    [request for request, _ in queued]
+                )
+                for (_, placeholder), response in zip(queued, responses):
+                    placeholder.clear()
+                    placeholder.update(response)
+
+    def chain(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute dependent tool calls in order, aborting on the first error.
+
+        The typical crawler sequence — navigate, inspect, click — is a
+        chain where each call needs the previous one to have succeeded
+        and often needs a piece of its result. Each step is
+        {"name": tool, "arguments": {...}}; an argument value may be a
+        callable taking the list of responses so far, evaluated just
+        before the step is sent, to wire a predecessor's result in:
+
+            client.chain([
+                {"name": "chrome_navigate", "arguments": {"url": url}},
+                {"name": "chrome_get_interactive_elements", "arguments": {}},
+                {"name": "chrome_click_element", "arguments": {
+                    "selector": lambda prior: pick_selector(prior[1]),
+                }},
+            ])
+
+        Once a step fails, the remaining steps are not sent and come
+        back as error dicts, so a broken navigation never triggers the
+        clicks that depended on it. Chain only idempotent or safely
+        abortable calls. Runs outside any batch() block, since every
+        step needs its predecessor's real response.
+
+        Args:
+            steps: List of {"name": ..., "arguments": {...}} dicts
+
+        Returns:
+            List of response dicts, one per step, in order
+        """
+        responses: List[Dict[str, Any]] = []
+        failed_at = None
+        for i, step in enumerate(steps):
+            if failed_at is not None:
+                responses.append({
+                    "status": "error",
+                    "message": f"chain aborted: step {failed_at} failed"
+                })
+                continue
+            arguments = {
+                k: (v(responses) if callable(v) else v)
+                for k, v in (step.get("arguments") or {}).items()
+            }
+            # Bypass _make_request so a surrounding batch() cannot queue
+            # a placeholder where the next step expects a real response
+            self._invalidate_swr(step["name"])
+            response = self._send_request("tools/call", {
+                "name": step["name"],
+                "arguments": arguments
+            })
+            responses.append(response)
+            if response.get("status") != "success":
+                failed_at = i
+        return responses
+
+    def call_tools_pipelined(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Invoke several tools in one pipelined batch.
+
+        Args:
+            calls: List of {"name": tool_name, "arguments": params} dicts
+
+        Returns:
+            List of response dicts in call order
+        """
+        for call in calls:
+            self._invalidate_swr(call["name"])
+        return self._send_requests_pipelined([
+            {
+                "method": "tools/call",
+                "params": {"name": call["name"], "arguments": call.get("arguments") or {}}
+            }
+            for call in calls
+        ])
+
+    def is_alive(self) -> bool:
+        """Whether the MCP server subprocess is still running"""
+        return self.process is not None and self.process.poll() is None
 
     def close(self):
         """Close the MCP server subprocess"""
+        self._swr_executor.shutdown(wait=False)
         if self.process:
             self.process.stdin.close()
-            self.process.stdout.close()
-            self.process.stderr.close()
             self.process.terminate()
             self.process.wait()
+            # Reader exits on EOF and fails any still-pending futures
+            if self._reader is not None:
+                self._reader.join(timeout=5)
+            if self._stdout is not None:
+                self._stdout.close()  # closes the underlying pipe too
+            else:
+                self.process.stdout.close()
+            self.process.stderr.close()
             print("Chrome MCP server closed")
 
     # Window and Tab Management
 
+    @_swr(fresh=1.0, stale=10.0)
     def get_windows_and_tabs(self) -> Dict[str, Any]:
         """Get all currently open browser windows and tabs"""
         return self._make_request("get_windows_and_tabs", {})
 
-    def chrome_navigate(
-        self,
-        url: str = None,
-        refresh: bool = False,
-        new_window: bool = False,
-        width: int = 1280,
-        height: int = 720
-    ) -> Dict[str, Any]:
-        """
-        Navigate to a URL or refresh the current tab.
-
-        Args:
-            url: URL to navigate to
-            refresh: Refresh the current active tab instead of navigating to a URL
-            new_window: Create a new window to navigate to the URL
-            width: Viewport width in pixels (default: 1280)
-            height: Viewport height in pixels (default: 720)
-        """
-        params = {}
-        if url:
-            params["url"] = url
-        if refresh:
-            params["refresh"] = refresh
-        if new_window:
-            params["newWindow"] = new_window
-        if width != 1280:
-            params["width"] = width
-        if height != 720:
-            params["height"] = height
-        return self._make_request("chrome_navigate", params)
-
-    def chrome_close_tabs(self, tab_ids: List[int] = None, url: str = None) -> Dict[str, Any]:
-        """
-        Close one or more browser tabs.
-
-        Args:
-            tab_ids: Array of tab IDs to close. If not provided, will close the active tab.
-            url: Close tabs matching this URL. Can be used instead of tabIds.
-        """
-        params = {}
-        if tab_ids:
-            params["tabIds"] = tab_ids
-        if url:
-            params["url"] = url
-        return self._make_request("chrome_close_tabs", params)
+    # chrome_navigate and chrome_close_tabs are generated from _TOOLS
+    # below the class definition
 
     def chrome_go_back_or_forward(self, is_forward: bool = False) -> Dict[str, Any]:
         """
@@ -170,72 +799,8 @@ class MCPChromeClient:
         return self._make_request("chrome_go_back_or_forward", {"isForward": is_forward})
 
     # Page Content and Screenshots
-
-    def chrome_get_web_content(
-        self,
-        url: str = None,
-        text_content: bool = True,
-        html_content: bool = False,
-        selector: str = None
-    ) -> Dict[str, Any]:
-        """
-        Fetch content from a web page.
-
-        Args:
-            url: URL to fetch content from. If not provided, uses the current active tab
-            text_content: Get the visible text content of the page with metadata
-            html_content: Get the visible HTML content of the page
-            selector: CSS selector to get content from a specific element
-        """
-        params = {}
-        if url:
-            params["url"] = url
-        if text_content:
-            params["textContent"] = text_content
-        if html_content:
-            params["htmlContent"] = html_content
-        if selector:
-            params["selector"] = selector
-        return self._make_request("chrome_get_web_content", params)
-
-    def chrome_screenshot(
-        self,
-        name: str = None,
-        full_page: bool = True,
-        save_png: bool = True,
-        store_base64: bool = False,
-        selector: str = None,
-        width: int = 800,
-        height: int = 600
-    ) -> Dict[str, Any]:
-        """
-        Take a screenshot of the current page or a specific element.
-
-        Args:
-            name: Name for the screenshot, if saving as PNG
-            full_page: Store screenshot of the entire page (default: true)
-            save_png: Save screenshot as PNG file (default: true)
-            store_base64: Return screenshot in base64 format (default: false)
-            selector: CSS selector for element to screenshot
-            width: Width in pixels (default: 800)
-            height: Height in pixels (default: 600)
-        """
-        params = {}
-        if name:
-            params["name"] = name
-        if not full_page:
-            params["fullPage"] = full_page
-        if not save_png:
-            params["savePng"] = save_png
-        if store_base64:
-            params["storeBase64"] = store_base64
-        if selector:
-            params["selector"] = selector
-        if width != 800:
-            params["width"] = width
-        if height != 600:
-            params["height"] = height
-        return self._make_request("chrome_screenshot", params)
+    # (chrome_get_web_content and chrome_screenshot are generated from
+    # _TOOLS below the class definition)
 
     # Element Interaction
 
@@ -277,16 +842,9 @@ class MCPChromeClient:
             # Small delay to let the scroll settle
             time.sleep(0.2)
 
-        params = {}
-        if selector:
-            params["selector"] = selector
-        if coordinates:
-            params["coordinates"] = coordinates
-        if wait_for_navigation:
-            params["waitForNavigation"] = wait_for_navigation
-        if timeout != 5000:
-            params["timeout"] = timeout
-        return self._make_request("chrome_click_element", params)
+        return self._make_request("chrome_click_element", _pack(
+            _CLICK_DEFAULTS, (selector, coordinates, wait_for_navigation, timeout)
+        ))
 
     def chrome_fill_or_select(self, selector: str, value: str) -> Dict[str, Any]:
         """
@@ -301,53 +859,8 @@ class MCPChromeClient:
             "value": value
         })
 
-    def chrome_get_interactive_elements(
-        self,
-        selector: str = None,
-        text_query: str = None,
-        include_coordinates: bool = True
-    ) -> Dict[str, Any]:
-        """
-        Get interactive elements from the current page.
-
-        Args:
-            selector: CSS selector to filter interactive elements
-            text_query: Text to search for within interactive elements (fuzzy search)
-            include_coordinates: Include element coordinates in the response (default: true)
-        """
-        params = {}
-        if selector:
-            params["selector"] = selector
-        if text_query:
-            params["textQuery"] = text_query
-        if not include_coordinates:
-            params["includeCoordinates"] = include_coordinates
-        return self._make_request("chrome_get_interactive_elements", params)
-
-    def chrome_keyboard(
-        self,
-        keys: str,
-        selector: str = None,
-        delay: int = 0
-    ) -> Dict[str, Any]:
-        """
-        Simulate keyboard events in the browser.
-
-        NOTE: This uses JavaScript dispatchEvent which creates untrusted events
-        (isTrusted: false). Modern React apps may ignore these for form submissions.
-        For form submissions, use type_into_element_and_submit() instead.
-
-        Args:
-            keys: Keys to simulate (e.g., "Enter", "Ctrl+C", "A,B,C" for sequence)
-            selector: CSS selector for the element to send keyboard events to (optional)
-            delay: Delay between key sequences in milliseconds (default: 0)
-        """
-        params = {"keys": keys}
-        if selector:
-            params["selector"] = selector
-        if delay > 0:
-            params["delay"] = delay
-        return self._make_request("chrome_keyboard", params)
+    # chrome_get_interactive_elements and chrome_keyboard are generated
+    # from _TOOLS below the class definition
 
     def type_into_element(
         self,
@@ -711,6 +1224,7 @@ class MCPChromeClient:
 
     # History and Bookmarks
 
+    @_swr(fresh=2.0, stale=30.0)
     def chrome_history(
         self,
         text: str = None,
@@ -742,6 +1256,7 @@ class MCPChromeClient:
             params["excludeCurrentTabs"] = exclude_current_tabs
         return self._make_request("chrome_history", params)
 
+    @_swr(fresh=2.0, stale=30.0)
     def chrome_bookmark_search(
         self,
         query: str = None,
@@ -1284,13 +1799,23 @@ class MCPChromeClient:
         # Close the active tab
         return self.chrome_close_tabs()
 
-    def browser_tabs(self, action: str, index: int = None) -> Dict[str, Any]:
+    def browser_tabs(
+        self,
+        action: str,
+        index: int = None,
+        indices: List[int] = None,
+        url_substring: str = None
+    ) -> Dict[str, Any]:
         """
         Manage browser tabs - list, create, close, or select (Playwright compatibility method).
 
         Args:
-            action: Operation to perform (list, new, close, select)
+            action: Operation to perform (list, new, close, select, close_matching)
             index: Tab index for close/select operations
+            indices: Tab indices for a bulk close (one listing + one close
+                call instead of a round-trip pair per tab)
+            url_substring: URL filter for close_matching; tabs whose URL
+                contains it are closed in one listing + one close call
 
         Returns:
             Result dictionary with tabs information
@@ -1376,11 +1901,14 @@ class MCPChromeClient:
             return result
 
         elif action == "close":
-            if index is None:
-                return {"status": "error", "message": "index required for close action"}
+            if index is None and not indices:
+                return {"status": "error", "message": "index or indices required for close action"}
+            wanted = set(indices) if indices else {index}
 
-            # Get all tabs to find the tab ID
-            tabs_result = self.get_windows_and_tabs()
+            # Get all tabs once to resolve every wanted index to a tab ID.
+            # Never resolve through the SWR cache here: closing the wrong
+            # tab off a stale listing is destructive and unrecoverable.
+            tabs_result = self._make_request("get_windows_and_tabs", {})
 
             if tabs_result.get("status") == "success":
                 # Parse to get tab IDs (same triple-nesting as list action)
@@ -1403,27 +1931,90 @@ class MCPChromeClient:
                                 tabs_json = inner_content[0].get("text", "{}")
                                 tabs_data = json.loads(tabs_json)
 
-                                # Find tab at index
+                                # Collect the tab IDs for all wanted indices
+                                tab_ids = []
                                 tab_index = 0
                                 for window in tabs_data.get("windows", []):
                                     for tab in window.get("tabs", []):
-                                        if tab_index == index:
-                                            tab_id = tab.get("tabId")
-                                            return self.chrome_close_tabs(tab_ids=[tab_id])
+                                        if tab_index in wanted:
+                                            tab_ids.append(tab.get("tabId"))
                                         tab_index += 1
 
-                        return {"status": "error", "message": f"Tab at index {index} not found"}
+                                if tab_ids:
+                                    # Single bulk close for all resolved tabs
+                                    return self.chrome_close_tabs(tab_ids=tab_ids)
+
+                        return {
+                            "status": "error",
+                            "message": f"No tabs found at indices {sorted(wanted)}",
+                        }
                 except Exception as e:
                     return {"status": "error", "message": f"Failed to close tab: {str(e)}"}
 
             return tabs_result
 
+        elif action == "close_matching":
+            # Fused list -> filter -> close: the match loop runs here against
+            # one listing and all hits go to a single chrome_close_tabs call,
+            # instead of the caller paying a round trip per step
+            if not url_substring:
+                return {"status": "error", "message": "url_substring required for close_matching action"}
+
+            # Uncached listing: close decisions must see the live tab set
+            tabs_result = self._make_request("get_windows_and_tabs", {})
+
+            if tabs_result.get("status") == "success":
+                try:
+                    # Handle both "result" and "data" keys (Chrome MCP uses "data")
+                    result_data = tabs_result.get("result") or tabs_result.get("data", {})
+                    content = result_data.get("content", [])
+                    if content:
+                        text_data = content[0].get("text", "")
+
+                        # First parse: unwrap MCP tool result
+                        data = json.loads(text_data)
+                        if data.get("status") == "success":
+                            # Second level: get data.content
+                            inner_data = data.get("data", {})
+                            inner_content = inner_data.get("content", [])
+
+                            if isinstance(inner_content, list) and len(inner_content) > 0:
+                                # Third level: parse the actual tabs JSON
+                                tabs_json = inner_content[0].get("text", "{}")
+                                tabs_data = json.loads(tabs_json)
+
+                                tab_ids = [
+                                    tab.get("tabId")
+                                    for window in tabs_data.get("windows", [])
+                                    for tab in window.get("tabs", [])
+                                    if url_substring in tab.get("url", "")
+                                ]
+
+                                if not tab_ids:
+                                    return {"status": "success", "tabs_found": 0, "tabs_closed": 0}
+
+                                close_result = self.chrome_close_tabs(tab_ids=tab_ids)
+                                if close_result.get("status") == "success":
+                                    return {
+                                        "status": "success",
+                                        "tabs_found": len(tab_ids),
+                                        "tabs_closed": len(tab_ids),
+                                    }
+                                return close_result
+
+                    return {"status": "error", "message": "Failed to parse tabs data"}
+                except Exception as e:
+                    return {"status": "error", "message": f"Failed to close matching tabs: {str(e)}"}
+
+            return tabs_result
+
         elif action == "select":
             if index is None:
                 return {"status": "error", "message": "index required for select action"}
 
-            # Get all tabs to find the tab URL
-            tabs_result = self.get_windows_and_tabs()
+            # Get all tabs to find the tab URL (uncached: the index must
+            # map against the live tab order, not a stale listing)
+            tabs_result = self._make_request("get_windows_and_tabs", {})
 
             if tabs_result.get("status") == "success":
                 # Parse to get tab URLs (same triple-nesting as list action)
@@ -1501,6 +2092,63 @@ class MCPChromeClient:
 
         return self.chrome_screenshot(**params)
 
+    @staticmethod
+    def _screenshot_path_from_response(response: Dict[str, Any]) -> Optional[str]:
+        """Pull the saved-PNG path out of a chrome_screenshot response"""
+        if response.get("status") != "success":
+            return None
+        result = response.get("result") or {}
+        content = result.get("content") or []
+        for item in content:
+            text = item.get("text", "") if isinstance(item, dict) else ""
+            for token in text.replace('"', ' ').replace(',', ' ').split():
+                if token.endswith(".png") and "/" in token:
+                    return token
+        return None
+
+    @staticmethod
+    def open_screenshot(path: str) -> mmap.mmap:
+        """
+        Memory-map a saved screenshot PNG for zero-copy access.
+
+        The returned mmap can be sliced, hashed or handed to image
+        libraries without reading the file into a Python bytes object
+        first; pages come straight from the OS cache.
+
+        Args:
+            path: Path to a PNG written by chrome_screenshot
+
+        Returns:
+            Read-only mmap over the file (caller closes it)
+        """
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def screenshot_to_mmap(self, **kwargs):
+        """
+        Take a screenshot and return the saved PNG as a zero-copy view.
+
+        Forces save_png=True / store_base64=False so the multi-MB image
+        never rides through the JSON response as base64 (1.33x size
+        blow-up plus decode on both sides); only the file path crosses
+        the pipe and the bytes are memory-mapped from disk.
+
+        Args:
+            **kwargs: Passed through to chrome_screenshot (name,
+                full_page, selector, width, height)
+
+        Returns:
+            (path, mmap) on success, (None, None) if the response
+            carried no usable path
+        """
+        kwargs["save_png"] = True
+        kwargs["store_base64"] = False
+        response = self.chrome_screenshot(**kwargs)
+        path = self._screenshot_path_from_response(response)
+        if not path or not os.path.exists(path):
+            return None, None
+        return path, self.open_screenshot(path)
+
     # =======================================================================
     # Content Extraction Methods
     # These methods provide different ways to extract content from pages
@@ -1592,3 +2240,322 @@ class MCPChromeClient:
                     }
 
         return result
+
+
+def _install_tool_wrappers(cls):
+    """
+    Generate the plain tool wrapper methods from the _TOOLS schema.
+
+    Each tool gets one exec-compiled function specialized for its exact
+    argument shape: the snake_case → camelCase mapping and the
+    skip-if-default checks are baked in as literals, so a call runs a
+    short straight-line body with no table lookups. This also keeps the
+    name mapping in one place instead of duplicated per method.
+    """
+    for tool, (args, doc) in _TOOLS.items():
+        sig = ", ".join(
+            py if sig_default is _REQUIRED else f"{py}={sig_default!r}"
+            for py, sig_default, _, _ in args
+        )
+        lines = [f"def {tool}(self, {sig}):", "    params = {}"]
+        for py, _, server_default, wire in args:
+            if server_default is None:
+                lines.append(f"    if {py} is not None:")
+            else:
+                lines.append(
+                    f"    if {py} is not None and {py} != {server_default!r}:"
+                )
+            lines.append(f"        params[{wire!r}] = {py}")
+        lines.append(f"    return self._make_request({tool!r}, params)")
+
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        fn = namespace[tool]
+        fn.__doc__ = doc
+        fn.__qualname__ = f"{cls.__name__}.{tool}"
+        if tool in _SWR_TOOLS:
+            fresh, stale = _SWR_TOOLS[tool]
+            fn = _swr(fresh=fresh, stale=stale)(fn)
+        setattr(cls, tool, fn)
+
+
+_install_tool_wrappers(MCPChromeClient)
+
+
+class MCPChromePool:
+    """
+    Pool of MCPChromeClient subprocesses for parallel browser automation.
+
+    A single client serializes everything through one stdio pair; the
+    pool keeps min..max server subprocesses warm so independent crawls
+    can run side by side. Configured via constructor arguments or the
+    MCP_POOL_MIN / MCP_POOL_MAX / MCP_POOL_IDLE_TIMEOUT /
+    MCP_POOL_ACQUIRE_TIMEOUT environment variables.
+    """
+
+    def __init__(
+        self,
+        mcp_server_path: str,
+        mcp_command: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+        min_clients: Optional[int] = None,
+        max_clients: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the pool and pre-spawn the minimum number of clients.
+
+        Args:
+            mcp_server_path: Passed through to MCPChromeClient
+            mcp_command: Passed through to MCPChromeClient
+            env: Passed through to MCPChromeClient
+            min_clients: Servers kept warm (default MCP_POOL_MIN or 1)
+            max_clients: Hard cap on servers (default MCP_POOL_MAX or 6,
+                the practical per-host parallelism sweet spot)
+            idle_timeout: Seconds an idle client above the minimum may
+                linger before being closed (default MCP_POOL_IDLE_TIMEOUT
+                or 300)
+            acquire_timeout: Seconds acquire() waits at the cap before
+                raising (default MCP_POOL_ACQUIRE_TIMEOUT or 60)
+        """
+        self.mcp_server_path = mcp_server_path
+        self.mcp_command = mcp_command
+        self.env = env
+        self.min_clients = int(
+            min_clients if min_clients is not None
+            else os.environ.get("MCP_POOL_MIN", 1)
+        )
+        self.max_clients = int(
+            max_clients if max_clients is not None
+            else os.environ.get("MCP_POOL_MAX", 6)
+        )
+        self.idle_timeout = float(
+            idle_timeout if idle_timeout is not None
+            else os.environ.get("MCP_POOL_IDLE_TIMEOUT", 300)
+        )
+        self.acquire_timeout = float(
+            acquire_timeout if acquire_timeout is not None
+            else os.environ.get("MCP_POOL_ACQUIRE_TIMEOUT", 60)
+        )
+
+        # Idle clients as (client, released_at) pairs; _size counts every
+        # live client, idle or checked out
+        self._idle: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._closed = False
+
+        # One selector loop watches every pooled client's stdout and
+        # dispatches replies, so N subprocesses cost one reader thread
+        # instead of N (less GIL contention as the pool grows)
+        self._sel = selectors.DefaultSelector()
+        self._sel_lock = threading.Lock()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
+
+        for _ in range(self.min_clients):
+            if not self._try_reserve(self.max_clients):
+                break
+            try:
+                self._idle.put((self._spawn(), time.monotonic()))
+            except Exception:
+                self._unreserve()
+                raise
+
+        self._health = threading.Thread(target=self._health_loop, daemon=True)
+        self._health.start()
+
+    def _try_reserve(self, limit: int) -> bool:
+        """
+        Claim a client slot below limit by bumping _size atomically.
+
+        The check and the increment share one critical section so two
+        concurrent acquire() calls can't both see room and spawn past
+        the cap. On success the caller must _spawn() the client, or
+        _unreserve() the slot if the spawn fails.
+        """
+        with self._lock:
+            if self._size < limit:
+                self._size += 1
+                return True
+            return False
+
+    def _unreserve(self):
+        """Give back a slot reserved by _try_reserve after a failed spawn"""
+        with self._lock:
+            self._size -= 1
+
+    def _spawn(self) -> MCPChromeClient:
+        """Start one new server subprocess for an already-reserved slot"""
+        client = MCPChromeClient(
+            self.mcp_server_path, mcp_command=self.mcp_command, env=self.env,
+            external_reader=True,
+        )
+        with self._sel_lock:
+            self._sel.register(client.process.stdout, selectors.EVENT_READ, client)
+        return client
+
+    def _retire(self, client: MCPChromeClient):
+        """Close one client and drop it from the count"""
+        with self._sel_lock:
+            try:
+                self._sel.unregister(client.process.stdout)
+            except (KeyError, ValueError):
+                pass  # already unregistered (EOF seen by the dispatcher)
+        with self._lock:
+            self._size -= 1
+        try:
+            client.close()
+        except Exception as e:
+            print(f"Error closing pooled MCP client: {e}")
+
+    def _dispatch_loop(self):
+        """
+        Multiplex all pooled subprocess stdouts through one selector.
+
+        Ready pipes are drained via client._on_readable(), which splits
+        lines and completes the matching futures; a client hitting EOF
+        is unregistered here and retired by the health sweep or the next
+        acquire(). The short timeout lets newly spawned clients get
+        picked up promptly.
+        """
+        while not self._closed:
+            events = self._sel.select(timeout=0.2)
+            for key, _ in events:
+                client = key.data
+                if not client._on_readable():
+                    with self._sel_lock:
+                        try:
+                            self._sel.unregister(key.fileobj)
+                        except (KeyError, ValueError):
+                            pass
+
+    def acquire(self) -> MCPChromeClient:
+        """
+        Check a client out of the pool.
+
+        Reuses an idle healthy client, spawns a new one below the cap,
+        or blocks until a release frees one up.
+
+        Returns:
+            A running MCPChromeClient (caller must release() it)
+
+        Raises:
+            RuntimeError: if the pool is closed
+            TimeoutError: if no client frees up within acquire_timeout
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("MCPChromePool is closed")
+
+            try:
+                client, _ = self._idle.get_nowait()
+            except queue.Empty:
+                client = None
+
+            if client is not None:
+                if client.is_alive():
+                    return client
+                self._retire(client)  # died while idle; try again
+                continue
+
+            if self._try_reserve(self.max_clients):
+                try:
+                    return self._spawn()
+                except Exception:
+                    self._unreserve()
+                    raise
+
+            # At the cap: wait for a release
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No MCP client available within {self.acquire_timeout}s"
+                )
+            try:
+                client, _ = self._idle.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"No MCP client available within {self.acquire_timeout}s"
+                )
+            if client.is_alive():
+                return client
+            self._retire(client)
+
+    def release(self, client: MCPChromeClient):
+        """Return a checked-out client to the pool (or retire it if dead)"""
+        if self._closed or not client.is_alive():
+            self._retire(client)
+            return
+        self._idle.put((client, time.monotonic()))
+
+    @contextmanager
+    def client(self):
+        """
+        Context manager wrapping acquire()/release():
+
+            with pool.client() as chrome:
+                chrome.chrome_navigate(url="https://example.com")
+        """
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def _health_loop(self):
+        """
+        Sweep idle clients every 30s: retire dead subprocesses and
+        idle-too-long extras above the minimum, then top back up to the
+        minimum so a warm client is always ready.
+
+        Liveness is process.poll() based; the Chrome MCP server has no
+        ping tool, so sending a probe request would only tie up the
+        stdio channel.
+        """
+        while not self._closed:
+            time.sleep(30)
+            if self._closed:
+                return
+
+            keep = []
+            now = time.monotonic()
+            while True:
+                try:
+                    client, released_at = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if not client.is_alive():
+                    self._retire(client)
+                elif (now - released_at > self.idle_timeout
+                        and self._size > self.min_clients):
+                    self._retire(client)
+                else:
+                    keep.append((client, released_at))
+            for item in keep:
+                self._idle.put(item)
+
+            while not self._closed and self._size < self.min_clients:
+                if not self._try_reserve(self.max_clients):
+                    break
+                try:
+                    self._idle.put((self._spawn(), time.monotonic()))
+                except Exception as e:
+                    self._unreserve()
+                    print(f"Failed to replace dead MCP client: {e}")
+                    break
+
+    def close(self):
+        """Close every idle client and stop handing out new ones"""
+        self._closed = True
+        while True:
+            try:
+                client, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(client)
+        self._dispatcher.join(timeout=1)
+        self._sel.close()
+        print("MCP client pool closed")
@@ -21,6 +21,7 @@ from .utils import (
     create_timestamped_dir,
     find_config_file,
     # Text filtering utilities
+    build_keyword_automaton,
     should_skip_by_keywords,
     is_low_value_content,
     # Data extraction utilities
@@ -50,6 +51,7 @@ __all__ = [
     "create_timestamped_dir",
     "find_config_file",
     # Text filtering utilities
+    "build_keyword_automaton",
     "should_skip_by_keywords",
     "is_low_value_content",
     # Data extraction utilities
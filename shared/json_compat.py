@@ -0,0 +1,61 @@
+"""
+JSON helpers backed by orjson when available.
+
+orjson parses and serializes large payloads several times faster than the
+stdlib encoder. These wrappers use it when installed and fall back to the
+stdlib `json` module otherwise, always returning/accepting bytes for dumps
+so callers can write files in binary mode.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize to compact JSON bytes.
+
+    Args:
+        data: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_indent(data: Any) -> bytes:
+    """
+    Serialize to 2-space-indented JSON bytes.
+
+    Args:
+        data: Object to serialize
+
+    Returns:
+        UTF-8 encoded, indented JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
@@ -16,6 +16,12 @@ try:
 except ImportError:
     HAS_YAML = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 
 # =============================================================================
 # CONFIGURATION CONSTANTS
@@ -273,6 +279,31 @@ def find_config_file(
 # TEXT FILTERING UTILITIES
 # =============================================================================
 
+def build_keyword_automaton(keywords: List[str]):
+    """
+    Build an Aho-Corasick automaton over the given keywords.
+
+    One automaton pass finds any keyword in O(len(text)) instead of a
+    substring scan per keyword. Returns None when pyahocorasick is not
+    installed (callers fall back to should_skip_by_keywords) or the
+    keyword list is empty.
+
+    Args:
+        keywords: Substrings to match
+
+    Returns:
+        ahocorasick.Automaton or None
+    """
+    if not HAS_AHOCORASICK or not keywords:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 def should_skip_by_keywords(text: str, keywords: Optional[List[str]] = None) -> bool:
     """
     Check if text should be skipped based on keywords.
@@ -525,6 +556,13 @@ DEFAULT_UNIFIED_CONFIG = {
                 "confidence_threshold": 0.7,
                 "delay_between_calls": 0.5,
             },
+            "embedding": {
+                "enabled": True,
+                "model": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+                "tau_low": 0.2,
+                "tau_high": 0.5,
+                "anchors": None,
+            },
             "output": {
                 "save_results": True,
                 "results_filename": "filter_results.json",
@@ -685,6 +723,13 @@ class UnifiedConfig:
     def skip_keywords(self) -> List[str]:
         return self.filters.get("skip_keywords", SKIP_KEYWORDS)
 
+    @property
+    def skip_keyword_automaton(self):
+        """Aho-Corasick automaton over skip_keywords, built once and cached."""
+        if not hasattr(self, "_skip_keyword_automaton"):
+            self._skip_keyword_automaton = build_keyword_automaton(self.skip_keywords)
+        return self._skip_keyword_automaton
+
     @property
     def low_value_patterns(self) -> List[str]:
         return self.filters.get("low_value_patterns", LOW_VALUE_PATTERNS)
@@ -5,7 +5,17 @@ Interfaces with Playwright MCP or Chrome MCP to extract page content
 
 import json
 import re
+import time
 from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses MCP payloads (full-page HTML bundles can be MBs) much
+# faster than the stdlib decoder
+_json_loads = orjson.loads if orjson is not None else json.loads
 from helper.PlaywrightMcpClient import MCPPlaywrightClient
 from helper.ChromeMcpClient import MCPChromeClient
 from util import detect_host_os
@@ -79,41 +89,60 @@ class BrowserIntegration:
             )
             return str(self.handle_mcp_response(result))
 
-    def handle_mcp_response(self, result: dict) -> str:
-                # Handle MCP response format: {'status': 'success', 'result': {'content': [{'type': 'text', 'text': '...'}]}}
-        if isinstance(result, dict):
-            if result.get("status") != "success":
-                raise RuntimeError(f"Failed to get page HTML: {result.get('message', 'Unknown error')}")
+    @staticmethod
+    def _unwrap(result, default=""):
+        """
+        Unwrap an MCP response down to its payload.
 
-            # Extract content from nested structure
-            result_data = result.get("result", {})
-            if isinstance(result_data, dict) and "content" in result_data:
-                content_list = result_data["content"]
-                if isinstance(content_list, list) and len(content_list) > 0:
-                    first_item = content_list[0]
-                    if isinstance(first_item, dict) and "text" in first_item:
-                        text = first_item["text"]
-                        # Parse the result from markdown format - HTML is quoted and escaped
-                        # Look for content after "### Result" - HTML might span multiple lines
-                        match = re.search(r'### Result\s*\n"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
-                        if match:
-                            # Unescape the string
-                            html = match.group(1)
-                            html = html.replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
-                            return html
-                        # If no match, return the text as-is
-                        return text
-
-            # Fallback: try old format
-            content = result.get("result", "")
-            if isinstance(content, str):
-                return content
-            if isinstance(content, dict):
-                if "content" in content:
-                    return str(content["content"])
-                elif "result" in content:
-                    return str(content["result"])
-        return str(result)
+        Handles the new format {'result': {'content': [{'text': ...}]}}
+        (with 'data' as the Chrome alias for 'result') and the old format
+        where 'result' is a plain string or a {'content'|'result': ...}
+        dict. Returns the text/payload as-is, or default if nothing usable
+        is found; callers apply their own '### Result' parsing on top.
+        """
+        if not isinstance(result, dict):
+            return default
+
+        # Extract content from nested structure
+        # Try "result" first (Playwright MCP), then "data" (Chrome MCP)
+        result_data = result.get("result") or result.get("data", {})
+        if isinstance(result_data, dict) and "content" in result_data:
+            content_list = result_data["content"]
+            if isinstance(content_list, list) and len(content_list) > 0:
+                first_item = content_list[0]
+                if isinstance(first_item, dict) and "text" in first_item:
+                    return first_item["text"]
+
+        # Fallback: try old format
+        content = result.get("result", default)
+        if isinstance(content, str):
+            return content
+        if isinstance(content, dict):
+            if "content" in content:
+                return content["content"]
+            elif "result" in content:
+                return content["result"]
+        return default
+
+    def handle_mcp_response(self, result: dict) -> str:
+        # Handle MCP response format: {'status': 'success', 'result': {'content': [{'type': 'text', 'text': '...'}]}}
+        if isinstance(result, dict) and result.get("status") != "success":
+            raise RuntimeError(f"Failed to get page HTML: {result.get('message', 'Unknown error')}")
+
+        text = self._unwrap(result, default=result)
+        if not isinstance(text, str):
+            return str(text)
+
+        # Parse the result from markdown format - HTML is quoted and escaped
+        # Look for content after "### Result" - HTML might span multiple lines
+        match = re.search(r'### Result\s*\n"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
+        if match:
+            # Unescape the string
+            html = match.group(1)
+            html = html.replace('\\n', '\n').replace('\\t', '\t').replace('\\"', '"').replace('\\\\', '\\')
+            return html
+        # If no match, return the text as-is
+        return text
 
     def handle_chrome_content_response(self, result: dict, content_key: str) -> str:
         """
@@ -138,17 +167,49 @@ class BrowserIntegration:
                 content_list = result_data["content"]
                 if isinstance(content_list, list) and len(content_list) > 0:
                     # First parse: get outer wrapper
-                    outer_data = json.loads(content_list[0].get("text", "{}"))
+                    outer_data = _json_loads(content_list[0].get("text", "{}"))
                     # Second parse: get actual content from nested JSON
                     inner_text = outer_data.get("data", {}).get("content", [{}])[0].get("text", "{}")
                     if inner_text:
-                        inner_data = json.loads(inner_text)
+                        inner_data = _json_loads(inner_text)
                         # Extract the requested content (htmlContent or textContent)
                         content = inner_data.get(content_key, "")
                         return content
 
         raise RuntimeError(f"Failed to extract {content_key} from Chrome MCP response")
 
+    def _get_active_tab_field(self, field: str) -> str:
+        """
+        Get a field ("url" or "title") of the active tab via Chrome MCP.
+
+        Chrome MCP has a triple-nested JSON structure:
+        result.content[0].text -> data.content[0].text -> tabs data.
+        """
+        result = self.playwright_client.get_windows_and_tabs()
+        if result.get("status") == "success":
+            # Level 1: result.content[0].text
+            result_data = result.get("result") or result.get("data", {})
+            content_list = result_data.get("content", [])
+            if content_list:
+                level1_text = content_list[0].get("text", "{}")
+                level1_data = _json_loads(level1_text)
+                # Level 2: data.content[0].text
+                level2_data = level1_data.get("data", {})
+                level2_content = level2_data.get("content", [])
+                if level2_content:
+                    level2_text = level2_content[0].get("text", "{}")
+                    # Level 3: actual tabs data
+                    tabs_data = _json_loads(level2_text)
+                    # Get active tab
+                    for window in tabs_data.get("windows", []):
+                        for tab in window.get("tabs", []):
+                            if tab.get("active"):
+                                return tab.get(field, "")
+                    # Fallback: use first tab
+                    if tabs_data.get("windows") and tabs_data["windows"][0].get("tabs"):
+                        return tabs_data["windows"][0]["tabs"][0].get(field, "")
+        return ""
+
     def get_current_url(self) -> str:
         """
         Get current page URL.
@@ -158,71 +219,27 @@ class BrowserIntegration:
         """
         # For Chrome MCP, use get_windows_and_tabs to get URL
         if self.client_type == "chrome":
-            result = self.playwright_client.get_windows_and_tabs()
-            if result.get("status") == "success":
-                import json
-                # Chrome MCP has triple-nested JSON structure
-                # Level 1: result.content[0].text
-                result_data = result.get("result") or result.get("data", {})
-                content_list = result_data.get("content", [])
-                if content_list:
-                    level1_text = content_list[0].get("text", "{}")
-                    level1_data = json.loads(level1_text)
-                    # Level 2: data.content[0].text
-                    level2_data = level1_data.get("data", {})
-                    level2_content = level2_data.get("content", [])
-                    if level2_content:
-                        level2_text = level2_content[0].get("text", "{}")
-                        # Level 3: actual tabs data
-                        tabs_data = json.loads(level2_text)
-                        # Get active tab
-                        for window in tabs_data.get("windows", []):
-                            for tab in window.get("tabs", []):
-                                if tab.get("active"):
-                                    return tab.get("url", "")
-                        # Fallback: return first tab URL
-                        if tabs_data.get("windows") and tabs_data["windows"][0].get("tabs"):
-                            return tabs_data["windows"][0]["tabs"][0].get("url", "")
-            return ""
+            return self._get_active_tab_field("url")
 
         # For Playwright MCP, use browser_evaluate
         result = self.playwright_client.browser_evaluate(
             function="() => window.location.href"
         )
 
-        # Handle MCP response format: {'status': 'success', 'result': {'content': [{'type': 'text', 'text': '...'}]}}
-        if isinstance(result, dict):
-            if result.get("status") != "success":
-                raise RuntimeError(f"Failed to get page URL: {result.get('message', 'Unknown error')}")
+        if isinstance(result, dict) and result.get("status") != "success":
+            raise RuntimeError(f"Failed to get page URL: {result.get('message', 'Unknown error')}")
 
-            # Extract content from nested structure
-            # Try "result" first (Playwright MCP), then "data" (Chrome MCP)
-            result_data = result.get("result") or result.get("data", {})
-            if isinstance(result_data, dict) and "content" in result_data:
-                content_list = result_data["content"]
-                if isinstance(content_list, list) and len(content_list) > 0:
-                    first_item = content_list[0]
-                    if isinstance(first_item, dict) and "text" in first_item:
-                        text = first_item["text"]
-                        # Parse the result from markdown format
-                        # Look for the URL in quotes after "### Result"
-                        match = re.search(r'### Result\s*\n"([^"]+)"', text)
-                        if match:
-                            return match.group(1)
-                        # If no match, return the text as-is
-                        return text
-
-            # Fallback: try old format
-            content = result.get("result", "")
-            if isinstance(content, str):
-                return content
-            if isinstance(content, dict):
-                if "content" in content:
-                    return str(content["content"])
-                elif "result" in content:
-                    return str(content["result"])
-
-        return str(result)
+        text = self._unwrap(result, default=result)
+        if not isinstance(text, str):
+            return str(text)
+
+        # Parse the result from markdown format
+        # Look for the URL in quotes after "### Result"
+        match = re.search(r'### Result\s*\n"([^"]+)"', text)
+        if match:
+            return match.group(1)
+        # If no match, return the text as-is
+        return text
 
     def get_page_title(self) -> str:
         """
@@ -233,71 +250,27 @@ class BrowserIntegration:
         """
         # For Chrome MCP, use get_windows_and_tabs to get title
         if self.client_type == "chrome":
-            result = self.playwright_client.get_windows_and_tabs()
-            if result.get("status") == "success":
-                import json
-                # Chrome MCP has triple-nested JSON structure
-                # Level 1: result.content[0].text
-                result_data = result.get("result") or result.get("data", {})
-                content_list = result_data.get("content", [])
-                if content_list:
-                    level1_text = content_list[0].get("text", "{}")
-                    level1_data = json.loads(level1_text)
-                    # Level 2: data.content[0].text
-                    level2_data = level1_data.get("data", {})
-                    level2_content = level2_data.get("content", [])
-                    if level2_content:
-                        level2_text = level2_content[0].get("text", "{}")
-                        # Level 3: actual tabs data
-                        tabs_data = json.loads(level2_text)
-                        # Get active tab
-                        for window in tabs_data.get("windows", []):
-                            for tab in window.get("tabs", []):
-                                if tab.get("active"):
-                                    return tab.get("title", "")
-                        # Fallback: return first tab title
-                        if tabs_data.get("windows") and tabs_data["windows"][0].get("tabs"):
-                            return tabs_data["windows"][0]["tabs"][0].get("title", "")
-            return ""
+            return self._get_active_tab_field("title")
 
         # For Playwright MCP, use browser_evaluate
         result = self.playwright_client.browser_evaluate(
             function="() => document.title"
         )
 
-        # Handle MCP response format: {'status': 'success', 'result': {'content': [{'type': 'text', 'text': '...'}]}}
-        if isinstance(result, dict):
-            if result.get("status") != "success":
-                return ""
+        if isinstance(result, dict) and result.get("status") != "success":
+            return ""
 
-            # Extract content from nested structure
-            # Try "result" first (Playwright MCP), then "data" (Chrome MCP)
-            result_data = result.get("result") or result.get("data", {})
-            if isinstance(result_data, dict) and "content" in result_data:
-                content_list = result_data["content"]
-                if isinstance(content_list, list) and len(content_list) > 0:
-                    first_item = content_list[0]
-                    if isinstance(first_item, dict) and "text" in first_item:
-                        text = first_item["text"]
-                        # Parse the result from markdown format
-                        # Look for the title in quotes after "### Result"
-                        match = re.search(r'### Result\s*\n"([^"]*)"', text)
-                        if match:
-                            return match.group(1)
-                        # If no match, return the text as-is
-                        return text
-
-            # Fallback: try old format
-            content = result.get("result", "")
-            if isinstance(content, str):
-                return content
-            if isinstance(content, dict):
-                if "content" in content:
-                    return str(content["content"])
-                elif "result" in content:
-                    return str(content["result"])
-
-        return str(result)
+        text = self._unwrap(result, default=result)
+        if not isinstance(text, str):
+            return str(text)
+
+        # Parse the result from markdown format
+        # Look for the title in quotes after "### Result"
+        match = re.search(r'### Result\s*\n"([^"]*)"', text)
+        if match:
+            return match.group(1)
+        # If no match, return the text as-is
+        return text
 
     def get_page_metadata(self) -> Dict[str, str]:
         """
@@ -328,58 +301,121 @@ class BrowserIntegration:
             }"""
         )
 
-        # Handle MCP response format: {'status': 'success', 'result': {'content': [{'type': 'text', 'text': '...'}]}}
-        if isinstance(result, dict):
-            if result.get("status") != "success":
-                return {
-                    "url": self.get_current_url(),
-                    "title": self.get_page_title()
-                }
+        fallback = None
+        if isinstance(result, dict) and result.get("status") == "success":
+            payload = self._unwrap(result, default=None)
+            if isinstance(payload, str):
+                # Parse the result from markdown format - extract JSON object
+                # Look for JSON object after "### Result" (may be nested)
+                match = re.search(r'### Result\s*\n(\{.*?\n\})', payload, re.DOTALL)
+                json_str = match.group(1) if match else payload
+                try:
+                    return _json_loads(json_str)
+                except Exception as e:
+                    print(f"DEBUG: Failed to parse JSON metadata: {e}")
+            elif isinstance(payload, dict):
+                fallback = payload
+
+        if fallback is not None:
+            return fallback
 
-            # Extract content from nested structure
-            result_data = result.get("result", {})
-            if isinstance(result_data, dict) and "content" in result_data:
-                content_list = result_data["content"]
-                if isinstance(content_list, list) and len(content_list) > 0:
-                    first_item = content_list[0]
-                    if isinstance(first_item, dict) and "text" in first_item:
-                        text = first_item["text"]
-                        # Parse the result from markdown format - extract JSON object
-                        # Look for JSON object after "### Result" (may be nested)
-                        match = re.search(r'### Result\s*\n(\{.*?\n\})', text, re.DOTALL)
-                        if match:
-                            try:
-                                return json.loads(match.group(1))
-                            except Exception as e:
-                                print(f"DEBUG: Failed to parse JSON metadata: {e}")
-                                pass
-                        # If no match, return fallback
-                        return {
-                            "url": self.get_current_url(),
-                            "title": self.get_page_title()
-                        }
+        return {
+            "url": self.get_current_url(),
+            "title": self.get_page_title()
+        }
+
+    def wait_for_page_ready(self, timeout: float = 5.0, poll_interval: float = 0.2, floor: float = 0.2) -> float:
+        """
+        Wait until document.readyState is "complete", bounded by timeout.
+
+        Replaces fixed sleeps after navigation: fast loads return as soon
+        as the page reports ready instead of idling out the full wait,
+        while timeout stays as the safety cap for slow ones. The MCP
+        clients expose no CDP event stream, so readiness is probed via
+        short browser_evaluate polls.
+
+        Args:
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between readiness probes
+            floor: Minimum settle time even when the page is already ready
 
-            # Fallback: try old format
-            content = result.get("result", {})
-            if isinstance(content, dict):
-                if "content" in content:
-                    if isinstance(content["content"], str):
-                        try:
-                            return json.loads(content["content"])
-                        except:
-                            pass
-                    return content["content"]
-                elif "result" in content:
-                    if isinstance(content["result"], str):
-                        try:
-                            return json.loads(content["result"])
-                        except:
-                            pass
-                    return content["result"]
+        Returns:
+            Seconds actually waited
+        """
+        start = time.time()
+        time.sleep(min(floor, timeout))
+        while time.time() - start < timeout:
+            try:
+                result = self.playwright_client.browser_evaluate(
+                    function="() => document.readyState"
+                )
+                state = self.handle_mcp_response(result)
+                if "complete" in str(state):
+                    break
+            except Exception:
+                # Probe failed (e.g. mid-navigation); fall back to the
+                # remainder of the fixed wait
+                remaining = timeout - (time.time() - start)
+                if remaining > 0:
+                    time.sleep(remaining)
+                break
+            time.sleep(poll_interval)
+        return time.time() - start
+
+    def get_page_bundle(self) -> Dict:
+        """
+        Get page HTML, URL, title and metadata in a single browser round-trip.
 
+        Callers that need several of these otherwise cross the MCP boundary
+        once per field; for IPC-bound crawls the extra round-trips dominate
+        wall-clock, so fetch everything with one browser_evaluate call.
+
+        Returns:
+            Dictionary with "html", "url", "title" and "metadata" keys
+        """
+        try:
+            result = self.playwright_client.browser_evaluate(
+                function="""() => {
+                    return {
+                        html: document.documentElement.outerHTML,
+                        url: window.location.href,
+                        title: document.title,
+                        metadata: {
+                            viewport: {
+                                width: window.innerWidth,
+                                height: window.innerHeight
+                            },
+                            scrollPosition: {
+                                x: window.scrollX,
+                                y: window.scrollY
+                            },
+                            documentSize: {
+                                width: document.documentElement.scrollWidth,
+                                height: document.documentElement.scrollHeight
+                            }
+                        }
+                    };
+                }"""
+            )
+            if isinstance(result, dict) and result.get("status") == "success":
+                payload = self._unwrap(result, default=None)
+                if isinstance(payload, str):
+                    # Parse the JSON object after "### Result"
+                    match = re.search(r'### Result\s*\n(\{.*\})', payload, re.DOTALL)
+                    bundle = _json_loads(match.group(1) if match else payload)
+                    if isinstance(bundle, dict) and "html" in bundle:
+                        return bundle
+                elif isinstance(payload, dict) and "html" in payload:
+                    return payload
+        except Exception:
+            pass
+
+        # Fallback: individual round-trips
         return {
+            "html": self.get_current_page_html(),
             "url": self.get_current_url(),
-            "title": self.get_page_title()
+            "title": self.get_page_title(),
+            "metadata": {},
         }
 
     def scroll_to_bottom(self) -> bool:
@@ -539,24 +575,45 @@ class BrowserIntegration:
         )
         return result.get("status") == "success"
 
-    def manage_tabs(self, action: str, index: Optional[int] = None) -> Dict:
+    def manage_tabs(
+        self,
+        action: str,
+        index: Optional[int] = None,
+        indices: Optional[list] = None,
+        url_substring: Optional[str] = None
+    ) -> Dict:
         """
         Manage browser tabs (list, create, close, or select).
 
         Args:
-            action: Operation to perform - "list", "new", "close", or "select"
+            action: Operation to perform - "list", "new", "close",
+                "close_matching", or "select"
             index: Tab index for close/select operations (0-based)
+            indices: Tab indices for a bulk close; Chrome closes them in a
+                single call instead of one round trip per tab
+            url_substring: URL filter for "close_matching"; the list +
+                filter + close sequence is fused client-side into one
+                listing and one bulk close
 
         Returns:
             Dictionary with operation results:
             - For "list": {"success": bool, "tabs": [{"index": int, "title": str, "url": str, "active": bool}], "error": str}
+            - For "close_matching": {"success": bool, "tabs_found": int, "tabs_closed": int, "error": str}
             - For other actions: {"success": bool, "message": str, "error": str}
         """
         if self.client_type == "chrome":
             # Use Chrome's browser_tabs method
-            result = self.playwright_client.browser_tabs(action=action, index=index)
+            result = self.playwright_client.browser_tabs(
+                action=action, index=index, indices=indices, url_substring=url_substring
+            )
 
             if result.get("status") == "success":
+                if action == "close_matching":
+                    return {
+                        "success": True,
+                        "tabs_found": result.get("tabs_found", 0),
+                        "tabs_closed": result.get("tabs_closed", 0)
+                    }
                 if action == "list":
                     # Parse the markdown response to extract tabs data
                     result_data = result.get("result", {})
@@ -604,6 +661,23 @@ class BrowserIntegration:
         else:
             # Playwright client - use browser_tabs if available
             if hasattr(self.playwright_client, 'browser_tabs'):
+                if action == "close_matching":
+                    # No fused primitive here; callers fall back to the
+                    # list -> filter -> close path
+                    return {
+                        "success": False,
+                        "error": "close_matching not supported by playwright client"
+                    }
+                if action == "close" and indices:
+                    # Playwright MCP has no bulk close; fall back to per-tab calls
+                    errors = []
+                    for idx in indices:
+                        close_result = self.playwright_client.browser_tabs(action="close", index=idx)
+                        if close_result.get("status") != "success":
+                            errors.append(f"Tab {idx}: {close_result.get('message', 'Tab operation failed')}")
+                    if errors:
+                        return {"success": False, "error": "; ".join(errors)}
+                    return {"success": True, "message": "Tab close operation completed successfully"}
                 result = self.playwright_client.browser_tabs(action=action, index=index)
 
                 if result.get("status") == "success":
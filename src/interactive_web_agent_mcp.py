@@ -970,16 +970,12 @@ async def get_page_content(output_format: str = "indexed") -> Dict:
     with timer:
         browser = get_browser()
 
-        # Get current URL and title
+        # Get URL, title and HTML in one browser round-trip
         try:
-            current_page_url = browser.get_current_url()
-            current_page_title = browser.get_page_title()
-        except:
-            pass
-
-        # Get page HTML
-        try:
-            raw_html = browser.get_current_page_html()
+            bundle = browser.get_page_bundle()
+            current_page_url = bundle.get("url", current_page_url)
+            current_page_title = bundle.get("title", current_page_title)
+            raw_html = bundle.get("html", "")
         except Exception as e:
             output = {
                 "success": False,
@@ -1518,11 +1514,12 @@ async def download_page(filename: Optional[str] = None, include_metadata: bool =
 
         browser = get_browser()
 
-        # Get current page HTML
+        # Get page HTML, URL and title in one browser round-trip
         try:
-            html_content = browser.get_current_page_html()
-            url = browser.get_current_url()
-            title = browser.get_page_title()
+            bundle = browser.get_page_bundle()
+            html_content = bundle.get("html", "")
+            url = bundle.get("url", "")
+            title = bundle.get("title", "")
         except Exception as e:
             output = {
                 "success": False,
@@ -14,7 +14,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from enum import Enum
 
 # Add project directories to path
@@ -87,9 +87,10 @@ class BaseWorkflow(ABC):
     def __init__(
         self,
         client_type: str = "chrome",
-        output_dir: Optional[str] = None,
+        output_dir: Optional[Union[str, Path]] = None,
         wait_between_steps: float = 1.0,
-        verbose: bool = True
+        verbose: bool = True,
+        browser: Optional[BrowserIntegration] = None
     ):
         """
         Initialize workflow.
@@ -99,17 +100,26 @@ class BaseWorkflow(ABC):
             output_dir: Directory for output files
             wait_between_steps: Default wait time between steps (seconds)
             verbose: Print progress messages
+            browser: Existing BrowserIntegration to reuse instead of
+                launching a new one; the caller keeps ownership and
+                close() will not shut it down
         """
         self.client_type = client_type
-        self.output_dir = Path(output_dir) if output_dir else Path("./workflow_output")
+        if not output_dir:
+            output_dir = "./workflow_output"
+        # Accept Path objects as-is; callers that precompute a root Path
+        # shouldn't pay for a round trip through str
+        self.output_dir = output_dir if isinstance(output_dir, Path) else Path(output_dir)
         self.wait_between_steps = wait_between_steps
         self.verbose = verbose
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize components (lazy loading)
-        self._browser: Optional[BrowserIntegration] = None
+        # Initialize components (lazy loading); a caller-supplied browser
+        # is reused as-is and never closed by this workflow
+        self._browser: Optional[BrowserIntegration] = browser
+        self._owns_browser = browser is None
         self._sanitizer: Optional[HTMLSanitizer] = None
         self._query_engine: Optional[QueryEngine] = None
 
@@ -186,8 +196,12 @@ class BaseWorkflow(ABC):
                     error=f"Navigation failed: {result.get('message', 'Unknown error')}"
                 )
 
-            # Wait for page load
-            time.sleep(wait_seconds)
+            # Wait for page readiness; wait_seconds is now the cap, not a
+            # fixed sleep, so fast loads proceed as soon as the DOM is ready
+            if hasattr(self.browser, "wait_for_page_ready"):
+                self.browser.wait_for_page_ready(timeout=wait_seconds)
+            else:
+                time.sleep(wait_seconds)
 
             # Get current URL and title
             self._current_url = self.browser.get_current_url()
@@ -579,6 +593,6 @@ class BaseWorkflow(ABC):
 
     def close(self):
         """Close browser and cleanup resources."""
-        if self._browser:
+        if self._browser and self._owns_browser:
             self._browser.close()
             self._browser = None
@@ -14,11 +14,12 @@ import random
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 
 from base_workflow import (
     BaseWorkflow,
+    BrowserIntegration,
     WorkflowResult,
     StepResult,
     VerificationResult,
@@ -151,8 +152,9 @@ class OnePoint3AcresWorkflow(BaseWorkflow):
         self,
         config: OnePoint3AcresConfig,
         client_type: str = "chrome",
-        output_dir: Optional[str] = None,
-        verbose: bool = True
+        output_dir: Optional[Union[str, Path]] = None,
+        verbose: bool = True,
+        browser: Optional[BrowserIntegration] = None
     ):
         """
         Initialize workflow.
@@ -162,12 +164,14 @@ class OnePoint3AcresWorkflow(BaseWorkflow):
             client_type: Browser client type
             output_dir: Output directory for results
             verbose: Print progress messages
+            browser: Existing BrowserIntegration to reuse (skips launch)
         """
         super().__init__(
             client_type=client_type,
             output_dir=output_dir or "./1point3acres_output",
             wait_between_steps=config.between_posts_wait,
-            verbose=verbose
+            verbose=verbose,
+            browser=browser
         )
         self.config = config
 
@@ -563,6 +567,23 @@ class OnePoint3AcresWorkflow(BaseWorkflow):
                     verifications=verifications
                 )
 
+            # Cheap probe before the multi-page walk: single-page posts
+            # (the common case) render no pagination bar at all, so one
+            # querySelector check lets us skip the pagination bookkeeping
+            # and any follow-up navigation entirely
+            single_page = False
+            try:
+                probe = self.browser.playwright_client.browser_evaluate(
+                    function="() => document.querySelector('.pg, .pagination') !== null"
+                )
+                probe_text = str(self.browser.handle_mcp_response(probe)).strip().lower()
+                single_page = probe_text == "false"
+            except Exception:
+                pass  # best-effort; fall through to the full walk
+
+            if single_page:
+                self.log("No pagination bar found; treating as single-page post")
+
             # Loop to handle multi-page posts
             while True:
                 self.log(f"Parsing page {current_page} of post...")
@@ -580,6 +601,9 @@ class OnePoint3AcresWorkflow(BaseWorkflow):
                 parsed_data = parse_result.data
                 all_pages_data.append(parsed_data)
 
+                if single_page:
+                    break
+
                 # Check pagination info
                 pagination = parsed_data.get("pagination", {})
                 has_next_page = pagination.get("has_next_page", False)
@@ -828,8 +852,9 @@ def scrape_1point3acres(
     num_pages: int = 1,
     posts_per_page: Optional[int] = 3,
     speed: str = "normal",
-    output_dir: Optional[str] = None,
-    verbose: bool = True
+    output_dir: Optional[Union[str, Path]] = None,
+    verbose: bool = True,
+    browser: Optional[BrowserIntegration] = None
 ) -> WorkflowResult:
     """
     Convenience function to scrape 1point3acres forum.
@@ -841,6 +866,8 @@ def scrape_1point3acres(
         speed: Speed profile ("fast", "normal", "slow", "cautious")
         output_dir: Output directory
         verbose: Print progress
+        browser: Existing BrowserIntegration to reuse across calls;
+            avoids paying browser launch/attach latency per call
 
     Returns:
         WorkflowResult with execution details
@@ -871,7 +898,8 @@ def scrape_1point3acres(
     workflow = OnePoint3AcresWorkflow(
         config=config,
         output_dir=output_dir,
-        verbose=verbose
+        verbose=verbose,
+        browser=browser
     )
 
     return workflow.run()